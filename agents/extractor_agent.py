@@ -9,10 +9,14 @@ from typing import Dict, List, Optional, Any
 from graph.memory import GraphMemory
 from llm.llama_client import LLMClient
 from llm.prompts import PromptTemplates
+from llm.schemas import JobExtract
 from agents.base_agent import BaseAgent
 
 logger = logging.getLogger(__name__)
 
+# Constrains extraction output so responses always parse on the first pass
+JOB_INFO_SCHEMA = JobExtract.model_json_schema()
+
 
 class ExtractorAgent(BaseAgent):
     """Agent responsible for extracting structured information from job descriptions."""
@@ -52,7 +56,7 @@ class ExtractorAgent(BaseAgent):
         # Extract information using LLM
         try:
             prompt = PromptTemplates.format_extract_job_info(job_description)
-            response = self.llm_client.generate_json(prompt)
+            response = self.llm_client.generate_json(prompt, schema=JOB_INFO_SCHEMA)
 
             if "error" in response:
                 logger.error(f"LLM extraction error: {response.get('error')}")
@@ -68,6 +72,69 @@ class ExtractorAgent(BaseAgent):
             logger.error(f"Error extracting job info: {e}")
             return None
 
+    def extract_batch(
+        self, job_ids: List[str], max_concurrency: int = 8
+    ) -> Dict[str, Dict[str, Any]]:
+        """Extract structured information for several jobs with one batched LLM call.
+
+        Args:
+            job_ids: Job identifiers
+            max_concurrency: Maximum LLM requests in flight for clients that
+                batch by sending concurrent requests
+
+        Returns:
+            Extracted information keyed by job ID; jobs that fail are omitted
+        """
+        jobs = self.graph_memory.get_jobs_bulk(job_ids)
+
+        pending = []
+        for job_id in job_ids:
+            job = jobs.get(job_id)
+            if not job:
+                logger.warning(f"Job not found: {job_id}")
+                continue
+
+            job_description = job.get("description", "")
+            if not job_description:
+                logger.warning(f"Job description not available for: {job_id}")
+                continue
+
+            pending.append((job.get("company_name") or "", job_id, job_description))
+
+        # Postings from the same company tend to share boilerplate, so sending
+        # them back to back lets the server's prefix cache cover more tokens
+        pending.sort(key=lambda item: item[0])
+        prompt_job_ids = [job_id for _, job_id, _ in pending]
+        prompts = [
+            PromptTemplates.format_extract_job_info(job_description)
+            for _, _, job_description in pending
+        ]
+
+        if not prompts:
+            return {}
+
+        try:
+            responses = self.llm_client.generate_json_batch(
+                prompts, max_concurrency=max_concurrency, schema=JOB_INFO_SCHEMA
+            )
+        except Exception as e:
+            logger.error(f"Error extracting job info batch: {e}")
+            return {}
+
+        results = {}
+        for job_id, response in zip(prompt_job_ids, responses):
+            if "error" in response:
+                logger.error(f"LLM extraction error: {response.get('error')}")
+                continue
+
+            try:
+                results[job_id] = self._process_extracted_data(job_id, response)
+                logger.info(f"Extracted information for job: {job_id}")
+            except Exception as e:
+                logger.error(f"Error extracting job info: {e}")
+
+        return results
+
     def _process_extracted_data(
         self, job_id: str, extracted: Dict[str, Any]
     ) -> Dict[str, Any]:
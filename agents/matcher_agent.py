@@ -3,6 +3,7 @@ Matcher Agent: Scores job-candidate fit using LLM-based analysis.
 This agent runs AFTER Scout has collected jobs and scores each one.
 """
 
+import hashlib
 import logging
 import json
 from typing import Dict, List, Optional, Any, Tuple
@@ -88,16 +89,24 @@ class MatcherAgent(BaseAgent):
 
         # Get jobs to score
         if job_ids:
-            jobs = []
-            for job_id in job_ids:
-                job = self.graph_memory.get_job(job_id)
-                if job:
-                    jobs.append(job)
+            jobs_by_id = self.graph_memory.get_jobs_bulk(job_ids)
+            jobs = [jobs_by_id[job_id] for job_id in job_ids if job_id in jobs_by_id]
         else:
             # Get all unscored jobs
             jobs = self._get_unscored_jobs(user_id)
 
-        if not jobs:
+        # Scores stored against an identical profile are still valid
+        profile_hash = self._profile_hash(profile)
+        cached_scores = self._get_cached_scores(
+            user_id, [job.get("job_id") for job in jobs], profile_hash
+        )
+        if cached_scores:
+            logger.info(
+                f"[MatcherAgent] Reusing {len(cached_scores)} cached scores for user {user_id}"
+            )
+            jobs = [job for job in jobs if job.get("job_id") not in cached_scores]
+
+        if not jobs and not cached_scores:
             logger.info("[MatcherAgent] No jobs to score")
             self.update_status("idle")
             return {"message": "No jobs to score", "scored": 0}
@@ -107,7 +116,7 @@ class MatcherAgent(BaseAgent):
         # Score jobs in batches
         scored_count = 0
         failed_count = 0
-        scores = []
+        scores = list(cached_scores.values())
 
         for i in range(0, len(jobs), batch_size):
             batch = jobs[i : i + batch_size]
@@ -133,6 +142,7 @@ class MatcherAgent(BaseAgent):
                             reason=result.get("reason", ""),
                             strengths=result.get("strengths", []),
                             concerns=result.get("concerns", []),
+                            profile_hash=profile_hash,
                         )
 
                         scored_count += 1
@@ -162,8 +172,9 @@ class MatcherAgent(BaseAgent):
         avg_score = sum(scores) / len(scores) if scores else 0
 
         result = {
-            "total_jobs": len(jobs),
+            "total_jobs": len(jobs) + len(cached_scores),
             "scored": scored_count,
+            "cached": len(cached_scores),
             "failed": failed_count,
             "average_score": avg_score,
             "score_range": {
@@ -373,6 +384,56 @@ JSON Response:"""
             # Fallback: get all jobs
             return self.graph_memory.search_jobs(limit=100)
 
+    @staticmethod
+    def _profile_hash(profile: Dict[str, Any]) -> str:
+        """
+        Hash a user profile so stored scores can be matched to the profile they used.
+
+        Args:
+            profile: User profile dictionary
+
+        Returns:
+            Hex digest of the serialized profile
+        """
+        serialized = json.dumps(profile, sort_keys=True, default=str)
+        return hashlib.blake2b(serialized.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _get_cached_scores(
+        self, user_id: str, job_ids: List[str], profile_hash: str
+    ) -> Dict[str, float]:
+        """
+        Get stored match scores that were computed for the current profile.
+
+        Args:
+            user_id: User identifier
+            job_ids: Job identifiers to look up
+            profile_hash: Hash of the current user profile
+
+        Returns:
+            Match scores keyed by job ID
+        """
+        job_ids = [job_id for job_id in job_ids if job_id]
+        if not job_ids:
+            return {}
+
+        query = """
+        MATCH (u:User {user_id: $user_id})-[m:MATCHES]->(j:Job)
+        WHERE j.job_id IN $job_ids
+          AND m.profile_hash = $profile_hash
+          AND m.match_score IS NOT NULL
+        RETURN j.job_id as job_id, m.match_score as match_score
+        """
+
+        try:
+            results = self.graph_memory.query(
+                query,
+                {"user_id": user_id, "job_ids": job_ids, "profile_hash": profile_hash},
+            )
+            return {record["job_id"]: record["match_score"] for record in results}
+        except Exception as e:
+            logger.error(f"[MatcherAgent] Error fetching cached scores: {e}")
+            return {}
+
     def _store_match_score(
         self,
         user_id: str,
@@ -381,6 +442,7 @@ JSON Response:"""
         reason: str,
         strengths: List[str],
         concerns: List[str],
+        profile_hash: Optional[str] = None,
     ):
         """
         Store match score and details in database.
@@ -392,6 +454,7 @@ JSON Response:"""
             reason: Explanation of score
             strengths: List of match strengths
             concerns: List of match concerns
+            profile_hash: Hash of the profile the score was computed from
         """
         query = """
         MATCH (u:User {user_id: $user_id})
@@ -401,6 +464,7 @@ JSON Response:"""
             m.match_reason = $reason,
             m.strengths = $strengths,
             m.concerns = $concerns,
+            m.profile_hash = $profile_hash,
             m.scored_at = datetime()
         """
 
@@ -413,11 +477,16 @@ JSON Response:"""
                 "reason": reason,
                 "strengths": strengths,
                 "concerns": concerns,
+                "profile_hash": profile_hash,
             },
         )
 
     def get_ranked_jobs(
-        self, user_id: str, limit: int = 20, min_score: float = 0
+        self,
+        user_id: str,
+        limit: int = 20,
+        min_score: float = 0,
+        job_ids: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Get ranked jobs for a user based on match scores.
@@ -426,13 +495,15 @@ JSON Response:"""
             user_id: User identifier
             limit: Maximum number of jobs to return
             min_score: Minimum match score threshold
+            job_ids: Optional job IDs to restrict the ranking to
 
         Returns:
             List of jobs ranked by match score (descending)
         """
         query = """
-        MATCH (u:User {user_id: $user_id})-[m:MATCHED]->(j:Job)
+        MATCH (u:User {user_id: $user_id})-[m:MATCHES]->(j:Job)
         WHERE m.match_score >= $min_score
+          AND ($job_ids IS NULL OR j.job_id IN $job_ids)
         OPTIONAL MATCH (j)-[:POSTED_BY]->(c:Company)
         RETURN j, m, c
         ORDER BY m.match_score DESC
@@ -440,7 +511,13 @@ JSON Response:"""
         """
 
         results = self.graph_memory.query(
-            query, {"user_id": user_id, "min_score": min_score, "limit": limit}
+            query,
+            {
+                "user_id": user_id,
+                "min_score": min_score,
+                "limit": limit,
+                "job_ids": job_ids,
+            },
         )
 
         ranked_jobs = []
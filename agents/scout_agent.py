@@ -2,8 +2,10 @@
 Scout Agent: Retrieves job listings from open APIs.
 """
 
+import csv
 import logging
 import requests
+from pathlib import Path
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 import hashlib
@@ -385,6 +387,104 @@ class ScoutAgent(BaseAgent):
         logger.info(f"Stored {len(stored_ids)} jobs in graph database")
         return stored_ids
 
+    def dump_jobs_csv(
+        self, jobs: List[Dict[str, Any]], output_dir: str
+    ) -> Dict[str, str]:
+        """Serialize jobs to CSV files for ``neo4j-admin database import``.
+
+        Used to seed an empty database in one pass instead of paying the
+        per-row transaction cost of ``store_jobs``. Writes ``jobs.csv``,
+        ``companies.csv`` and ``relationships.csv`` (POSTED_BY edges) using
+        the neo4j-admin header format.
+
+        Args:
+            jobs: List of normalized job dictionaries
+            output_dir: Directory to write the CSV files to
+
+        Returns:
+            Dictionary with file paths: {"jobs", "companies", "relationships"}
+        """
+        out = Path(output_dir)
+        out.mkdir(parents=True, exist_ok=True)
+
+        paths = {
+            "jobs": str(out / "jobs.csv"),
+            "companies": str(out / "companies.csv"),
+            "relationships": str(out / "relationships.csv"),
+        }
+
+        job_header = [
+            "job_id:ID(Job)",
+            "title",
+            "description",
+            "location",
+            "salary_min:float",
+            "salary_max:float",
+            "employment_type",
+            "posted_date",
+            "url",
+            "source",
+            "company_id",
+            "company_name",
+            "qualifications:string[]",
+            "responsibilities:string[]",
+            ":LABEL",
+        ]
+
+        seen_jobs = set()
+        companies = {}
+
+        with open(paths["jobs"], "w", newline="", encoding="utf-8") as jobs_file, open(
+            paths["relationships"], "w", newline="", encoding="utf-8"
+        ) as rels_file:
+            job_writer = csv.writer(jobs_file)
+            rel_writer = csv.writer(rels_file)
+            job_writer.writerow(job_header)
+            rel_writer.writerow([":START_ID(Job)", ":END_ID(Company)", ":TYPE"])
+
+            for job in jobs:
+                job_id = job.get("job_id")
+                if not job_id or job_id in seen_jobs:
+                    continue
+                seen_jobs.add(job_id)
+
+                job_writer.writerow(
+                    [
+                        job_id,
+                        job.get("title", ""),
+                        job.get("description", ""),
+                        job.get("location", ""),
+                        job.get("salary_min"),
+                        job.get("salary_max"),
+                        job.get("employment_type", ""),
+                        job.get("posted_date", ""),
+                        job.get("url", ""),
+                        job.get("source", ""),
+                        job.get("company_id"),
+                        job.get("company_name", ""),
+                        ";".join(job.get("qualifications") or []),
+                        ";".join(job.get("responsibilities") or []),
+                        NodeType.JOB,
+                    ]
+                )
+
+                if job.get("company_id") and job.get("company_name"):
+                    companies.setdefault(job["company_id"], job["company_name"])
+                    rel_writer.writerow(
+                        [job_id, job["company_id"], RelationshipType.POSTED_BY]
+                    )
+
+        with open(paths["companies"], "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["company_id:ID(Company)", "name", ":LABEL"])
+            for company_id, name in companies.items():
+                writer.writerow([company_id, name, NodeType.COMPANY])
+
+        logger.info(
+            f"Dumped {len(seen_jobs)} jobs and {len(companies)} companies to {out}"
+        )
+        return paths
+
     def run(
         self,
         keywords: str,
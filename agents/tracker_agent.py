@@ -3,7 +3,7 @@ Tracker Agent: Tracks application status and maintains application history.
 """
 
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 
 from graph.memory import GraphMemory, ApplicationStatus
@@ -69,6 +69,54 @@ class TrackerAgent(BaseAgent):
             logger.error(f"Error creating application: {e}")
             return None
 
+    def create_applications_bulk(
+        self,
+        user_id: str,
+        jobs: List[Tuple[str, Optional[float]]],
+        initial_status: ApplicationStatus = ApplicationStatus.PENDING,
+    ) -> Dict[str, str]:
+        """Create application records for several jobs with one database write.
+
+        Args:
+            user_id: User identifier
+            jobs: (job_id, match_score) pairs; match_score may be None
+            initial_status: Initial application status
+
+        Returns:
+            Application IDs keyed by job ID for the applications created
+        """
+        try:
+            now = datetime.now()
+            timestamp = now.isoformat()
+            applications = []
+            for job_id, match_score in jobs:
+                application_data = {
+                    "application_id": f"app_{user_id}_{job_id}_{int(now.timestamp())}",
+                    "job_id": job_id,
+                    "status": initial_status.value,
+                    "applied_date": timestamp,
+                    "updated_date": timestamp,
+                }
+                if match_score is not None:
+                    application_data["match_score"] = match_score
+                applications.append(application_data)
+
+            created_ids = set(
+                self.graph_memory.create_applications_bulk(user_id, applications)
+            )
+
+            created = {
+                app["job_id"]: app["application_id"]
+                for app in applications
+                if app["application_id"] in created_ids
+            }
+            logger.info(f"Created {len(created)} applications for user {user_id}")
+            return created
+
+        except Exception as e:
+            logger.error(f"Error creating applications: {e}")
+            return {}
+
     def update_application_status(
         self, application_id: str, status: ApplicationStatus
     ) -> bool:
@@ -202,7 +250,9 @@ class TrackerAgent(BaseAgent):
         """Handle application tracking request from another agent.
 
         Args:
-            payload: Request with action ('create', 'update', 'get_status', 'get_statistics')
+            payload: Request with action ('create', 'create_bulk', 'update',
+                'get_status', 'get_statistics'); 'create_bulk' takes a 'jobs'
+                list of {'job_id', 'match_score'} dicts
 
         Returns:
             Response with tracking data
@@ -217,6 +267,14 @@ class TrackerAgent(BaseAgent):
                 app_id = self.create_application(user_id, job_id, match_score)
                 return {"status": "success", "application_id": app_id}
 
+            elif action == "create_bulk":
+                jobs = [
+                    (job["job_id"], job.get("match_score"))
+                    for job in payload.get("jobs", [])
+                ]
+                created = self.create_applications_bulk(user_id, jobs)
+                return {"status": "success", "application_ids": created}
+
             elif action == "update":
                 app_id = payload.get("application_id")
                 new_status = ApplicationStatus(payload.get("new_status", "pending"))
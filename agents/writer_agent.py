@@ -2,10 +2,14 @@
 Writer Agent: Generates personalized resumes and cover letters.
 """
 
+import hashlib
 import logging
 import json
+import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 from datetime import datetime
 
 from graph.memory import GraphMemory
@@ -15,8 +19,17 @@ from llm.llm_client import LLMClient
 from llm.prompts import PromptTemplates
 from agents.base_agent import BaseAgent
 
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
 logger = logging.getLogger(__name__)
 
+# Generated documents kept in memory, keyed by a hash of the full prompt
+DOCUMENT_CACHE_SIZE = 512
+DEFAULT_DOCUMENT_CACHE_DIR = "~/.cache/jobapp/docs"
+
 
 class WriterAgent(BaseAgent):
     """Agent responsible for generating personalized documents."""
@@ -42,6 +55,18 @@ class WriterAgent(BaseAgent):
         llm_config = config.get_llm_config()
         self.llm_client = LLMClient(llm_config)
 
+        # Prompts embed the profile, resume, job and match insights, so a
+        # prompt hash changes whenever any input does and needs no invalidation
+        self._cache: "OrderedDict[str, Any]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._disk_cache = None
+        if diskcache is not None:
+            try:
+                cache_dir = config.get("writer.cache_dir", DEFAULT_DOCUMENT_CACHE_DIR)
+                self._disk_cache = diskcache.Cache(os.path.expanduser(cache_dir))
+            except Exception as e:
+                logger.warning(f"[WriterAgent] Document disk cache unavailable: {e}")
+
         logger.info(
             f"[WriterAgent] Initialized with {llm_config.get('provider')} LLM: {llm_config.get('model_name')}"
         )
@@ -93,13 +118,81 @@ class WriterAgent(BaseAgent):
             logger.info(
                 f"[WriterAgent] Generating cover letter for user {user_id} and job {job_id}"
             )
-            cover_letter = self.llm_client.generate(prompt)
+            cover_letter = self._generate_cached(prompt)
             logger.info(f"[WriterAgent] Successfully generated cover letter")
             return cover_letter.strip()
         except Exception as e:
             logger.error(f"[WriterAgent] Error generating cover letter: {e}")
             return None
 
+    def stream_cover_letter(
+        self,
+        user_id: str,
+        job_id: str,
+        match_insights: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[str]:
+        """Generate a personalized cover letter, yielding text as it is produced.
+
+        Args:
+            user_id: User identifier
+            job_id: Job identifier
+            match_insights: Optional match insights from MatcherAgent
+
+        Yields:
+            Cover letter text chunks; a cached letter is yielded whole
+
+        Raises:
+            requests.exceptions.RequestException: If the stream drops part
+                way through; the partial letter is not cached
+            ValueError: If the LLM sends a malformed chunk
+        """
+        user_data = self.user_profile.get_profile(user_id)
+        if not user_data:
+            logger.warning(f"[WriterAgent] User profile not found: {user_id}")
+            return
+
+        resume_text = self.user_profile.get_resume(user_id) or ""
+
+        job = self.graph_memory.get_job(job_id)
+        if not job:
+            logger.warning(f"[WriterAgent] Job not found: {job_id}")
+            return
+
+        if not match_insights:
+            match_insights = self._get_match_insights(user_id, job_id)
+
+        prompt = self._build_cover_letter_prompt(
+            user_data=user_data,
+            resume_text=resume_text,
+            job=job,
+            match_insights=match_insights,
+        )
+
+        key = self._cache_key(prompt)
+        cached = self._cache_get(key)
+        if cached is not None:
+            yield cached.strip()
+            return
+
+        logger.info(
+            f"[WriterAgent] Streaming cover letter for user {user_id} and job {job_id}"
+        )
+        chunks = []
+        # generate_stream raises on a dropped or malformed stream, so only a
+        # complete letter reaches the cache below
+        for chunk in self.llm_client.generate_stream(prompt):
+            # Leading whitespace is dropped to match generate_cover_letter
+            if not chunks:
+                chunk = chunk.lstrip()
+                if not chunk:
+                    continue
+            chunks.append(chunk)
+            yield chunk
+
+        if chunks:
+            self._cache_put(key, "".join(chunks))
+            logger.info(f"[WriterAgent] Successfully streamed cover letter")
+
     def generate_tailored_resume(
         self,
         user_id: str,
@@ -150,13 +243,157 @@ class WriterAgent(BaseAgent):
             logger.info(
                 f"[WriterAgent] Generating tailored resume for user {user_id} and job {job_id}"
             )
-            tailored_resume = self.llm_client.generate(prompt)
+            tailored_resume = self._generate_cached(prompt)
             logger.info(f"[WriterAgent] Successfully generated tailored resume")
             return tailored_resume.strip()
         except Exception as e:
             logger.error(f"[WriterAgent] Error generating tailored resume: {e}")
             return None
 
+    def generate_resume_summary(
+        self,
+        user_id: str,
+        job_id: str,
+    ) -> Optional[str]:
+        """Generate a short professional summary tailored to a job.
+
+        Args:
+            user_id: User identifier
+            job_id: Job identifier
+
+        Returns:
+            Generated 2-3 sentence summary or None if generation fails
+        """
+        user_data = self.user_profile.get_profile(user_id)
+        if not user_data:
+            logger.warning(f"[WriterAgent] User profile not found: {user_id}")
+            return None
+
+        job = self.graph_memory.get_job(job_id)
+        if not job:
+            logger.warning(f"[WriterAgent] Job not found: {job_id}")
+            return None
+
+        resume_text = self.user_profile.get_resume(user_id) or ""
+        user_skills = [
+            skill.get("name", "") for skill in self.user_profile.get_skills(user_id)
+        ]
+
+        prompt = PromptTemplates.format_resume_summary(
+            job_title=job.get("title", "N/A"),
+            job_description=(job.get("description") or "N/A")[:1000],
+            required_skills=job.get("required_skills", []),
+            user_skills=user_skills,
+            user_experience=resume_text[:1000] or "N/A",
+            years_experience=user_data.get("experience_years", 0),
+        )
+
+        try:
+            logger.info(
+                f"[WriterAgent] Generating resume summary for user {user_id} and job {job_id}"
+            )
+            resume_summary = self._generate_cached(prompt)
+            logger.info(f"[WriterAgent] Successfully generated resume summary")
+            return resume_summary.strip()
+        except Exception as e:
+            logger.error(f"[WriterAgent] Error generating resume summary: {e}")
+            return None
+
+    def generate_all_documents(
+        self,
+        user_id: str,
+        job_id: str,
+        match_insights: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, str]:
+        """Generate the cover letter, resume summary and tailored resume in one LLM call.
+
+        All three documents share the same profile, resume and job context,
+        so they are requested together as one JSON object. Any document
+        missing from the combined response is generated with its dedicated
+        method.
+
+        Args:
+            user_id: User identifier
+            job_id: Job identifier
+            match_insights: Optional match insights from MatcherAgent
+
+        Returns:
+            Dictionary with "cover_letter", "resume_summary" and/or "resume" text
+        """
+        user_data = self.user_profile.get_profile(user_id)
+        if not user_data:
+            logger.warning(f"[WriterAgent] User profile not found: {user_id}")
+            return {}
+
+        job = self.graph_memory.get_job(job_id)
+        if not job:
+            logger.warning(f"[WriterAgent] Job not found: {job_id}")
+            return {}
+
+        if not match_insights:
+            match_insights = self._get_match_insights(user_id, job_id)
+
+        resume_text = self.user_profile.get_resume(user_id)
+        if not resume_text:
+            # Nothing to tailor, so only the profile-based documents are written
+            logger.warning(f"[WriterAgent] No resume found for user {user_id}")
+            documents = {
+                "cover_letter": self.generate_cover_letter(
+                    user_id, job_id, match_insights
+                ),
+                "resume_summary": self.generate_resume_summary(user_id, job_id),
+            }
+            return {key: value for key, value in documents.items() if value}
+
+        prompt = self._build_documents_prompt(
+            user_data=user_data,
+            resume_text=resume_text,
+            job=job,
+            match_insights=match_insights,
+        )
+
+        try:
+            logger.info(
+                f"[WriterAgent] Generating application documents for user {user_id} and job {job_id}"
+            )
+            response = self._generate_cached(prompt, as_json=True)
+        except Exception as e:
+            logger.error(f"[WriterAgent] Error generating application documents: {e}")
+            response = {}
+
+        documents = {}
+        for key in ("cover_letter", "resume_summary", "resume"):
+            value = response.get(key)
+            if isinstance(value, str) and value.strip():
+                documents[key] = value.strip()
+
+        if "cover_letter" not in documents:
+            logger.warning(
+                "[WriterAgent] Combined response missing cover letter, generating separately"
+            )
+            cover_letter = self.generate_cover_letter(user_id, job_id, match_insights)
+            if cover_letter:
+                documents["cover_letter"] = cover_letter
+
+        if "resume_summary" not in documents:
+            logger.warning(
+                "[WriterAgent] Combined response missing resume summary, generating separately"
+            )
+            resume_summary = self.generate_resume_summary(user_id, job_id)
+            if resume_summary:
+                documents["resume_summary"] = resume_summary
+
+        if "resume" not in documents:
+            logger.warning(
+                "[WriterAgent] Combined response missing resume, generating separately"
+            )
+            resume = self.generate_tailored_resume(user_id, job_id, match_insights)
+            if resume:
+                documents["resume"] = resume
+
+        logger.info(f"[WriterAgent] Generated {len(documents)} documents")
+        return documents
+
     def export_to_text(
         self, user_id: str, job_id: str, output_dir: str = "outputs"
     ) -> Dict[str, str]:
@@ -319,6 +556,71 @@ class WriterAgent(BaseAgent):
 
         return files
 
+    def _generate_cached(self, prompt: str, as_json: bool = False) -> Any:
+        """Generate an LLM response, reusing earlier output for identical prompts.
+
+        Responses are looked up in an in-memory LRU first and then in the
+        optional disk cache, so repeated workflow runs skip the LLM entirely.
+
+        Args:
+            prompt: Fully rendered prompt
+            as_json: Whether to request a parsed JSON response
+
+        Returns:
+            Generated text, or parsed JSON when as_json is set
+        """
+        key = self._cache_key(prompt, as_json)
+        response = self._cache_get(key)
+        if response is not None:
+            return response
+
+        if as_json:
+            response = self.llm_client.generate_json(prompt)
+            # Incomplete answers are retried on the next run
+            if "error" in response:
+                return response
+        else:
+            response = self.llm_client.generate(prompt)
+
+        self._cache_put(key, response)
+        return response
+
+    @staticmethod
+    def _cache_key(prompt: str, as_json: bool = False) -> str:
+        """Build the document cache key for a rendered prompt."""
+        kind = "json" if as_json else "text"
+        return f"{kind}:{hashlib.blake2b(prompt.encode('utf-8')).hexdigest()}"
+
+    def _cache_get(self, key: str) -> Any:
+        """Look up a cached response in memory, then on disk.
+
+        Returns:
+            Cached response or None on a miss
+        """
+        with self._cache_lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                logger.debug(f"[WriterAgent] Document cache hit: {key}")
+                return self._cache[key]
+
+        if self._disk_cache is None:
+            return None
+
+        response = self._disk_cache.get(key)
+        if response is not None:
+            self._cache_put(key, response, persist=False)
+        return response
+
+    def _cache_put(self, key: str, response: Any, persist: bool = True):
+        """Store a response in the memory LRU and, optionally, on disk."""
+        if persist and self._disk_cache is not None:
+            self._disk_cache.set(key, response)
+
+        with self._cache_lock:
+            self._cache[key] = response
+            if len(self._cache) > DOCUMENT_CACHE_SIZE:
+                self._cache.popitem(last=False)
+
     def _get_match_insights(self, user_id: str, job_id: str) -> Dict[str, Any]:
         """Get match insights from database.
 
@@ -376,17 +678,17 @@ class WriterAgent(BaseAgent):
 
         prompt = f"""You are an expert cover letter writer. Generate a compelling, personalized cover letter for the following job application.
 
-JOB INFORMATION:
-- Title: {job.get('title', 'N/A')}
-- Company: {job.get('company_name', 'N/A')}
-- Description: {job.get('description', 'N/A')[:1000]}...
-
 CANDIDATE INFORMATION:
 - Name: {user_data.get('name', 'Candidate')}
 - Education: {user_data.get('education_level', 'N/A')}
 - Experience: {user_data.get('experience_years', 0)} years
 - Resume Preview: {resume_preview}
 
+JOB INFORMATION:
+- Title: {job.get('title', 'N/A')}
+- Company: {job.get('company_name', 'N/A')}
+- Description: {job.get('description', 'N/A')[:1000]}...
+
 MATCH ANALYSIS (Score: {match_insights.get('score', 0)}/100):
 - Strengths: {', '.join(match_insights.get('strengths', [])[:3])}
 - Areas to Address: {', '.join(match_insights.get('concerns', [])[:2])}
@@ -467,6 +769,72 @@ FORMAT:
 - Use action verbs
 
 Return ONLY the tailored resume text, ready to use. No explanations or meta-commentary.
+"""
+
+        return prompt
+
+    def _build_documents_prompt(
+        self,
+        user_data: Dict[str, Any],
+        resume_text: str,
+        job: Dict[str, Any],
+        match_insights: Dict[str, Any],
+    ) -> str:
+        """Build a single prompt producing the cover letter, resume summary and resume.
+
+        Args:
+            user_data: User profile data
+            resume_text: User's original resume text
+            job: Job information
+            match_insights: Match insights from MatcherAgent
+
+        Returns:
+            Formatted prompt requesting a JSON object with all three documents
+        """
+        prompt = f"""You are an expert career writer. Write a tailored resume, a resume summary and a cover letter for the following job application.
+
+CANDIDATE INFORMATION:
+- Name: {user_data.get('name', 'Candidate')}
+- Education: {user_data.get('education_level', 'N/A')}
+- Experience: {user_data.get('experience_years', 0)} years
+
+ORIGINAL RESUME:
+{resume_text[:2500]}
+
+JOB INFORMATION:
+- Title: {job.get('title', 'N/A')}
+- Company: {job.get('company_name', 'N/A')}
+- Description: {job.get('description', 'N/A')[:1000]}...
+- Key Qualifications: {job.get('qualifications', 'N/A')[:500]}
+
+MATCH ANALYSIS (Score: {match_insights.get('score', 0)}/100):
+- Key Strengths: {', '.join(match_insights.get('strengths', [])[:3])}
+- Gaps to Address: {', '.join(match_insights.get('concerns', [])[:2])}
+- Match Reason: {match_insights.get('reason', 'N/A')[:200]}
+
+RESUME INSTRUCTIONS:
+1. Rewrite the resume to be highly tailored for THIS specific job
+2. Emphasize skills and experiences that match the job requirements
+3. Reorder bullet points to highlight relevant achievements first
+4. Use keywords from the job description naturally
+5. Address skill gaps by highlighting transferable skills
+6. Keep the same truthful information - DO NOT fabricate experience
+7. Use clear section headers (SUMMARY, EXPERIENCE, EDUCATION, SKILLS) and bullet points
+
+RESUME SUMMARY INSTRUCTIONS:
+1. Write a 2-3 sentence professional summary of the candidate's most relevant qualifications for this position
+2. Focus on skills and experience that match the job requirements
+3. Plain text only, no headings or bullet points
+
+COVER LETTER INSTRUCTIONS:
+1. Write a professional, enthusiastic cover letter (3-4 paragraphs)
+2. Highlight the candidate's STRENGTHS that align with the job
+3. Address any CONCERNS by emphasizing transferable skills or willingness to learn
+4. Show genuine interest in the company and role, with a strong closing
+5. No placeholders like [Your Name] or [Date], no salary expectations
+
+Return ONLY a JSON object with exactly these keys, each holding the finished document as plain text:
+{{"resume": "...", "resume_summary": "...", "cover_letter": "..."}}
 """
 
         return prompt
@@ -4,14 +4,38 @@ Agent Communication System - Message-based inter-agent communication.
 
 import asyncio
 import logging
-from typing import Dict, Any, Optional, Callable
+import secrets
+from collections import Counter, deque
+from itertools import islice
+from typing import Dict, Any, List, Optional, Callable
 from datetime import datetime
 from enum import Enum
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+
+import orjson
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    from celery import Celery
+except ImportError:
+    Celery = None
 
 logger = logging.getLogger(__name__)
 
 
+def new_correlation_id() -> str:
+    """Generate a short random ID for tracking related messages.
+
+    Returns:
+        16-character URL-safe token (96 random bits)
+    """
+    return secrets.token_urlsafe(12)
+
+
 class MessageType(Enum):
     """Types of messages agents can exchange."""
 
@@ -24,7 +48,7 @@ class MessageType(Enum):
     NOTIFICATION = "notification"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentMessage:
     """Standardized message format for agent-to-agent communication."""
 
@@ -40,9 +64,8 @@ class AgentMessage:
     def __post_init__(self):
         """Generate correlation_id if needed."""
         if self.requires_response and self.correlation_id is None:
-            import uuid
-
-            self.correlation_id = str(uuid.uuid4())
+            # Frozen dataclass: bypass __setattr__ during initialization
+            object.__setattr__(self, "correlation_id", new_correlation_id())
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert message to dictionary."""
@@ -71,6 +94,40 @@ class AgentMessage:
             metadata=data.get("metadata", {}),
         )
 
+    def to_bytes(self) -> bytes:
+        """Serialize message to JSON bytes for transport.
+
+        orjson encodes the dataclass, the MessageType value and the datetime
+        natively, skipping the intermediate dict built by to_dict().
+        """
+        return orjson.dumps(self, default=str)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "AgentMessage":
+        """Create message from JSON bytes produced by to_bytes()."""
+        return cls.from_dict(orjson.loads(data))
+
+    def to_msgpack(self) -> bytes:
+        """Serialize message to MessagePack for the inter-agent wire format.
+
+        More compact than JSON for cross-process delivery; MessageType is
+        packed as its lowercase value, same as to_dict().
+        """
+        if msgpack is None:
+            raise ImportError(
+                "msgpack not installed. Install with: pip install msgpack"
+            )
+        return msgpack.packb(self.to_dict(), use_bin_type=True, default=str)
+
+    @classmethod
+    def from_msgpack(cls, data: bytes) -> "AgentMessage":
+        """Create message from MessagePack bytes produced by to_msgpack()."""
+        if msgpack is None:
+            raise ImportError(
+                "msgpack not installed. Install with: pip install msgpack"
+            )
+        return cls.from_dict(msgpack.unpackb(data, raw=False))
+
 
 class AgentCommunicationBus:
     """Message bus for routing messages between agents."""
@@ -80,8 +137,14 @@ class AgentCommunicationBus:
         self.agent_registry: Dict[str, Any] = {}
         self.message_queue: asyncio.Queue = asyncio.Queue()
         self.message_handlers: Dict[str, Callable] = {}
-        self.message_history: list = []
         self.max_history = 1000
+        # Bounded ring buffer: oldest messages are evicted in O(1) on append
+        self.message_history: deque = deque(maxlen=self.max_history)
+        # Per-agent inboxes drained by one delivery worker each. Items are
+        # (message, future) pairs; the future, when set, receives the
+        # handler's result for the sender awaiting that one delivery.
+        self._inboxes: Dict[str, asyncio.Queue] = {}
+        self._workers: Dict[str, asyncio.Task] = {}
         self._running = False
 
         logger.info("[CommunicationBus] Initialized")
@@ -99,6 +162,8 @@ class AgentCommunicationBus:
             )
 
         self.agent_registry[agent_name] = agent
+        if agent_name not in self._inboxes:
+            self._inboxes[agent_name] = asyncio.Queue()
         logger.info(f"[CommunicationBus] Registered agent: {agent_name}")
 
     def unregister_agent(self, agent_name: str):
@@ -109,6 +174,10 @@ class AgentCommunicationBus:
         """
         if agent_name in self.agent_registry:
             del self.agent_registry[agent_name]
+            self._inboxes.pop(agent_name, None)
+            worker = self._workers.pop(agent_name, None)
+            if worker is not None and not worker.done():
+                worker.cancel()
             logger.info(f"[CommunicationBus] Unregistered agent: {agent_name}")
 
     async def send_message(
@@ -130,11 +199,8 @@ class AgentCommunicationBus:
             )
             raise ValueError(f"Agent {message.to_agent} not registered")
 
-        # Log message
-        self._log_message(message)
-
-        # Get target agent
-        target_agent = self.agent_registry[message.to_agent]
+        # Record message
+        self._record_message(message)
 
         logger.info(
             f"[CommunicationBus] Sending {message.message_type.value} "
@@ -145,16 +211,14 @@ class AgentCommunicationBus:
             # Send message to agent
             if message.requires_response:
                 # Wait for response with timeout
-                response = await asyncio.wait_for(
-                    target_agent.handle_message(message), timeout=timeout
-                )
+                response = await self._await_delivery(message, timeout)
                 logger.info(
                     f"[CommunicationBus] Received response from {message.to_agent}"
                 )
                 return response
             else:
                 # Fire and forget
-                asyncio.create_task(target_agent.handle_message(message))
+                self._enqueue(message)
                 return None
 
         except asyncio.TimeoutError:
@@ -169,6 +233,63 @@ class AgentCommunicationBus:
             )
             raise
 
+    async def send_and_wait(
+        self, message: AgentMessage, timeout: Optional[float] = 30.0
+    ) -> Any:
+        """Queue message and wait until the target agent has handled it.
+
+        Unlike fire-and-forget sends, callers don't need to sleep to know the
+        message was delivered.
+
+        Args:
+            message: AgentMessage to send
+            timeout: Timeout in seconds for the handler to finish
+
+        Returns:
+            Return value of the target agent's handle_message
+        """
+        if message.to_agent not in self.agent_registry:
+            logger.error(
+                f"[CommunicationBus] Target agent not found: {message.to_agent}"
+            )
+            raise ValueError(f"Agent {message.to_agent} not registered")
+
+        if not message.requires_response:
+            message = replace(message, requires_response=True)
+
+        self._record_message(message)
+        return await self._await_delivery(message, timeout)
+
+    async def _await_delivery(
+        self, message: AgentMessage, timeout: Optional[float]
+    ) -> Any:
+        """Queue message and await the future resolved by the delivery worker.
+
+        Each delivery carries its own future, so concurrent requests that
+        share a conversation's correlation_id are answered independently.
+
+        An agent's inbox is drained by a single worker, so a handler that
+        awaits a request to its own agent is delivered inline instead of
+        being queued behind itself. Longer cycles (A asks B, whose handler
+        asks A) still block both workers until the timeout; handlers should
+        not make such nested requests.
+
+        Args:
+            message: Message with requires_response set
+            timeout: Timeout in seconds for the handler to finish
+
+        Returns:
+            Return value of the target agent's handle_message
+        """
+        worker = self._workers.get(message.to_agent)
+        if worker is not None and worker is asyncio.current_task():
+            agent = self.agent_registry[message.to_agent]
+            return await asyncio.wait_for(agent.handle_message(message), timeout)
+
+        future = asyncio.get_running_loop().create_future()
+        self._enqueue(message, future)
+        return await asyncio.wait_for(future, timeout=timeout)
+
     async def broadcast(
         self, message: AgentMessage, exclude_sender: bool = True
     ) -> Dict[str, Any]:
@@ -179,21 +300,33 @@ class AgentCommunicationBus:
             exclude_sender: If True, don't send to message.from_agent
 
         Returns:
-            Dictionary mapping agent names to their responses
+            Dictionary mapping agent names to their responses. Empty unless
+            message.requires_response, since other broadcasts are queued
+            without waiting for delivery.
         """
         logger.info(
             f"[CommunicationBus] Broadcasting {message.message_type.value} "
             f"from {message.from_agent}"
         )
 
+        recipients = [
+            agent_name
+            for agent_name in self.agent_registry
+            if not (exclude_sender and agent_name == message.from_agent)
+        ]
+
+        if not message.requires_response:
+            # Fire and forget: fan out without awaiting and yield to the loop
+            # only once; each recipient's copy is addressed to it
+            self._enqueue_many(recipients, message)
+            self._record_message(message)
+            await asyncio.sleep(0)
+            return {}
+
         responses = {}
         tasks = []
 
-        for agent_name, agent in self.agent_registry.items():
-            # Skip sender if requested
-            if exclude_sender and agent_name == message.from_agent:
-                continue
-
+        for agent_name in recipients:
             # Create message copy for each recipient
             agent_message = AgentMessage(
                 from_agent=message.from_agent,
@@ -206,6 +339,7 @@ class AgentCommunicationBus:
             )
 
             # Send to agent
+            agent = self.agent_registry[agent_name]
             task = asyncio.create_task(agent.handle_message(agent_message))
             tasks.append((agent_name, task))
 
@@ -222,17 +356,83 @@ class AgentCommunicationBus:
 
         return responses
 
-    def _log_message(self, message: AgentMessage):
-        """Log message to history.
+    def _enqueue(self, message: AgentMessage, future: Optional[asyncio.Future] = None):
+        """Put message on the recipient's inbox without awaiting delivery.
+
+        Args:
+            message: Message to deliver
+            future: Optional future resolved with the handler's result
+        """
+        self._inboxes[message.to_agent].put_nowait((message, future))
+        self._ensure_worker(message.to_agent)
+
+    def _enqueue_many(self, agent_names: List[str], message: AgentMessage):
+        """Put a message on several inboxes without awaiting.
 
         Args:
-            message: Message to log
+            agent_names: Names of the recipient agents
+            message: Message to deliver; each recipient gets a copy with
+                to_agent set to its own name
         """
-        self.message_history.append(message.to_dict())
+        for agent_name in agent_names:
+            self._inboxes[agent_name].put_nowait(
+                (replace(message, to_agent=agent_name), None)
+            )
+        for agent_name in agent_names:
+            self._ensure_worker(agent_name)
+
+    def _ensure_worker(self, agent_name: str):
+        """Start the delivery worker for an agent if it is not running.
 
-        # Maintain max history size
-        if len(self.message_history) > self.max_history:
-            self.message_history = self.message_history[-self.max_history :]
+        Args:
+            agent_name: Name of the agent whose inbox needs draining
+        """
+        # Workers are started lazily: agents are usually registered before
+        # an event loop is running
+        worker = self._workers.get(agent_name)
+        if (
+            worker is None
+            or worker.done()
+            or worker.get_loop() is not asyncio.get_running_loop()
+        ):
+            self._workers[agent_name] = asyncio.create_task(
+                self._deliver_loop(agent_name)
+            )
+
+    async def _deliver_loop(self, agent_name: str):
+        """Deliver queued messages to an agent one at a time.
+
+        Args:
+            agent_name: Name of the agent whose inbox to drain
+        """
+        inbox = self._inboxes[agent_name]
+
+        while True:
+            message, future = await inbox.get()
+            try:
+                result = None
+                agent = self.agent_registry.get(agent_name)
+                if agent is not None:
+                    result = await agent.handle_message(message)
+                if future is not None and not future.done():
+                    future.set_result(result)
+            except Exception as e:
+                logger.error(
+                    f"[CommunicationBus] Error delivering to {agent_name}: {e}",
+                    exc_info=True,
+                )
+                if future is not None and not future.done():
+                    future.set_exception(e)
+            finally:
+                inbox.task_done()
+
+    def _record_message(self, message: AgentMessage):
+        """Record message in history.
+
+        Args:
+            message: Message to record
+        """
+        self.message_history.append(message)
 
     def get_message_history(
         self, agent_name: Optional[str] = None, limit: int = 100
@@ -244,17 +444,20 @@ class AgentCommunicationBus:
             limit: Maximum number of messages to return
 
         Returns:
-            List of message dictionaries
+            List of AgentMessage instances, oldest first
         """
+        # Scan newest first and stop once limit matches are found
+        newest_first = reversed(self.message_history)
         if agent_name:
-            filtered = [
+            newest_first = (
                 msg
-                for msg in self.message_history
-                if msg["from_agent"] == agent_name or msg["to_agent"] == agent_name
-            ]
-            return filtered[-limit:]
-        else:
-            return self.message_history[-limit:]
+                for msg in newest_first
+                if msg.from_agent == agent_name or msg.to_agent == agent_name
+            )
+
+        history = list(islice(newest_first, limit))
+        history.reverse()
+        return history
 
     def get_agent_stats(self) -> Dict[str, Dict[str, int]]:
         """Get statistics for each agent.
@@ -262,15 +465,15 @@ class AgentCommunicationBus:
         Returns:
             Dictionary mapping agent names to stats (messages sent/received)
         """
+        # Single pass over the history for all agents
+        sent_counts = Counter(msg.from_agent for msg in self.message_history)
+        received_counts = Counter(msg.to_agent for msg in self.message_history)
+
         stats = {}
 
         for agent_name in self.agent_registry.keys():
-            sent = sum(
-                1 for msg in self.message_history if msg["from_agent"] == agent_name
-            )
-            received = sum(
-                1 for msg in self.message_history if msg["to_agent"] == agent_name
-            )
+            sent = sent_counts[agent_name]
+            received = received_counts[agent_name]
 
             stats[agent_name] = {
                 "messages_sent": sent,
@@ -292,3 +495,112 @@ class AgentCommunicationBus:
             List of agent names
         """
         return list(self.agent_registry.keys())
+
+
+class CeleryBus(AgentCommunicationBus):
+    """Message bus that delivers fire-and-forget messages through Celery.
+
+    Messages are serialized with AgentMessage.to_bytes() and handled by a
+    Celery worker, which gets retries and persistence from the broker.
+    Delivery results are stored in the result backend under
+    "<correlation_id>:<agent>", with a fresh ID for messages that have no
+    correlation_id. Messages that require a response are still delivered
+    in-process so the sender can await the reply.
+
+    The worker process must build a CeleryBus with the same agents
+    registered, since the task looks agents up in this bus's registry.
+    """
+
+    def __init__(
+        self,
+        broker_url: str = "redis://localhost:6379/0",
+        backend_url: Optional[str] = None,
+        max_retries: int = 3,
+        app: Optional[Any] = None,
+    ):
+        """Initialize Celery-backed bus.
+
+        Args:
+            broker_url: Celery broker URL
+            backend_url: Result backend URL (defaults to broker_url)
+            max_retries: Delivery attempts before a message is dropped
+            app: Optional existing Celery app to register the task on
+        """
+        if Celery is None:
+            raise ImportError("celery not installed. Install with: pip install celery")
+
+        super().__init__()
+
+        self.app = app or Celery(
+            "agent_bus", broker=broker_url, backend=backend_url or broker_url
+        )
+
+        @self.app.task(bind=True, name="agent_bus.deliver", max_retries=max_retries)
+        def deliver(task, to_agent: str, message_bytes: bytes) -> Any:
+            return self._deliver(task, to_agent, message_bytes)
+
+        self.deliver_task = deliver
+
+        logger.info(f"[CeleryBus] Using broker {self.app.conf.broker_url}")
+
+    def _deliver(self, task: Any, to_agent: str, message_bytes: bytes) -> Any:
+        """Celery task body: hand a serialized message to a registered agent.
+
+        Args:
+            task: Bound Celery task, used for retries
+            to_agent: Name of the recipient agent
+            message_bytes: Message serialized with AgentMessage.to_bytes()
+
+        Returns:
+            Whatever the agent's handle_message returns
+        """
+        agent = self.agent_registry.get(to_agent)
+        if agent is None:
+            raise ValueError(f"Agent {to_agent} not registered")
+
+        message = AgentMessage.from_bytes(message_bytes)
+        try:
+            return asyncio.run(agent.handle_message(message))
+        except Exception as e:
+            logger.warning(
+                f"[CeleryBus] Delivery to {to_agent} failed "
+                f"(attempt {task.request.retries + 1}): {e}"
+            )
+            raise task.retry(exc=e, countdown=2**task.request.retries)
+
+    def _dispatch(self, to_agent: str, message: AgentMessage):
+        """Queue a message for delivery by a Celery worker.
+
+        Args:
+            to_agent: Name of the recipient agent
+            message: Message to deliver
+        """
+        self.deliver_task.apply_async(
+            args=(to_agent, message.to_bytes()),
+            task_id=f"{message.correlation_id or new_correlation_id()}:{to_agent}",
+        )
+
+    def _enqueue(self, message: AgentMessage, future: Optional[asyncio.Future] = None):
+        """Send message to a Celery worker instead of the local inbox.
+
+        Args:
+            message: Message to deliver
+            future: Optional future resolved with the handler's result
+        """
+        if future is not None or message.requires_response:
+            # The sender's future lives in this process, so deliver locally
+            super()._enqueue(message, future)
+            return
+
+        self._dispatch(message.to_agent, message)
+
+    def _enqueue_many(self, agent_names: List[str], message: AgentMessage):
+        """Send a message to several agents through Celery.
+
+        Args:
+            agent_names: Names of the recipient agents
+            message: Message to deliver; each recipient gets a copy with
+                to_agent set to its own name
+        """
+        for agent_name in agent_names:
+            self._dispatch(agent_name, replace(message, to_agent=agent_name))
@@ -87,13 +87,17 @@ class Config:
                 return default
         return value
 
-    def get_neo4j_config(self) -> Dict[str, str]:
+    def get_neo4j_config(self) -> Dict[str, Any]:
         """Get Neo4j configuration."""
         return {
             "uri": self.get("neo4j.uri", "bolt://localhost:7687"),
             "user": self.get("neo4j.user", "neo4j"),
             "password": self.get("neo4j.password", "password"),
             "database": self.get("neo4j.database", "neo4j"),
+            "max_connection_pool_size": self.get("neo4j.max_connection_pool_size", 32),
+            "connection_acquisition_timeout": self.get(
+                "neo4j.connection_acquisition_timeout", 30.0
+            ),
         }
 
     def get_llm_config(self) -> Dict[str, Any]:
@@ -2,13 +2,19 @@
 Conversation State Management - Track context across multiple turns.
 """
 
+import heapq
 import logging
-from typing import Dict, Any, Optional, List
-from datetime import datetime
+import time
+from collections import deque
+from typing import Dict, Any, Optional, List, Tuple
+from datetime import datetime, timedelta
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# Number of messages kept per user in conversation history
+HISTORY_LIMIT = 100
+
 
 class PipelineState(Enum):
     """States for different pipeline stages."""
@@ -31,8 +37,21 @@ class ConversationState:
         """Initialize conversation state manager."""
         self.user_contexts: Dict[str, Dict[str, Any]] = {}
         self.pending_actions: Dict[str, Dict[str, Any]] = {}
+        # Min-heap of (monotonic_ns expiry, user_id); entries for replaced
+        # or cleared actions are skipped lazily when popped
+        self._pending_heap: List[Tuple[int, str]] = []
         self.pipeline_states: Dict[str, PipelineState] = {}
-        self.session_data: Dict[str, Dict[str, Any]] = {}
+
+        # Session fields are kept in parallel dicts keyed by user so every
+        # read is a single lookup instead of a scan over sessions
+        self.session_ids: Dict[str, str] = {}
+        # Wall-clock creation time is kept for display only; age checks use
+        # integer time.monotonic_ns() readings
+        self.session_created: Dict[str, datetime] = {}
+        self.session_started_ns: Dict[str, int] = {}
+        self.last_activity_ns: Dict[str, int] = {}
+        self.message_counts: Dict[str, int] = {}
+        self.histories: Dict[str, deque] = {}
 
         logger.info("[ConversationState] Initialized")
 
@@ -45,17 +64,18 @@ class ConversationState:
         Returns:
             Session ID
         """
-        session_id = f"{user_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        now = datetime.now()
+        session_id = f"{user_id}_{now.strftime('%Y%m%d_%H%M%S')}"
 
         self.user_contexts[user_id] = {}
         self.pending_actions[user_id] = {}
         self.pipeline_states[user_id] = PipelineState.IDLE
-        self.session_data[session_id] = {
-            "user_id": user_id,
-            "created_at": datetime.now(),
-            "last_activity": datetime.now(),
-            "message_count": 0,
-        }
+        self.session_ids[user_id] = session_id
+        self.session_created[user_id] = now
+        self.session_started_ns[user_id] = self.last_activity_ns[user_id] = (
+            time.monotonic_ns()
+        )
+        self.message_counts[user_id] = 0
 
         logger.info(
             f"[ConversationState] Created session {session_id} for user {user_id}"
@@ -131,20 +151,22 @@ class ConversationState:
             action_data: Data needed to execute the action
             expires_in_seconds: Expiration time in seconds (default 1 hour)
         """
-        if user_id not in self.pending_actions:
-            self.pending_actions[user_id] = {}
+        expires_at = (
+            time.monotonic_ns() + int(expires_in_seconds * 1_000_000_000)
+            if expires_in_seconds
+            else None
+        )
 
         self.pending_actions[user_id] = {
             "action_type": action_type,
             "action_data": action_data,
             "created_at": datetime.now(),
-            "expires_at": (
-                datetime.now().timestamp() + expires_in_seconds
-                if expires_in_seconds
-                else None
-            ),
+            "expires_at": expires_at,
         }
 
+        if expires_at is not None:
+            heapq.heappush(self._pending_heap, (expires_at, user_id))
+
         logger.info(
             f"[ConversationState] Set pending action '{action_type}' for {user_id}"
         )
@@ -158,19 +180,22 @@ class ConversationState:
         Returns:
             Pending action dictionary or None
         """
-        action = self.pending_actions.get(user_id)
-
-        if action:
-            # Check if expired
-            if (
-                action.get("expires_at")
-                and datetime.now().timestamp() > action["expires_at"]
-            ):
+        self._purge_expired()
+        return self.pending_actions.get(user_id)
+
+    def _purge_expired(self):
+        """Drop pending actions whose expiry time has passed."""
+        now = time.monotonic_ns()
+        heap = self._pending_heap
+
+        while heap and heap[0][0] <= now:
+            expires_at, user_id = heapq.heappop(heap)
+            action = self.pending_actions.get(user_id)
+
+            # Skip entries for actions that were replaced or cleared
+            if action and action.get("expires_at") == expires_at:
                 logger.info(f"[ConversationState] Pending action expired for {user_id}")
                 self.clear_pending_action(user_id)
-                return None
-
-        return action
 
     def clear_pending_action(self, user_id: str):
         """Clear pending action for user.
@@ -220,12 +245,10 @@ class ConversationState:
             role: Role (user/assistant)
             metadata: Optional metadata
         """
-        history_key = f"{user_id}_history"
-
-        if history_key not in self.session_data:
-            self.session_data[history_key] = []
+        if user_id not in self.histories:
+            self.histories[user_id] = deque(maxlen=HISTORY_LIMIT)
 
-        self.session_data[history_key].append(
+        self.histories[user_id].append(
             {
                 "message": message,
                 "role": role,
@@ -234,23 +257,23 @@ class ConversationState:
             }
         )
 
-        # Keep only last 100 messages
-        if len(self.session_data[history_key]) > 100:
-            self.session_data[history_key] = self.session_data[history_key][-100:]
-
-    def get_history(self, user_id: str, limit: int = 10) -> List[Dict[str, Any]]:
+    def get_history(
+        self, user_id: str, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """Get conversation history for user.
 
         Args:
             user_id: User identifier
-            limit: Maximum number of messages to return
+            limit: Maximum number of messages to return, or None for the
+                full retained history
 
         Returns:
             List of message dictionaries
         """
-        history_key = f"{user_id}_history"
-        history = self.session_data.get(history_key, [])
-        return history[-limit:]
+        history = list(self.histories.get(user_id, ()))
+        if limit is not None:
+            history = history[-limit:]
+        return history
 
     def save_job_selection(self, user_id: str, job_ids: List[str]):
         """Save selected jobs for user.
@@ -303,15 +326,23 @@ class ConversationState:
         Args:
             user_id: User identifier
         """
-        # Find session for this user
-        for session_id, data in self.session_data.items():
-            if isinstance(data, dict) and data.get("user_id") == user_id:
-                data["message_count"] = data.get("message_count", 0) + 1
-                data["last_activity"] = datetime.now()
-                return
+        if user_id not in self.session_ids:
+            # No session found, create one
+            self.create_session(user_id)
 
-        # No session found, create one
-        self.create_session(user_id)
+        self.message_counts[user_id] += 1
+        self.last_activity_ns[user_id] = time.monotonic_ns()
+
+    def get_message_count(self, user_id: str) -> int:
+        """Get message count for user session.
+
+        Args:
+            user_id: User identifier
+
+        Returns:
+            Number of messages in the current session
+        """
+        return self.message_counts.get(user_id, 0)
 
     def get_session_info(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Get session information for user.
@@ -322,10 +353,23 @@ class ConversationState:
         Returns:
             Session info dictionary or None
         """
-        for session_id, data in self.session_data.items():
-            if data.get("user_id") == user_id:
-                return {"session_id": session_id, **data}
-        return None
+        session_id = self.session_ids.get(user_id)
+        if session_id is None:
+            return None
+
+        # Derive wall-clock last activity from the monotonic readings
+        created_at = self.session_created[user_id]
+        active_ns = self.last_activity_ns[user_id] - self.session_started_ns[user_id]
+
+        return {
+            "session_id": session_id,
+            "user_id": user_id,
+            "created_at": created_at,
+            "last_activity": created_at + timedelta(microseconds=active_ns // 1000),
+            "message_count": self.message_counts[user_id],
+            "pipeline_state": self.get_pipeline_state(user_id),
+            "has_pending_action": bool(self.pending_actions.get(user_id)),
+        }
 
     def cleanup_expired_sessions(self, max_age_hours: int = 24):
         """Clean up old sessions.
@@ -333,26 +377,26 @@ class ConversationState:
         Args:
             max_age_hours: Maximum age in hours before cleanup
         """
-        now = datetime.now()
-        expired = []
-
-        for session_id, data in self.session_data.items():
-            last_activity = data.get("last_activity")
-            if last_activity:
-                age_hours = (now - last_activity).total_seconds() / 3600
-                if age_hours > max_age_hours:
-                    expired.append(session_id)
-
-        for session_id in expired:
-            user_id = self.session_data[session_id].get("user_id")
-            del self.session_data[session_id]
+        cutoff_ns = time.monotonic_ns() - int(max_age_hours * 3600 * 1_000_000_000)
+        expired = [
+            user_id
+            for user_id, last_activity_ns in self.last_activity_ns.items()
+            if last_activity_ns < cutoff_ns
+        ]
+
+        for user_id in expired:
+            del self.session_ids[user_id]
+            del self.session_created[user_id]
+            del self.session_started_ns[user_id]
+            del self.last_activity_ns[user_id]
+            del self.message_counts[user_id]
 
             # Clean up related data
-            if user_id:
-                self.clear_context(user_id)
-                self.clear_pending_action(user_id)
-                if user_id in self.pipeline_states:
-                    del self.pipeline_states[user_id]
+            self.clear_context(user_id)
+            self.clear_pending_action(user_id)
+            self.histories.pop(user_id, None)
+            if user_id in self.pipeline_states:
+                del self.pipeline_states[user_id]
 
         if expired:
             logger.info(
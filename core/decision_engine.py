@@ -4,11 +4,115 @@ Decision Engine - Autonomous decision-making for agent workflows.
 
 import logging
 import re
-from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
+from collections import defaultdict, deque
+from functools import lru_cache
+from itertools import takewhile
+from typing import Dict, Any, Deque, Optional, List
+from datetime import date, datetime, timedelta
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Platform markers in lowercased application URLs, in priority order: a URL
+# naming several platforms (e.g. a LinkedIn redirect to Greenhouse) belongs
+# to the first one listed
+_PLATFORM_MARKERS = (
+    ("linkedin", "linkedin.com"),
+    ("greenhouse", "greenhouse"),
+    ("lever", "lever.co"),
+    ("workday", "workday"),
+    ("smartrecruiters", "smartrecruiters"),
+    ("icims", "icims"),
+)
+
+
+# Phrases indicating an application needs more than a resume
+_COMPLEX_RE = re.compile(
+    "|".join(
+        map(
+            re.escape,
+            [
+                "cover letter required",
+                "portfolio required",
+                "portfolio link",
+                "why do you want",
+                "why are you interested",
+                "writing sample",
+                "work sample",
+                "take-home assignment",
+                "coding challenge",
+                "essay question",
+            ],
+        )
+    ),
+    re.IGNORECASE,
+)
+
+
+def _parse_posted_date(value: Any) -> Optional[datetime]:
+    """Normalize a job's posted_date to a naive local datetime, or None.
+
+    Accepts datetimes, dates and ISO 8601 strings (including a trailing
+    "Z"); aware values are converted to local time so numpy never sees a
+    timezone.
+    """
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    elif isinstance(value, date) and not isinstance(value, datetime):
+        value = datetime.combine(value, datetime.min.time())
+    elif not isinstance(value, datetime):
+        return None
+
+    if value.tzinfo is not None:
+        value = value.astimezone().replace(tzinfo=None)
+    return value
+
+
+# Form field names that always require a human to fill in
+SENSITIVE_FIELDS = frozenset(
+    {
+        "salary",
+        "salary_expectations",
+        "current_salary",
+        "compensation",
+        "ssn",
+        "social_security",
+        "references",
+        "visa_status",
+        "citizenship",
+        "work_authorization",
+        "background_check",
+    }
+)
+
+# Fallback for free-form field labels not covered by SENSITIVE_FIELDS
+_SENSITIVE_RE = re.compile(
+    r"salary|compensation|ssn|social[\s_-]?security|references|legal"
+    r"|authorization|visa|citizenship|background[\s_-]?check",
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=4096)
+def _detect_platform_cached(url: str) -> str:
+    """Detect platform from application URL, memoized per URL.
+
+    Args:
+        url: Application URL
+
+    Returns:
+        Platform name
+    """
+    url_lower = url.lower()
+    return next(
+        (platform for platform, marker in _PLATFORM_MARKERS if marker in url_lower),
+        "unknown",
+    )
+
 
 class DecisionEngine:
     """Makes intelligent decisions about agent workflows and human involvement."""
@@ -20,22 +124,13 @@ class DecisionEngine:
             config: Optional Config instance for configuration
         """
         self.config = config
-        self.application_history: Dict[str, List[datetime]] = {}
-
-        # Load configuration or use defaults
-        if config:
-            auto_config = config.config.get("autonomous_mode", {}).get("auto_apply", {})
-            self.min_auto_apply_score = auto_config.get("min_match_score", 90)
-            self.max_applications_per_day = auto_config.get("max_per_day", 10)
-            self.trusted_platforms = set(
-                auto_config.get(
-                    "trusted_platforms", ["linkedin", "greenhouse", "lever", "workday"]
-                )
-            )
-        else:
-            self.min_auto_apply_score = 90
-            self.max_applications_per_day = 10
-            self.trusted_platforms = {"linkedin", "greenhouse", "lever", "workday"}
+        # Per-user application records, oldest first
+        self.application_history: Dict[str, Deque[Dict[str, Any]]] = defaultdict(deque)
+        # Applications recorded today per user, reset when the date changes
+        self._today_counts: Dict[str, int] = {}
+        self._counts_date: date = date.today()
+
+        self._load_settings()
 
         logger.info(
             f"[DecisionEngine] Initialized "
@@ -43,6 +138,35 @@ class DecisionEngine:
             f"max_daily={self.max_applications_per_day})"
         )
 
+    def _load_settings(self):
+        """Snapshot thresholds from config into instance attributes.
+
+        Decisions read these attributes instead of walking the config dict
+        on every call.
+        """
+        auto_config = {}
+        if self.config:
+            auto_config = self.config.config.get("autonomous_mode", {}).get(
+                "auto_apply", {}
+            )
+
+        self.min_auto_apply_score = auto_config.get("min_match_score", 90)
+        self.max_applications_per_day = auto_config.get("max_per_day", 10)
+        self.trusted_platforms = frozenset(
+            auto_config.get(
+                "trusted_platforms", ["linkedin", "greenhouse", "lever", "workday"]
+            )
+        )
+
+    def invalidate_config(self):
+        """Re-read thresholds after the underlying config has been reloaded."""
+        self._load_settings()
+        logger.info(
+            f"[DecisionEngine] Reloaded config "
+            f"(min_score={self.min_auto_apply_score}, "
+            f"max_daily={self.max_applications_per_day})"
+        )
+
     def should_auto_apply(
         self,
         user_id: str,
@@ -131,48 +255,71 @@ class DecisionEngine:
             user_preferences: Optional user preferences
 
         Returns:
-            Sorted list of jobs (highest priority first)
+            Sorted copies of the jobs (highest priority first), each with a
+            priority_score; the caller's dictionaries are left unchanged
         """
 
-        def score_priority(job: Dict[str, Any]) -> float:
-            """Calculate priority score."""
-            priority = 0.0
-
-            # Match score (40% weight)
-            match_score = job.get("match_score", 0)
-            priority += (match_score / 100) * 40
-
-            # Recency (20% weight)
-            posted_date = job.get("posted_date")
-            if posted_date:
-                days_ago = (datetime.now() - posted_date).days
-                recency_score = max(0, (30 - days_ago) / 30) * 20
-                priority += recency_score
-
-            # Platform trust (15% weight)
-            platform = self._detect_platform(job.get("application_url", ""))
-            if platform in self.trusted_platforms:
-                priority += 15
-
-            # Simplicity (15% weight - prefer simple applications)
-            if not self._has_complex_requirements(job):
-                priority += 15
-
-            # User preferences (10% weight)
-            if user_preferences:
-                if job.get("location") in user_preferences.get(
-                    "preferred_locations", []
-                ):
-                    priority += 5
-                if job.get("employment_type") in user_preferences.get(
-                    "employment_types", []
-                ):
-                    priority += 5
-
-            return priority
-
-        # Sort by priority score
-        sorted_jobs = sorted(jobs, key=score_priority, reverse=True)
+        if not jobs:
+            return []
+
+        n = len(jobs)
+        prefs = user_preferences or {}
+        preferred_locations = prefs.get("preferred_locations", [])
+        employment_types = prefs.get("employment_types", [])
+
+        # Gather per-job features into parallel arrays, then score the whole
+        # batch in one vectorized expression
+        match_scores = np.fromiter(
+            (job.get("match_score", 0) for job in jobs), dtype=np.float64, count=n
+        )
+        posted_dates = np.array(
+            [_parse_posted_date(job.get("posted_date")) for job in jobs],
+            dtype="datetime64[us]",
+        )
+        trusted = np.fromiter(
+            (
+                self._detect_platform(job.get("application_url", ""))
+                in self.trusted_platforms
+                for job in jobs
+            ),
+            dtype=np.bool_,
+            count=n,
+        )
+        simple = np.fromiter(
+            (not self._has_complex_requirements(job) for job in jobs),
+            dtype=np.bool_,
+            count=n,
+        )
+        location_match = np.fromiter(
+            (job.get("location") in preferred_locations for job in jobs),
+            dtype=np.bool_,
+            count=n,
+        )
+        type_match = np.fromiter(
+            (job.get("employment_type") in employment_types for job in jobs),
+            dtype=np.bool_,
+            count=n,
+        )
+
+        # Recency: jobs without a posted date (NaT) contribute nothing
+        now = np.datetime64(datetime.now(), "us")
+        days_ago = np.floor((now - posted_dates) / np.timedelta64(1, "D"))
+        recency = np.nan_to_num(np.maximum(0, (30 - days_ago) / 30) * 20)
+
+        priority = (
+            (match_scores / 100) * 40  # Match score (40% weight)
+            + recency  # Recency (20% weight)
+            + 15 * trusted  # Platform trust (15% weight)
+            + 15 * simple  # Simplicity (15% weight)
+            + 5 * location_match  # User preferences (10% weight)
+            + 5 * type_match
+        )
+
+        # Stable sort keeps input order for equal priorities
+        order = np.argsort(-priority, kind="stable")
+        sorted_jobs = [
+            {**jobs[idx], "priority_score": float(priority[idx])} for idx in order
+        ]
 
         logger.info(f"[DecisionEngine] Prioritized {len(sorted_jobs)} jobs")
         return sorted_jobs
@@ -258,43 +405,66 @@ class DecisionEngine:
         Returns:
             True if under limit, False if limit reached
         """
-        today = datetime.now().date()
-
-        # Initialize history for user if needed
-        if user_id not in self.application_history:
-            self.application_history[user_id] = []
-
-        # Filter to today's applications
-        today_applications = [
-            dt for dt in self.application_history[user_id] if dt.date() == today
-        ]
-
-        under_limit = len(today_applications) < self.max_applications_per_day
+        self._cleanup_old_applications(user_id)
+        today_count = self._get_today_count(user_id)
+        under_limit = today_count < self.max_applications_per_day
 
         if not under_limit:
             logger.warning(
                 f"[DecisionEngine] User {user_id} reached daily limit "
-                f"({len(today_applications)}/{self.max_applications_per_day})"
+                f"({today_count}/{self.max_applications_per_day})"
             )
 
         return under_limit
 
-    def record_application(self, user_id: str):
+    def record_application(self, user_id: str, job_id: Optional[str] = None):
         """Record that user submitted an application.
 
         Args:
             user_id: User identifier
+            job_id: Optional identifier of the job applied to
         """
-        if user_id not in self.application_history:
-            self.application_history[user_id] = []
+        now = datetime.now()
+        self._roll_today_counts(now.date())
+        self.application_history[user_id].append({"timestamp": now, "job_id": job_id})
+        self._today_counts[user_id] = self._today_counts.get(user_id, 0) + 1
 
-        self.application_history[user_id].append(datetime.now())
+    def _cleanup_old_applications(self, user_id: str, days: int = 30):
+        """Drop application records older than the retention window.
 
-        # Clean up old entries (keep last 30 days)
-        cutoff = datetime.now() - timedelta(days=30)
-        self.application_history[user_id] = [
-            dt for dt in self.application_history[user_id] if dt > cutoff
-        ]
+        Args:
+            user_id: User identifier
+            days: Number of days of history to keep
+        """
+        history = self.application_history[user_id]
+        cutoff = datetime.now() - timedelta(days=days)
+
+        # Records are appended in time order, so expired ones are at the left
+        while history and history[0]["timestamp"] < cutoff:
+            history.popleft()
+
+    def _roll_today_counts(self, today: Optional[date] = None):
+        """Reset daily application counts once the date has changed.
+
+        Args:
+            today: Current date, if the caller has already read the clock
+        """
+        today = today or date.today()
+        if today != self._counts_date:
+            self._counts_date = today
+            self._today_counts.clear()
+
+    def _get_today_count(self, user_id: str) -> int:
+        """Get number of applications user recorded today.
+
+        Args:
+            user_id: User identifier
+
+        Returns:
+            Application count for today
+        """
+        self._roll_today_counts()
+        return self._today_counts.get(user_id, 0)
 
     def _detect_platform(self, url: str) -> str:
         """Detect platform from application URL.
@@ -305,22 +475,7 @@ class DecisionEngine:
         Returns:
             Platform name
         """
-        url_lower = url.lower()
-
-        if "linkedin.com" in url_lower:
-            return "linkedin"
-        elif "greenhouse.io" in url_lower or "greenhouse" in url_lower:
-            return "greenhouse"
-        elif "lever.co" in url_lower:
-            return "lever"
-        elif "workday" in url_lower or "myworkdayjobs" in url_lower:
-            return "workday"
-        elif "smartrecruiters" in url_lower:
-            return "smartrecruiters"
-        elif "icims" in url_lower:
-            return "icims"
-        else:
-            return "unknown"
+        return _detect_platform_cached(url)
 
     def _has_complex_requirements(self, job: Dict[str, Any]) -> bool:
         """Check if job has complex requirements.
@@ -331,24 +486,12 @@ class DecisionEngine:
         Returns:
             True if complex requirements detected
         """
-        description = job.get("description", "").lower()
-        qualifications = job.get("qualifications", "").lower()
-        combined_text = f"{description} {qualifications}"
-
-        complex_indicators = [
-            "cover letter required",
-            "portfolio required",
-            "portfolio link",
-            "why do you want",
-            "why are you interested",
-            "writing sample",
-            "work sample",
-            "take-home assignment",
-            "coding challenge",
-            "essay question",
-        ]
+        description = job.get("description", "")
+        qualifications = job.get("qualifications", "")
 
-        return any(indicator in combined_text for indicator in complex_indicators)
+        return bool(
+            _COMPLEX_RE.search(description) or _COMPLEX_RE.search(qualifications)
+        )
 
     def _has_sensitive_fields(self, form_data: Dict[str, Any]) -> bool:
         """Check if form contains sensitive fields.
@@ -359,23 +502,15 @@ class DecisionEngine:
         Returns:
             True if sensitive fields detected
         """
-        sensitive_patterns = [
-            "salary",
-            "compensation",
-            "ssn",
-            "social security",
-            "references",
-            "legal",
-            "authorization",
-            "visa",
-            "citizenship",
-            "background check",
-        ]
-
-        # Check field names/labels
-        for field_name in form_data.keys():
-            field_lower = field_name.lower()
-            if any(pattern in field_lower for pattern in sensitive_patterns):
+        # Exact field names resolve with one hash-set check
+        if not form_data.keys().isdisjoint(SENSITIVE_FIELDS):
+            matched = next(name for name in form_data if name in SENSITIVE_FIELDS)
+            logger.info(f"[DecisionEngine] Sensitive field detected: {matched}")
+            return True
+
+        # Check remaining field names/labels
+        for field_name in form_data:
+            if _SENSITIVE_RE.search(field_name):
                 logger.info(f"[DecisionEngine] Sensitive field detected: {field_name}")
                 return True
 
@@ -390,11 +525,18 @@ class DecisionEngine:
         Returns:
             Statistics dictionary
         """
-        today = datetime.now().date()
-        history = self.application_history.get(user_id, [])
-
-        today_count = sum(1 for dt in history if dt.date() == today)
-        week_count = sum(1 for dt in history if dt.date() >= today - timedelta(days=7))
+        self._cleanup_old_applications(user_id)
+        today_count = self._get_today_count(user_id)
+
+        # Walk back from the newest record until we leave the week window
+        week_start = date.today() - timedelta(days=7)
+        week_count = sum(
+            1
+            for _ in takewhile(
+                lambda record: record["timestamp"].date() >= week_start,
+                reversed(self.application_history[user_id]),
+            )
+        )
 
         return {
             "applications_today": today_count,
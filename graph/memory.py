@@ -21,16 +21,34 @@ logger = logging.getLogger(__name__)
 class GraphMemory:
     """Manages Neo4j graph database operations."""
 
-    def __init__(self, uri: str, user: str, password: str, database: str = "neo4j"):
+    def __init__(
+        self,
+        uri: str,
+        user: str,
+        password: str,
+        database: str = "neo4j",
+        max_connection_pool_size: int = 32,
+        connection_acquisition_timeout: float = 30.0,
+    ):
         """Initialize Neo4j connection.
 
+        Every session is opened from this one driver, so queries borrow
+        connections from its pool instead of reconnecting.
+
         Args:
             uri: Neo4j connection URI (e.g., "bolt://localhost:7687")
             user: Neo4j username
             password: Neo4j password
             database: Database name (default: "neo4j")
-        """
-        self.driver = GraphDatabase.driver(uri, auth=(user, password))
+            max_connection_pool_size: Maximum pooled connections
+            connection_acquisition_timeout: Seconds to wait for a free connection
+        """
+        self.driver = GraphDatabase.driver(
+            uri,
+            auth=(user, password),
+            max_connection_pool_size=max_connection_pool_size,
+            connection_acquisition_timeout=connection_acquisition_timeout,
+        )
         self.database = database
         self._initialize_schema()
 
@@ -133,6 +151,28 @@ class GraphMemory:
             record = result.single()
             return dict(record["job"]) if record else None
 
+    def get_jobs_bulk(self, job_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Retrieve several jobs in a single query.
+
+        Args:
+            job_ids: Job identifiers
+
+        Returns:
+            Job data dictionaries keyed by job ID; unknown IDs are omitted
+        """
+        if not job_ids:
+            return {}
+
+        query = f"""
+        UNWIND $job_ids AS job_id
+        MATCH (j:{NodeType.JOB} {{job_id: job_id}})
+        RETURN job_id, j as job
+        """
+
+        with self.driver.session(database=self.database) as session:
+            result = session.run(query, job_ids=list(job_ids))
+            return {record["job_id"]: dict(record["job"]) for record in result}
+
     def search_jobs(
         self, filters: Optional[Dict[str, Any]] = None, limit: int = 50
     ) -> List[Dict[str, Any]]:
@@ -437,6 +477,51 @@ class GraphMemory:
                 query, user_id=user_id, job_id=job_id, application_id=application_id
             )
 
+    def create_applications_bulk(
+        self, user_id: str, applications: List[Dict[str, Any]]
+    ) -> List[str]:
+        """Create application nodes and link them to a user and their jobs in one query.
+
+        Args:
+            user_id: User identifier
+            applications: Application data dictionaries, each with
+                "application_id" and "job_id"
+
+        Returns:
+            IDs of the applications created; rows whose user or job does not
+            exist are skipped without creating a node
+        """
+        if not applications:
+            return []
+
+        query = f"""
+        UNWIND $applications AS app
+        MATCH (u:{NodeType.USER} {{user_id: $user_id}})
+        MATCH (j:{NodeType.JOB} {{job_id: app.job_id}})
+        MERGE (a:{NodeType.APPLICATION} {{application_id: app.application_id}})
+        SET a += app.properties
+        MERGE (u)-[:{RelationshipType.APPLIED_TO}]->(a)
+        MERGE (a)-[:{RelationshipType.APPLIED_TO}]->(j)
+        RETURN a.application_id as application_id
+        """
+
+        rows = [
+            {
+                "application_id": app["application_id"],
+                "job_id": app["job_id"],
+                "properties": {
+                    k: v
+                    for k, v in app.items()
+                    if k not in ("application_id", "job_id")
+                },
+            }
+            for app in applications
+        ]
+
+        with self.driver.session(database=self.database) as session:
+            result = session.run(query, user_id=user_id, applications=rows)
+            return [record["application_id"] for record in result]
+
     def update_application_status(
         self, application_id: str, status: ApplicationStatus
     ) -> bool:
@@ -4,6 +4,7 @@ LLM client and prompt management.
 
 from .llama_client import LLMClient, OllamaClient, VLLMClient, create_llm_client
 from .prompts import PromptTemplates
+from .schemas import JobExtract
 
-__all__ = ["LLMClient", "OllamaClient", "VLLMClient", "create_llm_client", "PromptTemplates"]
+__all__ = ["LLMClient", "OllamaClient", "VLLMClient", "create_llm_client", "PromptTemplates", "JobExtract"]
 
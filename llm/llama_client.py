@@ -5,6 +5,7 @@ LLM client wrapper for Ollama and vLLM.
 import json
 import logging
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List
 from abc import ABC, abstractmethod
 
@@ -23,6 +24,27 @@ class LLMClient(ABC):
     def generate_json(self, prompt: str, **kwargs) -> Dict[str, Any]:
         """Generate and parse JSON response."""
         pass
+    
+    def generate_json_batch(self, prompts: List[str], max_concurrency: int = 8, **kwargs) -> List[Dict[str, Any]]:
+        """Generate and parse JSON responses for several prompts.
+        
+        By default the prompts are sent as concurrent requests, which lets
+        servers that batch in-flight requests (Ollama with OLLAMA_NUM_PARALLEL,
+        vLLM, TGI) decode them together. Clients with a native batch endpoint
+        override this.
+        
+        Args:
+            prompts: Input prompts (should request JSON output)
+            max_concurrency: Maximum requests in flight at once
+            **kwargs: Additional arguments for generate_json()
+            
+        Returns:
+            Parsed JSON dictionaries, in prompt order
+        """
+        if not prompts:
+            return []
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            return list(executor.map(lambda prompt: self.generate_json(prompt, **kwargs), prompts))
 
 
 class OllamaClient(LLMClient):
@@ -49,13 +71,20 @@ class OllamaClient(LLMClient):
         self.max_tokens = max_tokens
         self.api_url = f"{self.base_url}/api/generate"
     
-    def generate(self, prompt: str, temperature: Optional[float] = None, max_tokens: Optional[int] = None) -> str:
+    def generate(
+        self,
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        schema: Optional[Dict[str, Any]] = None
+    ) -> str:
         """Generate text from a prompt.
         
         Args:
             prompt: Input prompt
             temperature: Override default temperature
             max_tokens: Override default max_tokens
+            schema: Optional JSON schema the output is constrained to
             
         Returns:
             Generated text
@@ -69,6 +98,9 @@ class OllamaClient(LLMClient):
                 "num_predict": max_tokens if max_tokens is not None else self.max_tokens,
             }
         }
+        if schema is not None:
+            # Ollama constrains decoding to the schema, so output always parses
+            payload["format"] = schema
         
         try:
             response = requests.post(self.api_url, json=payload, timeout=120)
@@ -143,7 +175,12 @@ class OllamaClient(LLMClient):
 
 
 class VLLMClient(LLMClient):
-    """vLLM client for high-performance inference (future implementation)."""
+    """vLLM client for high-performance inference (future implementation).
+    
+    Prompts built from PromptTemplates keep their fixed instructions first,
+    so run the server with ``vllm serve <model> --enable-prefix-caching`` to
+    skip prefill on the shared prefix.
+    """
     
     def __init__(
         self,
@@ -166,13 +203,20 @@ class VLLMClient(LLMClient):
         self.max_tokens = max_tokens
         self.api_url = f"{self.base_url}/v1/completions"
     
-    def generate(self, prompt: str, temperature: Optional[float] = None, max_tokens: Optional[int] = None) -> str:
+    def generate(
+        self,
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        schema: Optional[Dict[str, Any]] = None
+    ) -> str:
         """Generate text from a prompt.
         
         Args:
             prompt: Input prompt
             temperature: Override default temperature
             max_tokens: Override default max_tokens
+            schema: Optional JSON schema the output is constrained to
             
         Returns:
             Generated text
@@ -183,6 +227,9 @@ class VLLMClient(LLMClient):
             "temperature": temperature if temperature is not None else self.temperature,
             "max_tokens": max_tokens if max_tokens is not None else self.max_tokens,
         }
+        if schema is not None:
+            # vLLM guided decoding keeps output valid against the schema
+            payload["guided_json"] = schema
         
         try:
             response = requests.post(self.api_url, json=payload, timeout=120)
@@ -193,10 +240,73 @@ class VLLMClient(LLMClient):
             logger.error(f"Error calling vLLM API: {e}")
             raise
     
+    def generate_batch(
+        self,
+        prompts: List[str],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        schema: Optional[Dict[str, Any]] = None
+    ) -> List[str]:
+        """Generate responses for multiple prompts in a single request.
+        
+        The completions endpoint accepts a list of prompts, so vLLM schedules
+        them together instead of receiving them one request at a time.
+        
+        Args:
+            prompts: List of input prompts
+            temperature: Override default temperature
+            max_tokens: Override default max_tokens
+            schema: Optional JSON schema every output is constrained to
+            
+        Returns:
+            List of generated texts, in prompt order
+        """
+        if not prompts:
+            return []
+        
+        payload = {
+            "model": self.model_name,
+            "prompt": prompts,
+            "temperature": temperature if temperature is not None else self.temperature,
+            "max_tokens": max_tokens if max_tokens is not None else self.max_tokens,
+        }
+        if schema is not None:
+            payload["guided_json"] = schema
+        
+        try:
+            response = requests.post(self.api_url, json=payload, timeout=120)
+            response.raise_for_status()
+            choices = response.json().get("choices", [])
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error calling vLLM API: {e}")
+            raise
+        
+        texts = [""] * len(prompts)
+        for choice in choices:
+            index = choice.get("index", 0)
+            if 0 <= index < len(texts):
+                texts[index] = choice.get("text", "").strip()
+        return texts
+    
     def generate_json(self, prompt: str, **kwargs) -> Dict[str, Any]:
         """Generate and parse JSON response."""
-        response = self.generate(prompt, **kwargs)
+        return self._parse_json(self.generate(prompt, **kwargs))
+    
+    def generate_json_batch(self, prompts: List[str], max_concurrency: int = 8, **kwargs) -> List[Dict[str, Any]]:
+        """Generate and parse JSON responses for several prompts in one request.
         
+        Args:
+            prompts: Input prompts (should request JSON output)
+            max_concurrency: Unused; the whole batch is sent in one request
+            **kwargs: Additional arguments for generate_batch()
+            
+        Returns:
+            Parsed JSON dictionaries, in prompt order
+        """
+        return [self._parse_json(text) for text in self.generate_batch(prompts, **kwargs)]
+    
+    def _parse_json(self, response: str) -> Dict[str, Any]:
+        """Parse the JSON object or array embedded in a model response."""
         try:
             response = response.strip()
             start_idx = response.find('{')
@@ -3,10 +3,13 @@ Unified LLM client supporting multiple providers.
 Supports: Ollama (local), Groq (fast & free), Together AI, OpenAI-compatible APIs.
 """
 
+import json
 import logging
 import requests
 import time
-from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import Optional, Dict, Any, Iterator, List
 
 logger = logging.getLogger(__name__)
 
@@ -29,47 +32,64 @@ class LLMClient:
         self.temperature = float(config.get("temperature", 0.7))
         self.max_tokens = int(config.get("max_tokens", 2048))
 
+        # One pooled session per client so consecutive calls (e.g. resume and
+        # cover letter generation) reuse the same keep-alive connection
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
         logger.info(
             f"[LLMClient] Initialized with provider={self.provider}, model={self.model_name}"
         )
 
-    def generate(self, prompt: str, retries: int = 3) -> Optional[str]:
+    def generate(
+        self,
+        prompt: str,
+        retries: int = 3,
+        schema: Optional[Dict[str, Any]] = None,
+    ) -> Optional[str]:
         """
         Generate text from prompt using configured provider.
 
         Args:
             prompt: Input prompt
             retries: Number of retry attempts (default 3 for better rate limit handling)
+            schema: Optional JSON schema the output is constrained to
 
         Returns:
             Generated text or None if failed
         """
         if self.provider == "ollama":
-            return self._generate_ollama(prompt, retries)
+            return self._generate_ollama(prompt, retries, schema)
         elif self.provider == "groq":
-            return self._generate_groq(prompt, retries)
+            return self._generate_groq(prompt, retries, schema)
         elif self.provider == "together":
-            return self._generate_together(prompt, retries)
+            return self._generate_together(prompt, retries, schema)
         elif self.provider == "openai":
-            return self._generate_openai_compatible(prompt, retries)
+            return self._generate_openai_compatible(prompt, retries, schema)
         else:
             logger.error(f"[LLMClient] Unknown provider: {self.provider}")
             return None
 
-    def generate_json(self, prompt: str, retries: int = 3) -> Dict[str, Any]:
+    def generate_json(
+        self,
+        prompt: str,
+        retries: int = 3,
+        schema: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
         """
         Generate and parse JSON response from prompt.
 
         Args:
             prompt: Input prompt (should request JSON output)
             retries: Number of retry attempts (default 3 for better rate limit handling)
+            schema: Optional JSON schema the output is constrained to
 
         Returns:
             Parsed JSON dictionary
         """
-        import json
-
-        response = self.generate(prompt, retries)
+        response = self.generate(prompt, retries, schema=schema)
 
         if not response:
             return {"error": "Failed to generate response"}
@@ -100,7 +120,129 @@ class LLMClient:
             # Return a fallback structure
             return {"error": "Failed to parse JSON", "raw_response": response}
 
-    def _generate_ollama(self, prompt: str, retries: int) -> Optional[str]:
+    def generate_json_batch(
+        self,
+        prompts: List[str],
+        retries: int = 3,
+        max_concurrency: int = 8,
+        schema: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate and parse JSON responses for several prompts.
+
+        The prompts are sent as concurrent requests over the pooled session,
+        so providers that batch in-flight requests can decode them together.
+
+        Args:
+            prompts: Input prompts (should request JSON output)
+            retries: Number of retry attempts per prompt
+            max_concurrency: Maximum requests in flight at once
+            schema: Optional JSON schema every output is constrained to
+
+        Returns:
+            Parsed JSON dictionaries, in prompt order
+        """
+        if not prompts:
+            return []
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            return list(
+                executor.map(
+                    lambda prompt: self.generate_json(prompt, retries, schema),
+                    prompts,
+                )
+            )
+
+    def generate_stream(self, prompt: str) -> Iterator[str]:
+        """
+        Stream generated text from prompt as it is decoded.
+
+        Streams are not retried: a failure part way through would repeat
+        text the caller has already consumed. Instead the failure is raised
+        after the chunks already yielded, so callers can tell a truncated
+        stream from a finished one.
+
+        Args:
+            prompt: Input prompt
+
+        Yields:
+            Text chunks in generation order
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails or the
+                stream ends before the provider's completion marker
+            ValueError: If the provider sends a malformed chunk
+        """
+        if self.provider == "ollama":
+            url = f"{self.base_url}/api/generate"
+            headers = {}
+            payload = {
+                "model": self.model_name,
+                "prompt": prompt,
+                "stream": True,
+                "options": {"temperature": self.temperature, "top_p": 0.9},
+            }
+        elif self.provider in ("groq", "together", "openai"):
+            url = {
+                "groq": "https://api.groq.com/openai/v1/chat/completions",
+                "together": "https://api.together.xyz/v1/chat/completions",
+                "openai": f"{self.base_url}/chat/completions",
+            }[self.provider]
+            headers = {
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+            }
+            payload = {
+                "model": self.model_name,
+                "messages": [{"role": "user", "content": prompt}],
+                "temperature": self.temperature,
+                "max_tokens": self.max_tokens,
+                "stream": True,
+            }
+        else:
+            logger.error(f"[LLMClient] Unknown provider: {self.provider}")
+            return
+
+        completed = False
+        try:
+            with self.session.post(
+                url, headers=headers, json=payload, timeout=self.timeout, stream=True
+            ) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    if self.provider == "ollama":
+                        data = json.loads(line)
+                        chunk = data.get("response", "")
+                        done = data.get("done", False)
+                    else:
+                        # Server-sent events: "data: {...}" lines ending with [DONE]
+                        if not line.startswith(b"data:"):
+                            continue
+                        line = line[len(b"data:") :].strip()
+                        if line == b"[DONE]":
+                            completed = True
+                            break
+                        choices = json.loads(line).get("choices") or [{}]
+                        chunk = choices[0].get("delta", {}).get("content") or ""
+                        done = False
+                    if chunk:
+                        yield chunk
+                    if done:
+                        completed = True
+                        break
+                if not completed:
+                    # Ollama's "done" record or the SSE [DONE] line never came
+                    raise requests.exceptions.ConnectionError(
+                        "Stream ended before the completion marker"
+                    )
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.error(f"[LLMClient] Streaming error: {e}")
+            raise
+
+    def _generate_ollama(
+        self, prompt: str, retries: int, schema: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
         """Generate using local Ollama."""
         url = f"{self.base_url}/api/generate"
         payload = {
@@ -109,10 +251,12 @@ class LLMClient:
             "stream": False,
             "options": {"temperature": self.temperature, "top_p": 0.9},
         }
+        if schema is not None:
+            payload["format"] = schema
 
         for attempt in range(retries + 1):
             try:
-                response = requests.post(url, json=payload, timeout=self.timeout)
+                response = self.session.post(url, json=payload, timeout=self.timeout)
                 response.raise_for_status()
                 data = response.json()
                 return data.get("response", "").strip()
@@ -128,7 +272,9 @@ class LLMClient:
 
         return None
 
-    def _generate_groq(self, prompt: str, retries: int) -> Optional[str]:
+    def _generate_groq(
+        self, prompt: str, retries: int, schema: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
         """
         Generate using Groq API (fast inference).
         Free tier: 30 requests/min, very fast Llama models.
@@ -145,10 +291,12 @@ class LLMClient:
             "temperature": self.temperature,
             "max_tokens": self.max_tokens,
         }
+        if schema is not None:
+            payload["response_format"] = self._response_format(schema)
 
         for attempt in range(retries + 1):
             try:
-                response = requests.post(
+                response = self.session.post(
                     url, headers=headers, json=payload, timeout=self.timeout
                 )
                 response.raise_for_status()
@@ -196,7 +344,9 @@ class LLMClient:
 
         return None
 
-    def _generate_together(self, prompt: str, retries: int) -> Optional[str]:
+    def _generate_together(
+        self, prompt: str, retries: int, schema: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
         """
         Generate using Together AI API.
         Free tier available with credits.
@@ -213,10 +363,12 @@ class LLMClient:
             "temperature": self.temperature,
             "max_tokens": self.max_tokens,
         }
+        if schema is not None:
+            payload["response_format"] = self._response_format(schema)
 
         for attempt in range(retries + 1):
             try:
-                response = requests.post(
+                response = self.session.post(
                     url, headers=headers, json=payload, timeout=self.timeout
                 )
                 response.raise_for_status()
@@ -234,7 +386,9 @@ class LLMClient:
 
         return None
 
-    def _generate_openai_compatible(self, prompt: str, retries: int) -> Optional[str]:
+    def _generate_openai_compatible(
+        self, prompt: str, retries: int, schema: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
         """
         Generate using any OpenAI-compatible API.
         Works with OpenAI, Azure OpenAI, or compatible endpoints.
@@ -250,10 +404,12 @@ class LLMClient:
             "temperature": self.temperature,
             "max_tokens": self.max_tokens,
         }
+        if schema is not None:
+            payload["response_format"] = self._response_format(schema)
 
         for attempt in range(retries + 1):
             try:
-                response = requests.post(
+                response = self.session.post(
                     url, headers=headers, json=payload, timeout=self.timeout
                 )
                 response.raise_for_status()
@@ -271,6 +427,24 @@ class LLMClient:
 
         return None
 
+    def _response_format(self, schema: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the chat-completions response_format for a JSON schema.
+
+        OpenAI enforces the schema itself; Groq and Together only guarantee
+        valid JSON across all their models, so they get JSON mode.
+        """
+        if self.provider == "openai":
+            return {
+                "type": "json_schema",
+                "json_schema": {"name": "response", "schema": schema},
+            }
+        return {"type": "json_object"}
+
+    def close(self):
+        """Close the underlying HTTP session."""
+        self.session.close()
+
     def is_available(self) -> bool:
         """
         Quick health check to verify LLM service is reachable.
@@ -281,7 +455,7 @@ class LLMClient:
         try:
             if self.provider == "ollama":
                 version_url = f"{self.base_url}/api/version"
-                response = requests.get(version_url, timeout=5)
+                response = self.session.get(version_url, timeout=5)
                 return response.ok
             elif self.provider in ["groq", "together", "openai"]:
                 # For API services, check if API key is set (format validation)
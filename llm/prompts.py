@@ -7,10 +7,9 @@ class PromptTemplates:
     """Collection of prompt templates for agent tasks."""
     
     # Extractor Agent Prompts
-    EXTRACT_JOB_INFO = """You are a job information extraction assistant. Extract structured information from the following job description.
-
-Job Description:
-{job_description}
+    # Instructions precede the job description so every extraction prompt
+    # shares the same prefix and can reuse the server's prefix cache
+    EXTRACT_JOB_INFO = """You are a job information extraction assistant. Extract structured information from the job description below.
 
 Extract the following information in JSON format:
 {{
@@ -26,7 +25,10 @@ Extract the following information in JSON format:
     "company_name": "company name if mentioned"
 }}
 
-Return only valid JSON, no additional text."""
+Return only valid JSON, no additional text.
+
+Job Description:
+{job_description}"""
 
     EXTRACT_SKILLS = """Extract all technical and soft skills mentioned in the following job description. Return a JSON array of skill names.
 
@@ -0,0 +1,22 @@
+"""
+Structured output schemas for constrained LLM decoding.
+"""
+
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class JobExtract(BaseModel):
+    """Structured job information returned by the extraction prompt."""
+
+    title: str
+    required_skills: List[str]
+    preferred_skills: List[str]
+    experience_level: str
+    education_required: str
+    responsibilities: List[str]
+    location: str
+    employment_type: str
+    salary_range: Optional[str] = None
+    company_name: Optional[str] = None
@@ -3,7 +3,9 @@ Test script for ScoutAgent
 """
 
 import sys
+import argparse
 import logging
+import subprocess
 from pathlib import Path
 
 # Add parent directory to path
@@ -141,5 +143,80 @@ def test_scout_agent():
             logger.info("Graph memory connection closed")
 
 
+def initial_load(keywords: str, max_results: int, import_dir: str):
+    """Seed an empty database via neo4j-admin bulk import.
+
+    Bypasses the transactional MERGE path of ``store_jobs``. neo4j-admin
+    only imports into an empty, stopped database, so this is meant for the
+    very first load only.
+    """
+    config_path = Path(__file__).parent.parent / "config.yaml"
+    config = Config(str(config_path))
+    neo4j_config = config.get_neo4j_config()
+
+    # The target database must be offline for the import, so skip GraphMemory
+    scout = ScoutAgent(graph_memory=None, config=config)
+
+    logger.info(f"Fetching up to {max_results} jobs for initial load...")
+    jobs = scout.search_jobs(
+        keywords=keywords,
+        date_posted=None,
+        max_results=max_results,
+        api_source="jsearch",
+    )
+
+    if not jobs:
+        logger.warning("No jobs to import")
+        return
+
+    paths = scout.dump_jobs_csv(jobs, import_dir)
+
+    command = [
+        config.get("neo4j.admin_path", "neo4j-admin"),
+        "database",
+        "import",
+        "full",
+        f"--nodes={paths['jobs']}",
+        f"--nodes={paths['companies']}",
+        f"--relationships={paths['relationships']}",
+        # Descriptions contain newlines, and postings can repeat across pages
+        "--multiline-fields=true",
+        "--skip-duplicate-nodes=true",
+        neo4j_config["database"],
+    ]
+
+    logger.info(f"Running: {' '.join(command)}")
+    try:
+        subprocess.run(command, check=True)
+        logger.info(f"Imported {len(jobs)} jobs into {neo4j_config['database']}")
+    except FileNotFoundError:
+        logger.error("neo4j-admin not found. Set neo4j.admin_path in config.yaml")
+    except subprocess.CalledProcessError as e:
+        logger.error(f"neo4j-admin import failed with exit code {e.returncode}")
+
+
 if __name__ == "__main__":
-    test_scout_agent()
+    parser = argparse.ArgumentParser(description="Scout Agent runner")
+    parser.add_argument(
+        "--initial-load",
+        action="store_true",
+        help="Seed an empty database with neo4j-admin import instead of store_jobs",
+    )
+    parser.add_argument(
+        "--keywords", default="software engineer", help="Search keywords"
+    )
+    parser.add_argument(
+        "--max-results",
+        type=int,
+        default=200,
+        help="Jobs to fetch for initial load (JSearch counts every page of 10)",
+    )
+    parser.add_argument(
+        "--import-dir", default="outputs/import", help="Directory for import CSVs"
+    )
+    args = parser.parse_args()
+
+    if args.initial_load:
+        initial_load(args.keywords, args.max_results, args.import_dir)
+    else:
+        test_scout_agent()
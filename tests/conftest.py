@@ -0,0 +1,55 @@
+"""
+Shared fixtures for the agent tests.
+
+Spec mocks are built once per test module, since introspecting the spec
+class is the costly part, and reset before every test that requests them
+so configured return values and side effects never leak between tests.
+"""
+
+import pytest
+from unittest.mock import Mock
+from graph.memory import GraphMemory
+from llm.llama_client import LLMClient
+from utils.embeddings import EmbeddingGenerator
+
+
+def _reset(mock):
+    """Clear calls, return values and side effects, including on child mocks."""
+    mock.reset_mock(return_value=True, side_effect=True)
+    return mock
+
+
+@pytest.fixture(scope="module")
+def shared_graph_memory():
+    """GraphMemory spec mock shared by one test module."""
+    return Mock(spec=GraphMemory)
+
+
+@pytest.fixture(scope="module")
+def shared_llm_client():
+    """LLMClient spec mock shared by one test module."""
+    return Mock(spec=LLMClient)
+
+
+@pytest.fixture(scope="module")
+def shared_embedding_generator():
+    """EmbeddingGenerator spec mock shared by one test module."""
+    return Mock(spec=EmbeddingGenerator)
+
+
+@pytest.fixture
+def mock_graph_memory(shared_graph_memory):
+    """Create a mock GraphMemory instance."""
+    return _reset(shared_graph_memory)
+
+
+@pytest.fixture
+def mock_llm_client(shared_llm_client):
+    """Create a mock LLMClient instance."""
+    return _reset(shared_llm_client)
+
+
+@pytest.fixture
+def mock_embedding_generator(shared_embedding_generator):
+    """Create a mock EmbeddingGenerator instance."""
+    return _reset(shared_embedding_generator)
@@ -5,7 +5,12 @@ Tests for AgentCommunicationBus and AgentMessage.
 import pytest
 import asyncio
 from datetime import datetime
-from core.agent_communication import AgentMessage, MessageType, AgentCommunicationBus
+from core.agent_communication import (
+    AgentMessage,
+    MessageType,
+    AgentCommunicationBus,
+    CeleryBus,
+)
 from agents.base_agent import BaseAgent
 
 
@@ -33,6 +38,24 @@ class MockAgent(BaseAgent):
         pass
 
 
+class EchoAgent(MockAgent):
+    """Agent that answers each message with its payload."""
+
+    async def handle_message(self, message: AgentMessage):
+        """Return the payload, asking itself first when told to."""
+        self.received_messages.append(message)
+        await asyncio.sleep(0)
+        if message.payload.get("ask_self"):
+            inner = AgentMessage(
+                from_agent=self.name,
+                to_agent=self.name,
+                message_type=MessageType.REQUEST_DATA,
+                payload={"text": "inner"},
+            )
+            return await self.communication_bus.send_and_wait(inner, timeout=1.0)
+        return message.payload
+
+
 class TestAgentMessage:
     """Test AgentMessage dataclass."""
 
@@ -103,6 +126,40 @@ class TestAgentMessage:
         assert message.requires_response
         assert message.correlation_id == "test123"
 
+    def test_message_bytes_roundtrip(self):
+        """Test binary serialization round trip."""
+        message = AgentMessage(
+            from_agent="agent1",
+            to_agent="agent2",
+            message_type=MessageType.REQUEST_DATA,
+            payload={"key": "value"},
+            requires_response=True,
+        )
+
+        restored = AgentMessage.from_bytes(message.to_bytes())
+
+        assert restored.message_type == MessageType.REQUEST_DATA
+        assert restored.payload == {"key": "value"}
+        assert restored.correlation_id == message.correlation_id
+        assert restored.timestamp == message.timestamp
+
+    def test_message_msgpack_roundtrip(self):
+        """Test MessagePack serialization round trip."""
+        pytest.importorskip("msgpack")
+
+        message = AgentMessage(
+            from_agent="agent1",
+            to_agent="agent2",
+            message_type=MessageType.NOTIFICATION,
+            payload={"text": "hello"},
+        )
+
+        restored = AgentMessage.from_msgpack(message.to_msgpack())
+
+        assert restored.message_type == MessageType.NOTIFICATION
+        assert restored.payload == {"text": "hello"}
+        assert restored.timestamp == message.timestamp
+
 
 class TestAgentCommunicationBus:
     """Test AgentCommunicationBus."""
@@ -170,6 +227,69 @@ class TestAgentCommunicationBus:
                 "nonexistent", MessageType.NOTIFICATION, {}, requires_response=False
             )
 
+    @pytest.mark.asyncio
+    async def test_send_and_wait(self, bus):
+        """Test send_and_wait returns once the handler has finished."""
+        agent1 = MockAgent("agent1")
+        agent2 = MockAgent("agent2")
+        bus.register_agent("agent1", agent1)
+        bus.register_agent("agent2", agent2)
+
+        message = AgentMessage(
+            from_agent="agent1",
+            to_agent="agent2",
+            message_type=MessageType.NOTIFICATION,
+            payload={"text": "hello"},
+        )
+
+        # No sleep needed: the handler has run when the await completes
+        await bus.send_and_wait(message, timeout=1.0)
+
+        assert len(agent2.received_messages) == 1
+        assert agent2.received_messages[0].payload == {"text": "hello"}
+
+    @pytest.mark.asyncio
+    async def test_send_and_wait_shared_correlation_id(self, bus):
+        """Test concurrent requests in one conversation get their own results."""
+        bus.register_agent("agent1", MockAgent("agent1"))
+        bus.register_agent("agent2", EchoAgent("agent2"))
+
+        messages = [
+            AgentMessage(
+                from_agent="agent1",
+                to_agent="agent2",
+                message_type=MessageType.REQUEST_DATA,
+                payload={"text": text},
+                correlation_id="conversation-1",
+            )
+            for text in ("first", "second")
+        ]
+
+        results = await asyncio.gather(
+            *(bus.send_and_wait(message, timeout=1.0) for message in messages)
+        )
+
+        assert results == [{"text": "first"}, {"text": "second"}]
+
+    @pytest.mark.asyncio
+    async def test_send_and_wait_to_self_from_handler(self, bus):
+        """Test a handler awaiting its own agent does not deadlock."""
+        agent = EchoAgent("agent1")
+        bus.register_agent("agent1", agent)
+        agent.set_communication_bus(bus)
+
+        message = AgentMessage(
+            from_agent="agent1",
+            to_agent="agent1",
+            message_type=MessageType.REQUEST_DATA,
+            payload={"ask_self": True},
+        )
+
+        result = await bus.send_and_wait(message, timeout=1.0)
+
+        assert result == {"text": "inner"}
+        assert len(agent.received_messages) == 2
+
     @pytest.mark.asyncio
     async def test_broadcast(self, bus):
         """Test broadcasting to all agents."""
@@ -201,6 +321,10 @@ class TestAgentCommunicationBus:
         assert len(agent2.received_messages) == 1
         assert len(agent3.received_messages) == 1
 
+        # Each recipient's copy is addressed to it
+        assert agent2.received_messages[0].to_agent == "agent2"
+        assert agent3.received_messages[0].to_agent == "agent3"
+
     def test_message_history(self, bus):
         """Test message history tracking."""
         agent1 = MockAgent("agent1")
@@ -289,5 +413,35 @@ class TestAgentCommunicationBus:
         assert len(history) == 0
 
 
+class TestCeleryBus:
+    """Test CeleryBus delivery."""
+
+    @pytest.fixture
+    def bus(self):
+        """Create a Celery bus that runs tasks eagerly in-process."""
+        celery = pytest.importorskip("celery")
+        app = celery.Celery("test_bus", broker="memory://", backend="cache+memory://")
+        app.conf.task_always_eager = True
+        return CeleryBus(app=app)
+
+    def test_fire_and_forget_delivery(self, bus):
+        """Test queued messages reach the agent through the Celery task."""
+        agent = MockAgent("agent1")
+        bus.register_agent("agent1", agent)
+
+        message = AgentMessage(
+            from_agent="tester",
+            to_agent="agent1",
+            message_type=MessageType.NOTIFICATION,
+            payload={"text": "hello"},
+        )
+        bus._enqueue(message)
+
+        assert len(agent.received_messages) == 1
+        received = agent.received_messages[0]
+        assert received.payload == {"text": "hello"}
+        assert received.correlation_id == message.correlation_id
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
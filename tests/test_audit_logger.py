@@ -0,0 +1,204 @@
+"""
+Unit tests for the audit logger.
+"""
+
+import json
+import logging
+from datetime import datetime, timedelta
+
+import pytest
+
+from utils.audit_logger import AuditLogger, BufferedRotatingFileHandler
+
+
+@pytest.fixture
+def make_logger(tmp_path, monkeypatch):
+    """Build AuditLoggers writing under a temporary directory."""
+    monkeypatch.chdir(tmp_path)
+    loggers = []
+
+    def factory(**audit):
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(json.dumps({"audit": audit}))
+        audit_logger = AuditLogger(str(config_path))
+        loggers.append(audit_logger)
+        return audit_logger
+
+    yield factory
+    for audit_logger in loggers:
+        audit_logger.close()
+
+
+def log_application(audit_logger, user_id="u1", platform="linkedin", score=0.8):
+    """Log one successful application event."""
+    audit_logger.log_application_submission(
+        user_id=user_id,
+        job_id="job1",
+        job_title="Engineer",
+        company="Acme",
+        platform=platform,
+        match_score=score,
+        auto_applied=True,
+        success=True,
+    )
+
+
+def legacy_line(timestamp, user_id="u1"):
+    """Format an application event the way json.dumps-era releases wrote it."""
+    data = {
+        "event": "application_submission",
+        "timestamp": timestamp.isoformat(),
+        "user_id": user_id,
+        "platform": "linkedin",
+        "match_score": 0.9,
+        "success": True,
+    }
+    return f"2025-01-01 10:00:00 | audit.applications | INFO | {json.dumps(data)}\n"
+
+
+def test_history_reads_legacy_json_lines(tmp_path, make_logger):
+    """Test lines written by json.dumps (spaced, ASCII-escaped) still match filters."""
+    (tmp_path / "logs").mkdir()
+    timestamp = datetime.now()
+    lines = [legacy_line(timestamp, user_id) for user_id in ("u1", "Zoë")]
+    (tmp_path / "logs" / "applications.log").write_text("".join(lines))
+
+    audit_logger = make_logger()
+
+    assert len(audit_logger.get_application_history()) == 2
+    assert len(audit_logger.get_application_history(user_id="u1")) == 1
+    assert len(audit_logger.get_application_history(user_id="Zoë")) == 1
+    assert len(audit_logger.get_application_history(platform="linkedin")) == 2
+
+
+def test_history_filters_current_lines(make_logger):
+    """Test records written by the logger itself are found by user and platform."""
+    audit_logger = make_logger()
+    log_application(audit_logger, user_id="u1", platform="linkedin")
+    log_application(audit_logger, user_id="Zoë", platform="indeed")
+
+    assert [
+        a["user_id"] for a in audit_logger.get_application_history(user_id="Zoë")
+    ] == ["Zoë"]
+    assert len(audit_logger.get_application_history(platform="linkedin")) == 1
+
+
+def test_history_stops_at_start_date(tmp_path, make_logger):
+    """Test the newest-first scan stops at the first record before start_date."""
+    (tmp_path / "logs").mkdir()
+    now = datetime.now()
+    # Out-of-order tail: the scan must not reach the first line
+    lines = [
+        legacy_line(now - timedelta(minutes=1), user_id="unreached"),
+        legacy_line(now - timedelta(days=3), user_id="old"),
+        legacy_line(now, user_id="new"),
+    ]
+    (tmp_path / "logs" / "applications.log").write_text("".join(lines))
+
+    audit_logger = make_logger()
+    history = audit_logger.get_application_history(start_date=now - timedelta(days=1))
+
+    assert [a["user_id"] for a in history] == ["new"]
+
+
+def test_rotation_at_max_bytes(tmp_path):
+    """Test the buffered handler rolls over once a record would pass maxBytes."""
+    log_file = tmp_path / "audit.log"
+    handler = BufferedRotatingFileHandler(
+        str(log_file), maxBytes=100, backupCount=2, encoding="utf-8"
+    )
+    try:
+        # Each formatted record is 40 bytes with its newline
+        for _ in range(3):
+            handler.emit(logging.makeLogRecord({"msg": "x" * 39}))
+    finally:
+        handler.close()
+
+    assert log_file.stat().st_size == 40
+    assert (tmp_path / "audit.log.1").stat().st_size == 80
+    assert not (tmp_path / "audit.log.2").exists()
+
+
+def test_flush_writes_queued_records(tmp_path, make_logger):
+    """Test flush() blocks until queued records are on disk."""
+    audit_logger = make_logger()
+    log_application(audit_logger)
+
+    audit_logger.flush()
+
+    assert '"user_id":"u1"' in (tmp_path / "logs" / "applications.log").read_text()
+
+
+def test_close_drains_queued_records(tmp_path, make_logger):
+    """Test close() writes pending records before stopping the writer thread."""
+    audit_logger = make_logger()
+    for _ in range(50):
+        log_application(audit_logger)
+
+    audit_logger.close()
+
+    lines = (tmp_path / "logs" / "applications.log").read_text().splitlines()
+    assert len(lines) == 50
+
+
+def test_stats_snapshot_round_trip(tmp_path, make_logger):
+    """Test counters persisted on close are restored by the next logger."""
+    audit_logger = make_logger()
+    log_application(audit_logger, platform="linkedin", score=0.8)
+    log_application(audit_logger, platform="indeed", score=0.6)
+    expected = audit_logger.get_statistics()
+    audit_logger.close()
+
+    # Without the log, the counters can only come from the snapshot
+    (tmp_path / "logs" / "applications.log").unlink()
+    restored = AuditLogger(str(tmp_path / "config.yaml"))
+    try:
+        stats = restored.get_statistics()
+    finally:
+        restored.close()
+
+    assert stats == expected
+    assert stats["total_applications"] == 2
+    assert stats["by_platform"] == {"linkedin": 1, "indeed": 1}
+    assert stats["average_match_score"] == 0.7
+
+
+def test_stats_replay_records_after_snapshot(tmp_path, make_logger):
+    """Test applications logged after the last snapshot are counted on restart."""
+    audit_logger = make_logger()
+    log_application(audit_logger)
+    log_application(audit_logger)
+    audit_logger._persist_stats()
+    log_application(audit_logger, platform="indeed")
+
+    # Simulate a crash: the third record is on disk but never snapshotted
+    audit_logger.flush()
+    audit_logger._stats_timer.cancel()
+    audit_logger._stats_timer = None
+    audit_logger.close()
+
+    restored = AuditLogger(str(tmp_path / "config.yaml"))
+    try:
+        stats = restored.get_statistics()
+    finally:
+        restored.close()
+
+    assert stats["total_applications"] == 3
+    assert stats["by_platform"] == {"linkedin": 2, "indeed": 1}
+
+
+def test_binary_records_round_trip(tmp_path, make_logger):
+    """Test msgpack audit logs are written to .mpk files and read back."""
+    pytest.importorskip("msgpack")
+    audit_logger = make_logger(record_format="binary")
+    log_application(audit_logger, user_id="u1", platform="linkedin")
+    log_application(audit_logger, user_id="Zoë", platform="indeed")
+
+    history = audit_logger.get_application_history()
+
+    assert [a["user_id"] for a in history] == ["u1", "Zoë"]
+    assert [
+        a["user_id"] for a in audit_logger.get_application_history(platform="indeed")
+    ] == ["Zoë"]
+    assert (tmp_path / "logs" / "applications.mpk").stat().st_size > 0
+    assert not (tmp_path / "logs" / "applications.log").exists()
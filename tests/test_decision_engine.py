@@ -3,7 +3,8 @@ Tests for DecisionEngine.
 """
 
 import pytest
-from datetime import datetime, timedelta
+import warnings
+from datetime import datetime, timedelta, timezone
 from core.decision_engine import DecisionEngine
 from core.config import Config
 
@@ -16,7 +17,7 @@ class TestDecisionEngine:
         """Create test config."""
         config = Config()
         # Override autonomous settings for testing
-        config.config_data["autonomous_mode"] = {
+        config.config["autonomous_mode"] = {
             "enabled": True,
             "min_score_auto_apply": 90,
             "trusted_platforms": ["linkedin", "greenhouse"],
@@ -35,7 +36,7 @@ class TestDecisionEngine:
         job = {
             "job_id": "job1",
             "match_score": 95,
-            "url": "https://linkedin.com/jobs/123",
+            "application_url": "https://linkedin.com/jobs/123",
             "title": "Software Engineer",
         }
 
@@ -51,7 +52,7 @@ class TestDecisionEngine:
         job = {
             "job_id": "job1",
             "match_score": 75,
-            "url": "https://linkedin.com/jobs/123",
+            "application_url": "https://linkedin.com/jobs/123",
             "title": "Software Engineer",
         }
 
@@ -65,7 +66,7 @@ class TestDecisionEngine:
         job = {
             "job_id": "job1",
             "match_score": 95,
-            "url": "https://unknown-site.com/jobs/123",
+            "application_url": "https://unknown-site.com/jobs/123",
             "title": "Software Engineer",
         }
 
@@ -79,7 +80,7 @@ class TestDecisionEngine:
         job = {
             "job_id": "job1",
             "match_score": 95,
-            "url": "https://linkedin.com/jobs/123",
+            "application_url": "https://linkedin.com/jobs/123",
             "title": "Software Engineer",
             "description": "Please provide a cover letter and portfolio",
         }
@@ -94,7 +95,7 @@ class TestDecisionEngine:
         job = {
             "job_id": "job1",
             "match_score": 95,
-            "url": "https://linkedin.com/jobs/123",
+            "application_url": "https://linkedin.com/jobs/123",
             "title": "Software Engineer",
         }
 
@@ -110,7 +111,7 @@ class TestDecisionEngine:
         job = {
             "job_id": "job1",
             "match_score": 95,
-            "url": "https://linkedin.com/jobs/123",
+            "application_url": "https://linkedin.com/jobs/123",
             "title": "Software Engineer",
         }
 
@@ -122,7 +123,7 @@ class TestDecisionEngine:
         should_apply, reason = engine.should_auto_apply("user1", job, {})
 
         assert not should_apply
-        assert "daily limit" in reason.lower()
+        assert "daily application limit" in reason.lower()
 
     def test_needs_human_review_low_confidence(self, engine):
         """Test human review for low confidence."""
@@ -151,21 +152,21 @@ class TestDecisionEngine:
                 "job_id": "job1",
                 "match_score": 85,
                 "posted_date": (datetime.now() - timedelta(days=5)).isoformat(),
-                "url": "https://linkedin.com/jobs/1",
+                "application_url": "https://linkedin.com/jobs/1",
                 "description": "Simple application",
             },
             {
                 "job_id": "job2",
                 "match_score": 95,
                 "posted_date": (datetime.now() - timedelta(days=1)).isoformat(),
-                "url": "https://greenhouse.io/jobs/2",
+                "application_url": "https://greenhouse.io/jobs/2",
                 "description": "Easy apply",
             },
             {
                 "job_id": "job3",
                 "match_score": 75,
                 "posted_date": (datetime.now() - timedelta(days=10)).isoformat(),
-                "url": "https://example.com/jobs/3",
+                "application_url": "https://example.com/jobs/3",
                 "description": "Complex requirements",
             },
         ]
@@ -178,6 +179,34 @@ class TestDecisionEngine:
         assert prioritized[0]["job_id"] == "job2"
         assert prioritized[0]["priority_score"] > prioritized[1]["priority_score"]
 
+    def test_prioritize_jobs_leaves_input_unchanged(self, engine):
+        """Test prioritization returns copies and parses timezone-aware dates."""
+        now = datetime.now(timezone.utc)
+        jobs = [
+            {"job_id": "old", "match_score": 80, "posted_date": "2020-01-01T00:00:00Z"},
+            {
+                "job_id": "new",
+                "match_score": 80,
+                "posted_date": now.isoformat().replace("+00:00", "Z"),
+            },
+            {
+                "job_id": "aware",
+                "match_score": 80,
+                "posted_date": now - timedelta(days=40),
+            },
+            {"job_id": "undated", "match_score": 80, "posted_date": None},
+        ]
+        originals = [dict(job) for job in jobs]
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            prioritized = engine.prioritize_jobs(jobs)
+
+        assert jobs == originals
+        assert prioritized[0]["job_id"] == "new"
+        assert prioritized[0]["priority_score"] > prioritized[1]["priority_score"]
+        assert {job["job_id"] for job in prioritized[1:]} == {"old", "aware", "undated"}
+
     def test_should_send_follow_up(self, engine):
         """Test follow-up timing logic."""
         # High priority - 7 days
@@ -187,9 +216,7 @@ class TestDecisionEngine:
             "applied_date": (datetime.now() - timedelta(days=8)).isoformat(),
         }
 
-        should_follow_up, reason = engine.should_send_follow_up(
-            high_priority_app, days=7
-        )
+        should_follow_up, reason = engine.should_send_follow_up(high_priority_app, 8)
         assert should_follow_up
 
         # Standard priority - 14 days
@@ -199,7 +226,7 @@ class TestDecisionEngine:
             "applied_date": (datetime.now() - timedelta(days=10)).isoformat(),
         }
 
-        should_follow_up, reason = engine.should_send_follow_up(standard_app, days=14)
+        should_follow_up, reason = engine.should_send_follow_up(standard_app, 10)
         assert not should_follow_up  # Not 14 days yet
 
     def test_select_application_strategy(self, engine):
@@ -207,7 +234,7 @@ class TestDecisionEngine:
         # High confidence job
         high_confidence_job = {
             "match_score": 95,
-            "url": "https://linkedin.com/jobs/1",
+            "application_url": "https://linkedin.com/jobs/1",
             "description": "Simple application",
         }
 
@@ -221,7 +248,7 @@ class TestDecisionEngine:
         # Low confidence job
         low_confidence_job = {
             "match_score": 70,
-            "url": "https://unknown.com/jobs/1",
+            "application_url": "https://unknown.com/jobs/1",
             "description": "Complex requirements with portfolio",
         }
 
@@ -239,6 +266,12 @@ class TestDecisionEngine:
             ("https://jobs.lever.co/company/789", "lever"),
             ("https://company.wd1.myworkdayjobs.com/careers", "workday"),
             ("https://example.com/careers", "unknown"),
+            # Several markers: the first platform in priority order wins
+            (
+                "https://boards.greenhouse.io/acme/jobs/1?src=https://linkedin.com",
+                "linkedin",
+            ),
+            ("https://jobs.lever.co/acme/1?via=workday", "lever"),
         ]
 
         for url, expected_platform in test_cases:
@@ -255,10 +288,10 @@ class TestDecisionEngine:
         ]
 
         for desc in complex_descriptions:
-            assert engine._has_complex_requirements(desc)
+            assert engine._has_complex_requirements({"description": desc})
 
         simple_desc = "Apply with your resume"
-        assert not engine._has_complex_requirements(simple_desc)
+        assert not engine._has_complex_requirements({"description": simple_desc})
 
     def test_sensitive_fields_detection(self, engine):
         """Test detection of sensitive form fields."""
@@ -0,0 +1,71 @@
+"""
+Unit tests for the embedding generator cache.
+"""
+
+import numpy as np
+import pytest
+from unittest.mock import patch
+
+import utils.embeddings
+from utils.embeddings import EmbeddingGenerator
+
+
+class FakeModel:
+    """Deterministic stand-in for a SentenceTransformer model."""
+
+    def __init__(self):
+        self.calls = []
+
+    def encode(
+        self, texts, batch_size=64, convert_to_numpy=True, normalize_embeddings=True
+    ):
+        self.calls.append(list(texts))
+        return np.array(
+            [[float(ord(text[0])), 1.0] for text in texts], dtype=np.float32
+        )
+
+
+@pytest.fixture
+def generator():
+    """Create an EmbeddingGenerator backed by the fake model."""
+    with patch("utils.embeddings.SentenceTransformer", return_value=FakeModel()):
+        return EmbeddingGenerator(device="cpu", quantize=False)
+
+
+def test_encode_reuses_cached_embeddings(generator):
+    """Test repeated texts are served from the cache."""
+    generator.encode(["a", "b"])
+    embeddings = generator.encode(["b", "c"])
+
+    assert generator.model.calls == [["a", "b"], ["c"]]
+    assert embeddings[0][0] == ord("b")
+    assert embeddings[1][0] == ord("c")
+
+
+def test_encode_evicts_without_losing_requested_keys(generator):
+    """Test misses that overflow the cache do not evict keys the same call reads."""
+    with patch.object(utils.embeddings, "EMBEDDING_CACHE_SIZE", 3):
+        generator.encode(["a", "b", "c"])
+        embeddings = generator.encode(["a", "d"])
+
+        assert [row[0] for row in embeddings] == [ord("a"), ord("d")]
+        assert len(generator._cache) == 3
+        # "b" was least recently used once "a" was read again
+        assert ("b", True) not in generator._cache
+        assert ("a", True) in generator._cache
+
+        embeddings = generator.encode(["e", "f", "g", "h"])
+        assert [row[0] for row in embeddings] == [ord(t) for t in "efgh"]
+        assert len(generator._cache) == 3
+
+
+def test_quantization_is_opt_in():
+    """Test the fp32 model is used unless quantization is requested."""
+    with patch(
+        "utils.embeddings.SentenceTransformer", return_value=FakeModel()
+    ), patch.object(EmbeddingGenerator, "_quantize") as quantize:
+        EmbeddingGenerator(device="cpu")
+        quantize.assert_not_called()
+
+        EmbeddingGenerator(device="cpu", quantize=True)
+        quantize.assert_called_once()
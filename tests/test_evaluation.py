@@ -2,10 +2,27 @@
 Evaluation metrics for the Job Application Agent system.
 """
 
+import numpy as np
 import pytest
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import FrozenSet, List, Dict, Any, Tuple
 from unittest.mock import Mock
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Below this many skills, building an automaton costs more than scanning the
+# document once per skill
+AHO_CORASICK_MIN_SKILLS = 8
+
+
+@lru_cache(maxsize=256)
+def _job_tokens(job_description: str) -> FrozenSet[str]:
+    """Tokenize a job description once; many documents share one job."""
+    return frozenset(job_description.lower().split())
+
 
 class EvaluationMetrics:
     """Evaluation metrics for job matching and document generation."""
@@ -57,6 +74,40 @@ class EvaluationMetrics:
             return 0.0
         return 2 * (precision * recall) / (precision + recall)
     
+    @staticmethod
+    def calculate_prf_batch(
+        true_positives: np.ndarray,
+        false_positives: np.ndarray,
+        false_negatives: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Calculate precision, recall and F1 for many evaluations at once.
+        
+        Useful for threshold sweeps or per-user evaluation, where calling
+        the scalar methods in a loop dominates the cost.
+        
+        Args:
+            true_positives: Array of true positive counts
+            false_positives: Array of false positive counts
+            false_negatives: Array of false negative counts
+            
+        Returns:
+            Tuple of (precision, recall, f1) arrays; zero denominators give 0.0
+        """
+        tp = np.asarray(true_positives, dtype=np.float64)
+        fp = np.asarray(false_positives, dtype=np.float64)
+        fn = np.asarray(false_negatives, dtype=np.float64)
+        
+        predicted = tp + fp
+        actual = tp + fn
+        precision = np.divide(tp, predicted, out=np.zeros_like(tp), where=predicted > 0)
+        recall = np.divide(tp, actual, out=np.zeros_like(tp), where=actual > 0)
+        
+        total = precision + recall
+        f1 = np.divide(
+            2 * precision * recall, total, out=np.zeros_like(tp), where=total > 0
+        )
+        return precision, recall, f1
+    
     @staticmethod
     def evaluate_matching(
         predicted_matches: List[Dict[str, Any]],
@@ -74,9 +125,15 @@ class EvaluationMetrics:
         predicted_ids = {match.get("job_id") for match in predicted_matches}
         ground_truth_set = set(ground_truth)
         
-        true_positives = len(predicted_ids & ground_truth_set)
-        false_positives = len(predicted_ids - ground_truth_set)
-        false_negatives = len(ground_truth_set - predicted_ids)
+        # Probe the larger set while iterating the smaller one; only the
+        # overlap size is needed, so no intersection set is built
+        if len(predicted_ids) <= len(ground_truth_set):
+            small, large = predicted_ids, ground_truth_set
+        else:
+            small, large = ground_truth_set, predicted_ids
+        true_positives = sum(1 for job_id in small if job_id in large)
+        false_positives = len(predicted_ids) - true_positives
+        false_negatives = len(ground_truth_set) - true_positives
         
         precision = EvaluationMetrics.calculate_precision(true_positives, false_positives)
         recall = EvaluationMetrics.calculate_recall(true_positives, false_negatives)
@@ -108,23 +165,38 @@ class EvaluationMetrics:
             Dictionary of quality metrics
         """
         document_lower = document.lower()
-        job_lower = job_description.lower()
+        tokens = document_lower.split()
+        doc_words = set(tokens)
         
-        # Skill coverage: how many required skills are mentioned
-        skills_mentioned = sum(
-            1 for skill in required_skills
-            if skill.lower() in document_lower
-        )
+        # Skill coverage: how many required skills appear anywhere in the
+        # document as a substring, so "python" also counts "python3" and
+        # "node" counts "node.js"
+        lowered_skills = [skill.lower() for skill in required_skills]
+        if ahocorasick is not None and len(lowered_skills) >= AHO_CORASICK_MIN_SKILLS:
+            # One pass over the document finds every skill, overlaps included
+            automaton = ahocorasick.Automaton()
+            for skill in lowered_skills:
+                automaton.add_word(skill, skill)
+            automaton.make_automaton()
+            found = {skill for _, skill in automaton.iter(document_lower)}
+            skills_mentioned = sum(1 for skill in lowered_skills if skill in found)
+        else:
+            skills_mentioned = sum(
+                1 for skill in lowered_skills if skill in document_lower
+            )
         skill_coverage = skills_mentioned / len(required_skills) if required_skills else 0.0
         
         # Relevance: keyword overlap
-        job_words = set(job_lower.split())
-        doc_words = set(document_lower.split())
-        common_words = job_words & doc_words
-        relevance = len(common_words) / len(job_words) if job_words else 0.0
+        job_words = _job_tokens(job_description)
+        if len(job_words) <= len(doc_words):
+            small, large = job_words, doc_words
+        else:
+            small, large = doc_words, job_words
+        common_words = sum(1 for word in small if word in large)
+        relevance = common_words / len(job_words) if job_words else 0.0
         
         # Length check (not too short, not too long)
-        word_count = len(document.split())
+        word_count = len(tokens)
         length_score = 1.0 if 100 <= word_count <= 1000 else 0.5
         
         return {
@@ -153,6 +225,53 @@ def test_f1_score_calculation():
     assert f1 == 0.8
 
 
+def test_prf_batch_matches_scalar():
+    """Test batch precision/recall/F1 agree with the scalar methods."""
+    tp = [8, 0, 5, 0]
+    fp = [2, 0, 5, 3]
+    fn = [2, 4, 0, 0]
+    
+    precision, recall, f1 = EvaluationMetrics.calculate_prf_batch(tp, fp, fn)
+    
+    for i in range(len(tp)):
+        p = EvaluationMetrics.calculate_precision(tp[i], fp[i])
+        r = EvaluationMetrics.calculate_recall(tp[i], fn[i])
+        assert precision[i] == pytest.approx(p)
+        assert recall[i] == pytest.approx(r)
+        assert f1[i] == pytest.approx(EvaluationMetrics.calculate_f1_score(p, r))
+
+
+def test_document_quality_many_phrase_skills():
+    """Test phrase skill matching when many multi-word skills are given."""
+    document = (
+        "Experienced in machine learning, deep learning and natural language "
+        "processing. Built data pipelines and REST APIs on Google Cloud."
+    )
+    required_skills = [
+        "Machine Learning", "Deep Learning", "Natural Language Processing",
+        "Data Pipelines", "REST APIs", "Google Cloud", "Computer Vision",
+        "Reinforcement Learning", "Distributed Systems", "Python"
+    ]
+    
+    metrics = EvaluationMetrics.evaluate_document_quality(
+        document, "", required_skills
+    )
+    
+    assert metrics["skill_coverage"] == pytest.approx(6 / 10)
+
+
+def test_document_quality_matches_skill_substrings():
+    """Test skills count when they appear inside longer tokens."""
+    document = "Shipped python3 services on node.js and some javascript."
+    required_skills = ["Python", "Node", "Java", "Rust"]
+    
+    metrics = EvaluationMetrics.evaluate_document_quality(
+        document, "", required_skills
+    )
+    
+    assert metrics["skill_coverage"] == pytest.approx(3 / 4)
+
+
 def test_matching_evaluation():
     """Test matching evaluation."""
     predicted = [
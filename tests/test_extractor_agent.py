@@ -4,21 +4,7 @@ Unit tests for Extractor Agent.
 
 import pytest
 from unittest.mock import Mock
-from agents.extractor_agent import ExtractorAgent
-from graph.memory import GraphMemory
-from llm.llama_client import LLMClient
-
-
-@pytest.fixture
-def mock_graph_memory():
-    """Create a mock GraphMemory instance."""
-    return Mock(spec=GraphMemory)
-
-
-@pytest.fixture
-def mock_llm_client():
-    """Create a mock LLMClient instance."""
-    return Mock(spec=LLMClient)
+from agents.extractor_agent import ExtractorAgent, JOB_INFO_SCHEMA
 
 
 @pytest.fixture
@@ -59,6 +45,29 @@ def test_extract_job_info(extractor_agent, mock_graph_memory, mock_llm_client):
     assert "required_skills" in result
 
 
+def test_extract_batch(extractor_agent, mock_graph_memory, mock_llm_client):
+    """Test batched extraction sends one LLM batch and skips failures."""
+    mock_graph_memory.get_jobs_bulk.return_value = {
+        job_id: {"job_id": job_id, "description": f"Role {job_id}"}
+        for job_id in ("job1", "job2")
+    }
+    mock_llm_client.generate_json_batch.return_value = [
+        {"required_skills": ["Python"], "experience_level": "mid"},
+        {"error": "Failed to parse JSON"},
+    ]
+    mock_graph_memory.create_skill.return_value = "skill_123"
+    
+    results = extractor_agent.extract_batch(["job1", "missing", "job2"], max_concurrency=4)
+    
+    mock_graph_memory.get_jobs_bulk.assert_called_once_with(["job1", "missing", "job2"])
+    mock_llm_client.generate_json_batch.assert_called_once()
+    assert mock_llm_client.generate_json_batch.call_args.kwargs["schema"] == JOB_INFO_SCHEMA
+    prompts = mock_llm_client.generate_json_batch.call_args.args[0]
+    assert len(prompts) == 2
+    assert list(results) == ["job1"]
+    assert results["job1"]["required_skills"] == ["Python"]
+
+
 def test_extract_skills_only(extractor_agent, mock_llm_client):
     """Test skills-only extraction."""
     mock_llm_client.generate_json.return_value = ["Python", "Django", "PostgreSQL"]
@@ -2,9 +2,12 @@
 Integration tests for the Job Application Agent system.
 """
 
+import asyncio
 import pytest
+from contextlib import ExitStack
 from unittest.mock import Mock, patch
-from workflow.job_application_graph import JobApplicationGraph
+from agents.matcher_agent import MatcherAgent
+from workflow.job_application_graph import JobApplicationGraph, _rank_jobs_by_keywords
 from core.config import Config
 
 
@@ -33,10 +36,16 @@ def mock_config():
     return config
 
 
-@patch('workflow.job_application_graph.GraphMemory')
-@patch('workflow.job_application_graph.create_llm_client')
-@patch('workflow.job_application_graph.EmbeddingGenerator')
-def test_workflow_initialization(mock_embedding, mock_llm, mock_graph, mock_config):
+@pytest.fixture(autouse=True, scope="module")
+def patched_components():
+    """Patch out Neo4j, LLM and embedding setup once for all tests."""
+    with ExitStack() as stack:
+        for target in ("GraphMemory", "create_llm_client", "EmbeddingGenerator"):
+            stack.enter_context(patch(f"workflow.job_application_graph.{target}"))
+        yield
+
+
+def test_workflow_initialization(mock_config):
     """Test workflow initialization."""
     workflow = JobApplicationGraph(mock_config)
     
@@ -48,10 +57,17 @@ def test_workflow_initialization(mock_embedding, mock_llm, mock_graph, mock_conf
     assert workflow.tracker_agent is not None
 
 
-@patch('workflow.job_application_graph.GraphMemory')
-@patch('workflow.job_application_graph.create_llm_client')
-@patch('workflow.job_application_graph.EmbeddingGenerator')
-def test_search_jobs(mock_embedding, mock_llm, mock_graph, mock_config):
+def test_compiled_graph_shared_between_instances(mock_config):
+    """Test workflows reuse one compiled graph bound to their own instance."""
+    first = JobApplicationGraph(mock_config)
+    second = JobApplicationGraph(mock_config)
+    
+    assert first.graph.builder is second.graph.builder
+    assert first.graph.config["configurable"]["workflow"] is first
+    assert second.graph.config["configurable"]["workflow"] is second
+
+
+def test_search_jobs(mock_config):
     """Test job search functionality."""
     workflow = JobApplicationGraph(mock_config)
     
@@ -66,20 +82,159 @@ def test_search_jobs(mock_embedding, mock_llm, mock_graph, mock_config):
     assert jobs[0]["job_id"] == "test1"
 
 
-@patch('workflow.job_application_graph.GraphMemory')
-@patch('workflow.job_application_graph.create_llm_client')
-@patch('workflow.job_application_graph.EmbeddingGenerator')
-def test_get_matches(mock_embedding, mock_llm, mock_graph, mock_config):
+def test_get_matches(mock_config):
     """Test job matching functionality."""
     workflow = JobApplicationGraph(mock_config)
     
-    # Mock matcher agent
-    workflow.matcher_agent.match_jobs = Mock(return_value=[
-        {"job_id": "test1", "match_score": 0.9, "job": {"title": "Test Job"}}
-    ])
-    
-    matches = workflow.get_matches("user1")
+    # Autospec keeps the mocks in step with MatcherAgent's real signatures
+    with patch.object(MatcherAgent, "score_all_jobs", autospec=True,
+                      return_value={"scored": 1}) as score_all_jobs, \
+         patch.object(MatcherAgent, "get_ranked_jobs", autospec=True, return_value=[
+             {"job_id": "test1", "match_score": 90, "title": "Test Job"}
+         ]):
+        matches = workflow.get_matches("user1")
     
     assert len(matches) > 0
-    assert matches[0]["match_score"] == 0.9
+    assert matches[0]["match_score"] == 90
+    score_all_jobs.assert_called_once_with(workflow.matcher_agent, "user1", job_ids=None)
+
+
+def test_extractor_node_batches_jobs(mock_config):
+    """Test extractor node hands all job IDs to one batched extraction."""
+    workflow = JobApplicationGraph(mock_config)
+    workflow.extractor_agent.extract_batch = Mock(return_value={
+        "job1": {"job_id": "job1"},
+        "job3": {"job_id": "job3"},
+    })
+    workflow.config = Mock(spec=Config)
+    workflow.config.get.return_value = 4
+    
+    state = workflow._extractor_node({
+        "jobs": [{"job_id": "job1"}, {"job_id": "job2"}, {"title": "No ID"}, {"job_id": "job3"}]
+    })
+    
+    assert state["extracted_data"] == {
+        "job1": {"job_id": "job1"},
+        "job3": {"job_id": "job3"},
+    }
+    workflow.extractor_agent.extract_batch.assert_called_once_with(
+        ["job1", "job2", "job3"], max_concurrency=4
+    )
+    workflow.config.get.assert_called_with("extractor.concurrency", 8)
+
+
+def test_workflow_runs_extractor_and_matcher_branches(mock_config):
+    """Test extractor and matcher results both reach the final state."""
+    with patch.object(mock_config, "get", side_effect=lambda key, default=None: default):
+        workflow = JobApplicationGraph(mock_config)
+    
+    assert "join" in workflow.graph.get_graph().nodes
+    
+    workflow.scout_agent.search_and_store = Mock(return_value=[{"job_id": "job1"}])
+    workflow.extractor_agent.extract_batch = Mock(return_value={"job1": {"required_skills": ["Python"]}})
+    
+    with patch.object(MatcherAgent, "score_all_jobs", autospec=True,
+                      return_value={"scored": 1}) as score_all_jobs, \
+         patch.object(MatcherAgent, "get_ranked_jobs", autospec=True,
+                      return_value=[{"job_id": "job1", "match_score": 90}]):
+        final_state = workflow.run("user1", "python developer")
+    
+    assert final_state["error"] is None
+    assert final_state["extracted_data"] == {"job1": {"required_skills": ["Python"]}}
+    assert final_state["matches"] == [{"job_id": "job1", "match_score": 90}]
+    assert final_state["job_ids"] == ["job1"]
+    assert final_state["match_score_by_id"] == {"job1": 90}
+    score_all_jobs.assert_called_once_with(workflow.matcher_agent, "user1", job_ids=["job1"])
+
+
+def test_workflow_arun(mock_config):
+    """Test the async entry point runs the graph with ainvoke."""
+    workflow = JobApplicationGraph(mock_config)
+    workflow.scout_agent.search_and_store = Mock(return_value=[])
+    
+    final_state = asyncio.run(workflow.arun("user1", "python developer"))
+    
+    assert final_state["jobs"] == []
+    workflow.scout_agent.search_and_store.assert_called_once()
+
 
+def test_writer_node_generates_documents_in_one_call(mock_config):
+    """Test writer node stores the combined documents from the writer agent."""
+    workflow = JobApplicationGraph(mock_config)
+    
+    documents = {"cover_letter": "Dear team", "resume": "SUMMARY"}
+    workflow.writer_agent.generate_all_documents = Mock(return_value=documents)
+    
+    state = workflow._writer_node({"user_id": "user1", "selected_job_id": "job1"})
+    
+    assert state["documents"] == documents
+    workflow.writer_agent.generate_all_documents.assert_called_once_with("user1", "job1")
+
+
+def test_rank_jobs_by_keywords_keeps_top_k():
+    """Test scout results are cut to the jobs most relevant to the keywords."""
+    jobs = [
+        {"job_id": "job1", "title": "Accountant", "description": "Ledgers and audits"},
+        {"job_id": "job2", "title": "Python Developer", "description": "Python APIs"},
+        {"job_id": "job3", "title": "Developer", "description": "Java services"},
+    ]
+    
+    ranked = _rank_jobs_by_keywords(jobs, "python developer", top_k=2)
+    
+    assert [job["job_id"] for job in ranked] == ["job2", "job3"]
+    assert _rank_jobs_by_keywords(jobs, "python developer", top_k=0) == jobs
+
+
+def test_workflow_astream_streams_cover_letter(mock_config):
+    """Test cover letter chunks are streamed before the final document update."""
+    workflow = JobApplicationGraph(mock_config)
+    workflow.scout_agent.search_and_store = Mock(return_value=[])
+    workflow.writer_agent.stream_cover_letter = Mock(return_value=iter(["Dear ", "team"]))
+    workflow.writer_agent.generate_resume_summary = Mock(return_value="Seasoned engineer.")
+    workflow.writer_agent.generate_tailored_resume = Mock(return_value="SUMMARY")
+    workflow.tracker_agent.create_application = Mock(return_value="app1")
+    
+    async def collect():
+        return [event async for event in workflow.astream("user1", "python", selected_job_id="job1")]
+    
+    events = asyncio.run(collect())
+    
+    chunks = [data["documents"]["cover_letter"] for mode, data in events if mode == "custom"]
+    writer_updates = [data["writer"] for mode, data in events if mode == "updates" and "writer" in data]
+    assert chunks == ["Dear ", "team"]
+    assert writer_updates[0]["documents"] == {
+        "cover_letter": "Dear team",
+        "resume_summary": "Seasoned engineer.",
+        "resume": "SUMMARY",
+    }
+
+
+def test_components_created_on_first_use(mock_config):
+    """Test search_jobs builds the scout without loading the embedding model."""
+    workflow = JobApplicationGraph(mock_config)
+    assert "embedding_generator" not in vars(workflow)
+    
+    with patch("workflow.job_application_graph.ScoutAgent") as scout_cls:
+        workflow.search_jobs("python developer")
+    
+    scout_cls.return_value.search_and_store.assert_called_once()
+    assert "graph_memory" in vars(workflow)
+    assert "embedding_generator" not in vars(workflow)
+    assert "llm_client" not in vars(workflow)
+
+
+def test_tracker_node_uses_match_score_lookup(mock_config):
+    """Test tracker node records the selected job's score from the matcher lookup."""
+    workflow = JobApplicationGraph(mock_config)
+    workflow.tracker_agent.create_application = Mock(return_value="app1")
+    
+    state = workflow._tracker_node({
+        "user_id": "user1",
+        "selected_job_id": "job2",
+        "match_score_by_id": {"job1": 0.9, "job2": 0.7},
+    })
+    
+    assert state["application_id"] == "app1"
+    workflow.tracker_agent.create_application.assert_called_once_with(
+        user_id="user1", job_id="job2", match_score=0.7
+    )
@@ -0,0 +1,83 @@
+"""
+Unit tests for the unified LLM client.
+"""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from llm.llm_client import LLMClient
+
+
+def make_client(provider, lines):
+    """Create an LLMClient whose streaming response yields the given lines."""
+    client = LLMClient({"provider": provider, "api_key": "test"})
+    response = MagicMock()
+    response.iter_lines.return_value = iter(lines)
+    client.session = MagicMock()
+    client.session.post.return_value.__enter__.return_value = response
+    return client
+
+
+def ollama_line(text, done=False):
+    """Encode one Ollama streaming record."""
+    return json.dumps({"response": text, "done": done}).encode()
+
+
+def sse_line(text):
+    """Encode one OpenAI-compatible server-sent event."""
+    event = {"choices": [{"delta": {"content": text}}]}
+    return b"data: " + json.dumps(event).encode()
+
+
+def test_stream_ollama_until_done():
+    """Test an Ollama stream ending with a done record completes normally."""
+    client = make_client(
+        "ollama", [ollama_line("Dear "), ollama_line("team", done=True)]
+    )
+
+    assert list(client.generate_stream("prompt")) == ["Dear ", "team"]
+
+
+def test_stream_sse_until_done_marker():
+    """Test an SSE stream ending with [DONE] completes normally."""
+    client = make_client("groq", [sse_line("Dear "), sse_line("team"), b"data: [DONE]"])
+
+    assert list(client.generate_stream("prompt")) == ["Dear ", "team"]
+
+
+@pytest.mark.parametrize(
+    "provider, lines",
+    [
+        ("ollama", [ollama_line("Dear ")]),
+        ("groq", [sse_line("Dear ")]),
+    ],
+)
+def test_stream_raises_when_cut_short(provider, lines):
+    """Test a stream without its completion marker raises after its chunks."""
+    client = make_client(provider, lines)
+    chunks = []
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        for chunk in client.generate_stream("prompt"):
+            chunks.append(chunk)
+
+    assert chunks == ["Dear "]
+
+
+def test_stream_reraises_request_errors():
+    """Test connection errors part way through reach the caller."""
+
+    def dropped():
+        yield ollama_line("Dear ")
+        raise requests.exceptions.ChunkedEncodingError("connection reset")
+
+    client = make_client("ollama", [])
+    client.session.post.return_value.__enter__.return_value.iter_lines.return_value = (
+        dropped()
+    )
+
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        list(client.generate_stream("prompt"))
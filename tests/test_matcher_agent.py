@@ -3,29 +3,11 @@ Unit tests for Matcher Agent.
 """
 
 import pytest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 from agents.matcher_agent import MatcherAgent
+from core.config import Config
+from core.user_profile import UserProfile
 from graph.memory import GraphMemory
-from llm.llama_client import LLMClient
-from utils.embeddings import EmbeddingGenerator
-
-
-@pytest.fixture
-def mock_graph_memory():
-    """Create a mock GraphMemory instance."""
-    return Mock(spec=GraphMemory)
-
-
-@pytest.fixture
-def mock_llm_client():
-    """Create a mock LLMClient instance."""
-    return Mock(spec=LLMClient)
-
-
-@pytest.fixture
-def mock_embedding_generator():
-    """Create a mock EmbeddingGenerator instance."""
-    return Mock(spec=EmbeddingGenerator)
 
 
 @pytest.fixture
@@ -77,3 +59,61 @@ def test_get_missing_skills(matcher_agent):
     assert len(missing) >= 1
     assert "React" in missing or "react" in [s.lower() for s in missing]
 
+
+@pytest.fixture
+def scoring_agent():
+    """Create a MatcherAgent wired to mock storage, profile and LLM."""
+    graph_memory = Mock(spec=GraphMemory)
+    user_profile = Mock(spec=UserProfile)
+    user_profile.get_profile.return_value = {"user_id": "user1", "skills": ["Python"]}
+    with patch("agents.matcher_agent.LLMClient") as llm_client_class:
+        llm_client_class.return_value.is_available.return_value = True
+        yield MatcherAgent(graph_memory, Mock(spec=Config), user_profile)
+
+
+def test_score_all_jobs_only_scores_cache_misses(scoring_agent):
+    """Test jobs with a score stored for the same profile skip the LLM."""
+    graph_memory = scoring_agent.graph_memory
+    graph_memory.get_jobs_bulk.return_value = {
+        "job1": {"job_id": "job1", "title": "Python Developer"},
+        "job2": {"job_id": "job2", "title": "Data Engineer"},
+    }
+    # First query reads the cached scores; later ones store new scores
+    graph_memory.query.side_effect = [[{"job_id": "job1", "match_score": 80}], []]
+    
+    with patch.object(MatcherAgent, "_score_job", autospec=True,
+                      return_value={"score": 70, "reason": "Good fit"}) as score_job:
+        stats = scoring_agent.score_all_jobs("user1", job_ids=["job1", "job2"])
+    
+    scored_job_ids = [call.args[2]["job_id"] for call in score_job.call_args_list]
+    assert scored_job_ids == ["job2"]
+    assert stats["cached"] == 1
+    assert stats["scored"] == 1
+    assert stats["total_jobs"] == 2
+    assert stats["average_score"] == 75
+    
+    cache_params = graph_memory.query.call_args_list[0].args[1]
+    assert cache_params["job_ids"] == ["job1", "job2"]
+    assert cache_params["profile_hash"] == MatcherAgent._profile_hash(
+        {"user_id": "user1", "skills": ["Python"]}
+    )
+
+
+def test_score_all_jobs_loads_requested_jobs_in_one_query(scoring_agent):
+    """Test requested jobs are fetched with get_jobs_bulk in request order."""
+    graph_memory = scoring_agent.graph_memory
+    graph_memory.get_jobs_bulk.return_value = {
+        "job2": {"job_id": "job2", "title": "Data Engineer"},
+        "job1": {"job_id": "job1", "title": "Python Developer"},
+    }
+    graph_memory.query.return_value = []
+    
+    with patch.object(MatcherAgent, "_score_job", autospec=True,
+                      return_value={"score": 70}) as score_job, patch("time.sleep"):
+        stats = scoring_agent.score_all_jobs("user1", job_ids=["job1", "missing", "job2"])
+    
+    graph_memory.get_jobs_bulk.assert_called_once_with(["job1", "missing", "job2"])
+    graph_memory.get_job.assert_not_called()
+    scored_job_ids = [call.args[2]["job_id"] for call in score_job.call_args_list]
+    assert scored_job_ids == ["job1", "job2"]
+    assert stats["scored"] == 2
@@ -5,16 +5,9 @@ Unit tests for Scout Agent.
 import pytest
 from unittest.mock import Mock, patch
 from agents.scout_agent import ScoutAgent
-from graph.memory import GraphMemory
 from core.config import Config
 
 
-@pytest.fixture
-def mock_graph_memory():
-    """Create a mock GraphMemory instance."""
-    return Mock(spec=GraphMemory)
-
-
 @pytest.fixture
 def mock_config():
     """Create a mock Config instance."""
@@ -0,0 +1,48 @@
+"""
+Unit tests for Tracker Agent.
+"""
+
+import asyncio
+import pytest
+from agents.tracker_agent import TrackerAgent
+
+
+@pytest.fixture
+def tracker_agent(mock_graph_memory):
+    """Create a TrackerAgent instance."""
+    return TrackerAgent(mock_graph_memory)
+
+
+def test_create_bulk_request_writes_once(tracker_agent, mock_graph_memory):
+    """Test a create_bulk request creates every application with one write."""
+
+    def linked(user_id, applications):
+        # Only job1 exists in the graph
+        return [
+            app["application_id"] for app in applications if app["job_id"] == "job1"
+        ]
+
+    mock_graph_memory.create_applications_bulk.side_effect = linked
+
+    response = asyncio.run(
+        tracker_agent._handle_data_request(
+            {
+                "action": "create_bulk",
+                "user_id": "user1",
+                "jobs": [{"job_id": "job1", "match_score": 80}, {"job_id": "missing"}],
+            }
+        )
+    )
+
+    assert response["status"] == "success"
+    assert list(response["application_ids"]) == ["job1"]
+    assert response["application_ids"]["job1"].startswith("app_user1_job1_")
+
+    mock_graph_memory.create_applications_bulk.assert_called_once()
+    user_id, applications = mock_graph_memory.create_applications_bulk.call_args.args
+    assert user_id == "user1"
+    assert [app["job_id"] for app in applications] == ["job1", "missing"]
+    assert applications[0]["match_score"] == 80
+    assert "match_score" not in applications[1]
+    assert all(app["status"] == "pending" for app in applications)
+    mock_graph_memory.create_application.assert_not_called()
@@ -0,0 +1,101 @@
+"""
+Unit tests for Writer Agent.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from agents.writer_agent import WriterAgent
+from core.config import Config
+from core.user_profile import UserProfile
+from graph.memory import GraphMemory
+
+MATCH_INSIGHTS = {"score": 80, "strengths": ["Python"], "concerns": []}
+
+
+@pytest.fixture
+def writer_agent():
+    """Create a WriterAgent with mock storage and LLM and no disk cache."""
+    graph_memory = Mock(spec=GraphMemory)
+    graph_memory.get_job.return_value = {"job_id": "job1", "title": "Engineer"}
+    user_profile = Mock(spec=UserProfile)
+    user_profile.get_profile.return_value = {"user_id": "user1", "name": "Ada"}
+    user_profile.get_resume.return_value = "Resume"
+    with patch("agents.writer_agent.LLMClient"), patch(
+        "agents.writer_agent.diskcache", None
+    ):
+        yield WriterAgent(graph_memory, Mock(spec=Config), user_profile)
+
+
+def stream(writer_agent):
+    """Collect a streamed cover letter for the fixture's user and job."""
+    return list(
+        writer_agent.stream_cover_letter("user1", "job1", match_insights=MATCH_INSIGHTS)
+    )
+
+
+def test_stream_cover_letter_caches_complete_letter(writer_agent):
+    """Test a finished stream is cached and served whole next time."""
+    writer_agent.llm_client.generate_stream.return_value = iter([" Dear ", "team"])
+
+    assert stream(writer_agent) == ["Dear ", "team"]
+    assert stream(writer_agent) == ["Dear team"]
+    writer_agent.llm_client.generate_stream.assert_called_once()
+
+
+def test_stream_cover_letter_does_not_cache_failed_stream(writer_agent):
+    """Test a stream that drops part way through leaves the cache empty."""
+
+    def dropped(prompt):
+        yield "Dear "
+        raise requests.exceptions.ConnectionError("connection reset")
+
+    writer_agent.llm_client.generate_stream.side_effect = dropped
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        stream(writer_agent)
+
+    assert len(writer_agent._cache) == 0
+
+
+def test_generate_all_documents_parses_resume_summary(writer_agent):
+    """Test the combined call returns the cover letter, summary and resume."""
+    writer_agent.llm_client.generate_json.return_value = {
+        "cover_letter": " Dear team ",
+        "resume_summary": "Seasoned engineer.",
+        "resume": "SUMMARY",
+    }
+
+    documents = writer_agent.generate_all_documents(
+        "user1", "job1", match_insights=MATCH_INSIGHTS
+    )
+
+    assert documents == {
+        "cover_letter": "Dear team",
+        "resume_summary": "Seasoned engineer.",
+        "resume": "SUMMARY",
+    }
+    prompt = writer_agent.llm_client.generate_json.call_args.args[0]
+    assert '"resume_summary"' in prompt
+    writer_agent.llm_client.generate.assert_not_called()
+
+
+def test_generate_all_documents_backfills_missing_summary(writer_agent):
+    """Test a summary missing from the combined response is generated on its own."""
+    writer_agent.llm_client.generate_json.return_value = {
+        "cover_letter": "Dear team",
+        "resume": "SUMMARY",
+    }
+    writer_agent.llm_client.generate.return_value = " Seasoned engineer. "
+    writer_agent.user_profile.get_skills.return_value = [{"name": "Python"}]
+
+    documents = writer_agent.generate_all_documents(
+        "user1", "job1", match_insights=MATCH_INSIGHTS
+    )
+
+    assert documents["resume_summary"] == "Seasoned engineer."
+    prompt = writer_agent.llm_client.generate.call_args.args[0]
+    assert "professional summary" in prompt
+    assert "Python" in prompt
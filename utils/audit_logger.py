@@ -13,14 +13,241 @@ This module provides structured logging for all autonomous operations:
 Each log category is stored in separate files for easy filtering and analysis.
 """
 
-import logging
+import atexit
+import functools
 import json
-from datetime import datetime
+import logging
+import mmap
+import os
+import queue
+import re
+import threading
+from collections import defaultdict
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-from logging.handlers import RotatingFileHandler
+from typing import Callable, Dict, Iterator, List, Any, Optional, Sequence, Tuple
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+import orjson
 import yaml
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Keys whose values are redacted unless audit.include_sensitive is set
+_SENSITIVE_KEY_RE = re.compile(
+    r"password|api_key|token|secret|salary|ssn|email|phone", re.IGNORECASE
+)
+_REDACTED = "***REDACTED***"
+_PRIMITIVES = (str, int, float, bool, type(None))
+
+# Event type (as named under audit.log_events) -> log category and level
+_EVENT_CATEGORIES = {
+    "job_searches": ("autonomous", logging.INFO),
+    "extractions": ("autonomous", logging.INFO),
+    "scoring": ("autonomous", logging.INFO),
+    "cycle_summary": ("autonomous", logging.INFO),
+    "documents": ("documents", logging.INFO),
+    "applications": ("applications", logging.INFO),
+    "decisions": ("decisions", logging.INFO),
+    "rate_limits": ("rate_limits", logging.INFO),
+    "errors": ("errors", logging.ERROR),
+}
+
+# libyaml's C loader when available, otherwise the pure-Python one
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# How often the application counters are snapshotted, and how long they are kept
+STATS_PERSIST_INTERVAL = 30.0
+STATS_RETENTION_DAYS = 365
+
+
+def _dumps(data: Dict) -> str:
+    """Serialize an audit event to a JSON line.
+
+    orjson writes datetime values in ISO 8601 format, matching the
+    isoformat() strings previously stored.
+    """
+    return orjson.dumps(data).decode()
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, mtime: float) -> Dict:
+    """Parse a YAML config once per (path, modification time)."""
+    with open(config_path, "r") as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
+def _msgpack_default(obj: Any) -> str:
+    """Encode values msgpack can't pack natively, datetimes as ISO 8601."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
+
+def _new_stats_bucket() -> Dict[str, Any]:
+    """Empty per-day application counters."""
+    return {
+        "total_applications": 0,
+        "successful_applications": 0,
+        "auto_applied": 0,
+        "score_sum": 0.0,
+        "by_platform": {},
+    }
+
+
+def _field_needles(key: str, value: Any) -> Tuple[bytes, ...]:
+    """
+    Byte forms a serialized "key": value pair can take in a log line.
+
+    Current lines are written by orjson ("key":"value", raw UTF-8); lines
+    from older releases used json.dumps ("key": "value", ASCII escapes).
+    """
+    return (
+        b'"' + key.encode() + b'":' + orjson.dumps(value),
+        b'"' + key.encode() + b'": ' + json.dumps(value).encode(),
+    )
+
+
+def _read_lines_reversed(path: str) -> Iterator[bytes]:
+    """Yield the non-empty lines of a file, last line first.
+
+    The file is memory-mapped and walked backwards with rfind, so callers
+    that stop early only touch the tail pages they consume and lines are
+    never decoded to text.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = len(mm)
+            while end > 0:
+                start = mm.rfind(b"\n", 0, end) + 1
+                if start < end:
+                    yield mm[start:end]
+                end = start - 1
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that buffers writes and tracks file size in memory.
+
+    The stock handler flushes after every record and checks the rollover
+    threshold with a seek/tell per record. Here records go through a 64 KB
+    write buffer that is flushed at most ``flush_interval`` seconds after
+    the first unflushed write, and rollover is decided from a running byte
+    count.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        maxBytes: int = 0,
+        backupCount: int = 0,
+        encoding: Optional[str] = None,
+        buffer_size: int = 65536,
+        flush_interval: float = 0.2,
+        mode: str = "a",
+    ):
+        """
+        Args:
+            filename: Path to the log file
+            maxBytes: Rotate once the file would exceed this size (0 disables)
+            backupCount: Number of rotated files to keep
+            encoding: Text encoding for the log file
+            buffer_size: Size of the write buffer in bytes
+            flush_interval: Maximum seconds a record may sit in the buffer
+            mode: File open mode ("a" for text, "ab" for binary records)
+        """
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._bytes_written = 0
+        self._flush_timer: Optional[threading.Timer] = None
+        super().__init__(
+            filename,
+            maxBytes=maxBytes,
+            backupCount=backupCount,
+            encoding=encoding,
+            delay=True,
+        )
+        # RotatingFileHandler forces text append mode whenever maxBytes is set
+        self.mode = mode
+        if "b" in mode:
+            self.encoding = self.errors = None
+        self.stream = self._open()
+
+    def _open(self):
+        stream = open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+        self._bytes_written = os.path.getsize(self.baseFilename)
+        return stream
+
+    def shouldRollover(self, record: logging.LogRecord, size: int = 0) -> bool:
+        return self.maxBytes > 0 and self._bytes_written + size > self.maxBytes
+
+    def doRollover(self):
+        super().doRollover()
+        if self.stream is None:
+            self._bytes_written = 0
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            payload = getattr(record, "payload", None)
+            if payload is not None:
+                # Pre-serialized binary record, written as is
+                data = payload
+                size = len(payload)
+            else:
+                data = self.format(record) + self.terminator
+                size = len(data.encode(self.encoding or "utf-8"))
+            if self._bytes_written and self.shouldRollover(record, size):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+
+            self.stream.write(data)
+            self._bytes_written += size
+
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        self.acquire()
+        try:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            super().flush()
+        finally:
+            self.release()
+
+
+class _CategoryDispatchHandler(logging.Handler):
+    """Route queued audit records to the file handler for their category."""
+
+    def __init__(self, handlers: Dict[str, logging.Handler]):
+        """
+        Args:
+            handlers: File handlers keyed by logger name (e.g. "audit.errors")
+        """
+        super().__init__()
+        self.handlers = handlers
+
+    def emit(self, record: logging.LogRecord):
+        handler = self.handlers.get(record.name)
+        if handler is not None:
+            handler.handle(record)
+
 
 class AuditLogger:
     """
@@ -45,27 +272,59 @@ class AuditLogger:
         self.audit_config = self.config.get("audit", {})
         self.enabled = self.audit_config.get("enabled", True)
 
+        # "json" writes formatted text lines, "binary" writes msgpack records
+        self.binary = self.audit_config.get("record_format", "json") == "binary"
+        if self.binary and msgpack is None:
+            print(
+                "Warning: msgpack not installed, writing JSON audit logs. "
+                "Install with: pip install msgpack"
+            )
+            self.binary = False
+
         # Create logs directory if it doesn't exist
         self.logs_dir = Path("logs")
         self.logs_dir.mkdir(exist_ok=True)
 
         # Initialize loggers
         self.loggers = {}
+        self._queue: Optional[queue.Queue] = None
+        self._listener: Optional[QueueListener] = None
+        self._file_handlers: Dict[str, logging.Handler] = {}
         if self.enabled:
             self._setup_loggers()
+        self._emitters = self._build_emitters()
+
+        # Per-day application counters backing get_statistics
+        self._daily_stats: Dict[str, Dict[str, Any]] = defaultdict(_new_stats_bucket)
+        self._stats_lock = threading.Lock()
+        self._stats_timer: Optional[threading.Timer] = None
+        # Timestamp of the newest application counted, saved with the snapshot
+        self._last_counted: Optional[datetime] = None
+        self._stats_path = self.audit_config.get("logs", {}).get(
+            "stats", str(self.logs_dir / "stats.json")
+        )
+        if self.enabled:
+            self._load_stats()
 
     def _load_config(self, config_path: str) -> Dict:
         """Load configuration from YAML file."""
         try:
-            with open(config_path, "r") as f:
-                return yaml.safe_load(f)
+            return _load_config_cached(config_path, os.path.getmtime(config_path))
         except Exception as e:
             print(f"Warning: Could not load config from {config_path}: {e}")
             return {}
 
+    def _log_path(self, category: str) -> str:
+        """Log file for a category; binary logs use the .mpk extension."""
+        log_file = self.audit_config.get("logs", {}).get(
+            category, f"logs/{category}.log"
+        )
+        if self.binary:
+            return str(Path(log_file).with_suffix(".mpk"))
+        return log_file
+
     def _setup_loggers(self):
         """Set up separate loggers for each log category."""
-        log_files = self.audit_config.get("logs", {})
         log_level = getattr(logging, self.audit_config.get("log_level", "INFO"))
         log_format = self.audit_config.get(
             "format", "%(asctime)s | %(name)s | %(levelname)s | %(message)s"
@@ -86,8 +345,15 @@ class AuditLogger:
             "rate_limits",
         ]
 
+        # Callers only enqueue records; a single listener thread owns the
+        # file handlers so disk I/O stays off the agent's critical path.
+        # The queue is unbounded so bursts never drop audit records.
+        self._queue = queue.Queue()
+        queue_handler = QueueHandler(self._queue)
+        self._file_handlers = {}
+
         for category in categories:
-            log_file = log_files.get(category, f"logs/{category}.log")
+            log_file = self._log_path(category)
             logger = logging.getLogger(f"audit.{category}")
             logger.setLevel(log_level)
             logger.propagate = False
@@ -95,46 +361,213 @@ class AuditLogger:
             # Remove existing handlers
             logger.handlers.clear()
 
-            # Add rotating file handler
-            handler = RotatingFileHandler(
-                log_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
-            )
+            # Buffered rotating file handler, driven by the listener thread
+            if self.binary:
+                handler = BufferedRotatingFileHandler(
+                    log_file, maxBytes=max_bytes, backupCount=backup_count, mode="ab"
+                )
+            else:
+                handler = BufferedRotatingFileHandler(
+                    log_file,
+                    maxBytes=max_bytes,
+                    backupCount=backup_count,
+                    encoding="utf-8",
+                )
 
             formatter = logging.Formatter(log_format, datefmt=date_format)
             handler.setFormatter(formatter)
-            logger.addHandler(handler)
+            self._file_handlers[logger.name] = handler
 
+            logger.addHandler(queue_handler)
             self.loggers[category] = logger
 
-    def _should_log(self, event_type: str) -> bool:
-        """Check if this event type should be logged."""
-        if not self.enabled:
-            return False
+        self._listener = QueueListener(
+            self._queue, _CategoryDispatchHandler(self._file_handlers)
+        )
+        self._listener.start()
+        atexit.register(self.close)
+
+    def flush(self):
+        """Block until every queued audit record has been written to disk."""
+        if self._queue is not None and self._listener is not None:
+            self._queue.join()
+        for handler in self._file_handlers.values():
+            handler.flush()
+
+    def close(self):
+        """Drain pending records, stop the writer thread and close log files."""
+        if self._listener is None:
+            return
+
+        self._listener.stop()
+        for handler in self._file_handlers.values():
+            handler.close()
+        self._listener = None
+
+        if self._stats_timer is not None:
+            self._stats_timer.cancel()
+            self._persist_stats()
+
+    def _load_stats(self):
+        """
+        Restore application counters from the snapshot and the log.
+
+        The snapshot is written at most every STATS_PERSIST_INTERVAL seconds,
+        so applications logged after it (e.g. before a crash) are replayed
+        from the log. Without a usable snapshot the counters are rebuilt from
+        the whole log.
+        """
+        since = None
+        try:
+            with open(self._stats_path, "rb") as f:
+                snapshot = orjson.loads(f.read())
+            if "days" in snapshot:
+                self._daily_stats.update(snapshot["days"])
+                last_counted = snapshot.get("last_counted")
+                since = datetime.fromisoformat(last_counted) if last_counted else None
+            else:
+                # Older snapshots hold only the days; their write time is
+                # the best bound on what they counted
+                self._daily_stats.update(snapshot)
+                since = datetime.fromtimestamp(os.path.getmtime(self._stats_path))
+            self._last_counted = since
+        except FileNotFoundError:
+            pass
+        except ValueError as e:
+            print(f"Warning: Could not load audit stats from {self._stats_path}: {e}")
+            self._daily_stats.clear()
+
+        # The history scan stops at the first record older than since
+        for app in self.get_application_history(start_date=since):
+            timestamp = datetime.fromisoformat(app["timestamp"])
+            if since is None or timestamp > since:
+                self._count_application(app, timestamp)
+
+    def _count_application(self, data: Dict, timestamp: datetime):
+        """Add one application event to the counters for its day."""
+        with self._stats_lock:
+            if self._last_counted is None or timestamp > self._last_counted:
+                self._last_counted = timestamp
+            bucket = self._daily_stats[timestamp.date().isoformat()]
+            bucket["total_applications"] += 1
+            if data.get("success"):
+                bucket["successful_applications"] += 1
+            if data.get("auto_applied"):
+                bucket["auto_applied"] += 1
+            bucket["score_sum"] += data.get("match_score", 0)
+            by_platform = bucket["by_platform"]
+            platform = data.get("platform", "unknown")
+            by_platform[platform] = by_platform.get(platform, 0) + 1
+
+            # Snapshot off the caller's thread, at most once per interval
+            if self._stats_timer is None:
+                self._stats_timer = threading.Timer(
+                    STATS_PERSIST_INTERVAL, self._persist_stats
+                )
+                self._stats_timer.daemon = True
+                self._stats_timer.start()
+
+    def _persist_stats(self):
+        """Atomically write the application counters to the stats snapshot."""
+        cutoff = (datetime.now() - timedelta(days=STATS_RETENTION_DAYS)).date()
+        with self._stats_lock:
+            self._stats_timer = None
+            for day in [d for d in self._daily_stats if d < cutoff.isoformat()]:
+                del self._daily_stats[day]
+            snapshot = orjson.dumps(
+                {"last_counted": self._last_counted, "days": dict(self._daily_stats)}
+            )
+
+        tmp_path = f"{self._stats_path}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(snapshot)
+            os.replace(tmp_path, self._stats_path)
+        except OSError as e:
+            print(f"Warning: Could not save audit stats to {self._stats_path}: {e}")
+
+    def _write(self, category: str, data: Dict, level: int = logging.INFO):
+        """Hand an audit event to the writer thread for its category's log."""
+        logger = self.loggers[category]
+        if not self.binary:
+            logger.log(level, _dumps(data))
+            return
+
+        # Binary records skip the formatter: the packed bytes ride on the
+        # record straight to the file handler.
+        if logger.isEnabledFor(level):
+            record = logger.makeRecord(logger.name, level, "", 0, "", None, None)
+            record.payload = msgpack.packb(
+                data, use_bin_type=True, default=_msgpack_default
+            )
+            self._queue.put_nowait(record)
+
+    def _read_records_reversed(
+        self, log_file: str, needles: Sequence[Tuple[bytes, ...]] = ()
+    ) -> Iterator[Dict]:
+        """
+        Yield the events in a log file, newest first.
+
+        Args:
+            log_file: Path to the category log
+            needles: Groups of byte strings; a JSON line must contain one
+                string from every group to be parsed at all. A cheap
+                pre-filter, callers still check the fields
+        """
+        if self.binary:
+            with open(log_file, "rb") as f:
+                records = []
+                try:
+                    for data in msgpack.Unpacker(f, raw=False):
+                        records.append(data)
+                except ValueError:
+                    # Stop at a corrupt record, keeping what was read
+                    pass
+            yield from reversed(records)
+            return
+
+        for line in _read_lines_reversed(log_file):
+            if not all(any(needle in line for needle in group) for group in needles):
+                continue
+
+            # The event JSON is the last field of the formatted line
+            json_start = line.find(b"{")
+            if json_start < 0:
+                continue
+            try:
+                yield orjson.loads(line[json_start:])
+            except ValueError:
+                continue
 
+    def _build_emitters(self) -> Dict[str, Optional[Callable[[Dict], None]]]:
+        """
+        Resolve each event type to its writer once, or None when not logged.
+
+        Event types are logged unless switched off under audit.log_events,
+        so log_* methods need a single lookup to decide and dispatch.
+        """
         log_events = self.audit_config.get("log_events", {})
-        return log_events.get(event_type, True)
+        emitters = {}
+        for event_type, (category, level) in _EVENT_CATEGORIES.items():
+            if self.enabled and log_events.get(event_type, True):
+                emitters[event_type] = functools.partial(
+                    self._write, category, level=level
+                )
+            else:
+                emitters[event_type] = None
+        return emitters
 
     def _sanitize_data(self, data: Dict) -> Dict:
         """Remove sensitive data from logs if configured."""
         if self.audit_config.get("include_sensitive", False):
             return data
 
-        # List of sensitive keys to redact
-        sensitive_keys = [
-            "password",
-            "api_key",
-            "token",
-            "secret",
-            "salary",
-            "ssn",
-            "email",
-            "phone",
-        ]
-
         sanitized = {}
         for key, value in data.items():
-            if any(sens in key.lower() for sens in sensitive_keys):
-                sanitized[key] = "***REDACTED***"
+            if _SENSITIVE_KEY_RE.search(key):
+                sanitized[key] = _REDACTED
+            elif isinstance(value, _PRIMITIVES):
+                sanitized[key] = value
             elif isinstance(value, dict):
                 sanitized[key] = self._sanitize_data(value)
             elif isinstance(value, list):
@@ -156,12 +589,13 @@ class AuditLogger:
         source: str = "jsearch",
     ):
         """Log a job search operation."""
-        if not self._should_log("job_searches"):
+        emit = self._emitters["job_searches"]
+        if emit is None:
             return
 
         data = {
             "event": "job_search",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(),
             "user_id": user_id,
             "keywords": keywords,
             "filters": filters,
@@ -169,7 +603,7 @@ class AuditLogger:
             "source": source,
         }
 
-        self.loggers["autonomous"].info(json.dumps(data))
+        emit(data)
 
     def log_extraction(
         self,
@@ -180,12 +614,13 @@ class AuditLogger:
         error: Optional[str] = None,
     ):
         """Log a job information extraction."""
-        if not self._should_log("extractions"):
+        emit = self._emitters["extractions"]
+        if emit is None:
             return
 
         data = {
             "event": "extraction",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(),
             "job_id": job_id,
             "job_url": job_url,
             "extraction_time_seconds": round(extraction_time_seconds, 2),
@@ -193,7 +628,7 @@ class AuditLogger:
             "error": error,
         }
 
-        self.loggers["autonomous"].info(json.dumps(data))
+        emit(data)
 
     def log_scoring(
         self,
@@ -205,12 +640,13 @@ class AuditLogger:
         key_factors: List[str],
     ):
         """Log a job scoring operation."""
-        if not self._should_log("scoring"):
+        emit = self._emitters["scoring"]
+        if emit is None:
             return
 
         data = {
             "event": "scoring",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(),
             "user_id": user_id,
             "job_id": job_id,
             "job_title": job_title,
@@ -219,7 +655,7 @@ class AuditLogger:
             "key_factors": key_factors,
         }
 
-        self.loggers["autonomous"].info(json.dumps(data))
+        emit(data)
 
     def log_document_generation(
         self,
@@ -232,12 +668,13 @@ class AuditLogger:
         error: Optional[str] = None,
     ):
         """Log a document generation event."""
-        if not self._should_log("documents"):
+        emit = self._emitters["documents"]
+        if emit is None:
             return
 
         data = {
             "event": "document_generation",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(),
             "user_id": user_id,
             "job_id": job_id,
             "document_type": document_type,
@@ -247,7 +684,7 @@ class AuditLogger:
             "error": error,
         }
 
-        self.loggers["documents"].info(json.dumps(data))
+        emit(data)
 
     def log_application_submission(
         self,
@@ -263,12 +700,13 @@ class AuditLogger:
         metadata: Optional[Dict] = None,
     ):
         """Log an application submission event."""
-        if not self._should_log("applications"):
+        emit = self._emitters["applications"]
+        if emit is None:
             return
 
         data = {
             "event": "application_submission",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(),
             "user_id": user_id,
             "job_id": job_id,
             "job_title": job_title,
@@ -281,7 +719,8 @@ class AuditLogger:
             "metadata": self._sanitize_data(metadata or {}),
         }
 
-        self.loggers["applications"].info(json.dumps(data))
+        emit(data)
+        self._count_application(data, data["timestamp"])
 
     def log_decision(
         self,
@@ -293,12 +732,13 @@ class AuditLogger:
         metadata: Optional[Dict] = None,
     ):
         """Log an autonomous decision."""
-        if not self._should_log("decisions"):
+        emit = self._emitters["decisions"]
+        if emit is None:
             return
 
         data = {
             "event": "autonomous_decision",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(),
             "user_id": user_id,
             "job_id": job_id,
             "decision_type": decision_type,
@@ -307,7 +747,7 @@ class AuditLogger:
             "metadata": metadata or {},
         }
 
-        self.loggers["decisions"].info(json.dumps(data))
+        emit(data)
 
     def log_rate_limit(
         self,
@@ -319,12 +759,13 @@ class AuditLogger:
         operation: str,  # "extraction", "scoring", etc.
     ):
         """Log a rate limit event."""
-        if not self._should_log("rate_limits"):
+        emit = self._emitters["rate_limits"]
+        if emit is None:
             return
 
         data = {
             "event": "rate_limit_hit",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(),
             "provider": provider,
             "limit_type": limit_type,
             "current_usage": current_usage,
@@ -333,7 +774,7 @@ class AuditLogger:
             "operation": operation,
         }
 
-        self.loggers["rate_limits"].info(json.dumps(data))
+        emit(data)
 
     def log_error(
         self,
@@ -346,12 +787,13 @@ class AuditLogger:
         metadata: Optional[Dict] = None,
     ):
         """Log an error event."""
-        if not self._should_log("errors"):
+        emit = self._emitters["errors"]
+        if emit is None:
             return
 
         data = {
             "event": "error",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(),
             "error_type": error_type,
             "error_message": error_message,
             "operation": operation,
@@ -361,7 +803,7 @@ class AuditLogger:
             "metadata": metadata or {},
         }
 
-        self.loggers["errors"].error(json.dumps(data))
+        emit(data)
 
     def log_cycle_summary(
         self,
@@ -375,9 +817,13 @@ class AuditLogger:
         errors_count: int,
     ):
         """Log a summary of an autonomous cycle."""
+        emit = self._emitters["cycle_summary"]
+        if emit is None:
+            return
+
         data = {
             "event": "cycle_summary",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(),
             "cycle_number": cycle_number,
             "duration_seconds": round(duration_seconds, 2),
             "jobs_found": jobs_found,
@@ -388,7 +834,7 @@ class AuditLogger:
             "errors_count": errors_count,
         }
 
-        self.loggers["autonomous"].info(json.dumps(data))
+        emit(data)
 
     def get_application_history(
         self,
@@ -409,41 +855,46 @@ class AuditLogger:
         Returns:
             List of application events
         """
+        # Make sure records logged so far have reached the file
+        self.flush()
+
         applications = []
-        log_file = self.audit_config.get("logs", {}).get(
-            "applications", "logs/applications.log"
-        )
+        log_file = self._log_path("applications")
 
+        # Lines without the serialized field can be skipped unparsed
+        needles = []
+        if user_id:
+            needles.append(_field_needles("user_id", user_id))
+        if platform:
+            needles.append(_field_needles("platform", platform))
+
+        # Records are appended in time order, so read newest first and stop
+        # as soon as we pass the start of the requested window.
         try:
-            with open(log_file, "r") as f:
-                for line in f:
-                    try:
-                        # Parse the log line to extract JSON
-                        if " | " in line:
-                            json_part = line.split(" | ")[-1].strip()
-                            data = json.loads(json_part)
-
-                            # Apply filters
-                            if user_id and data.get("user_id") != user_id:
-                                continue
-
-                            if platform and data.get("platform") != platform:
-                                continue
-
-                            timestamp = datetime.fromisoformat(
-                                data.get("timestamp", "")
-                            )
-                            if start_date and timestamp < start_date:
-                                continue
-                            if end_date and timestamp > end_date:
-                                continue
-
-                            applications.append(data)
-                    except (json.JSONDecodeError, ValueError):
-                        continue
+            for data in self._read_records_reversed(log_file, needles):
+                try:
+                    timestamp = datetime.fromisoformat(data.get("timestamp", ""))
+                except ValueError:
+                    continue
+
+                if start_date and timestamp < start_date:
+                    break
+                if end_date and timestamp > end_date:
+                    continue
+
+                # Apply filters
+                if user_id and data.get("user_id") != user_id:
+                    continue
+
+                if platform and data.get("platform") != platform:
+                    continue
+
+                applications.append(data)
         except FileNotFoundError:
             pass
 
+        # Return in chronological order
+        applications.reverse()
         return applications
 
     def get_statistics(self, days: int = 7) -> Dict[str, Any]:
@@ -456,37 +907,38 @@ class AuditLogger:
         Returns:
             Dictionary with statistics
         """
-        from datetime import timedelta
+        first_day = (datetime.now() - timedelta(days=days)).date().isoformat()
+        with self._stats_lock:
+            buckets = [
+                bucket for day, bucket in self._daily_stats.items() if day >= first_day
+            ]
 
-        start_date = datetime.now() - timedelta(days=days)
-        applications = self.get_application_history(start_date=start_date)
+        total = sum(bucket["total_applications"] for bucket in buckets)
+        successful = sum(bucket["successful_applications"] for bucket in buckets)
+        auto_applied = sum(bucket["auto_applied"] for bucket in buckets)
 
         stats = {
             "period_days": days,
-            "total_applications": len(applications),
-            "successful_applications": sum(
-                1 for app in applications if app.get("success")
-            ),
-            "failed_applications": sum(
-                1 for app in applications if not app.get("success")
-            ),
-            "auto_applied": sum(1 for app in applications if app.get("auto_applied")),
-            "manual_applied": sum(
-                1 for app in applications if not app.get("auto_applied")
-            ),
+            "total_applications": total,
+            "successful_applications": successful,
+            "failed_applications": total - successful,
+            "auto_applied": auto_applied,
+            "manual_applied": total - auto_applied,
             "by_platform": {},
             "average_match_score": 0,
         }
 
         # Calculate platform breakdown
-        for app in applications:
-            platform = app.get("platform", "unknown")
-            stats["by_platform"][platform] = stats["by_platform"].get(platform, 0) + 1
+        for bucket in buckets:
+            for platform, count in bucket["by_platform"].items():
+                stats["by_platform"][platform] = (
+                    stats["by_platform"].get(platform, 0) + count
+                )
 
         # Calculate average match score
-        if applications:
-            total_score = sum(app.get("match_score", 0) for app in applications)
-            stats["average_match_score"] = round(total_score / len(applications), 2)
+        if total:
+            total_score = sum(bucket["score_sum"] for bucket in buckets)
+            stats["average_match_score"] = round(total_score / total, 2)
 
         return stats
 
@@ -3,25 +3,34 @@ Embedding generation utilities using SentenceTransformers.
 """
 
 import logging
-from typing import List, Union
+from collections import OrderedDict
+from typing import List, Tuple, Union
+import numpy as np
 from sentence_transformers import SentenceTransformer
 import torch
 
 logger = logging.getLogger(__name__)
 
+# Number of text embeddings kept in the per-generator LRU cache
+EMBEDDING_CACHE_SIZE = 4096
+
 
 class EmbeddingGenerator:
     """Generates embeddings using SentenceTransformers."""
     
-    def __init__(self, model_name: str = "sentence-transformers/all-MiniLM-L6-v2", device: str = "cpu"):
+    def __init__(self, model_name: str = "sentence-transformers/all-MiniLM-L6-v2", device: str = "cpu", quantize: bool = False):
         """Initialize embedding generator.
         
         Args:
             model_name: Name of the SentenceTransformer model
-            device: Device to run on ("cpu" or "cuda")
+            device: Device to run on ("cpu", "cuda", or "auto" to use CUDA when available)
+            quantize: Apply dynamic int8 quantization to Linear layers when running on CPU.
+                Off by default: it shifts every similarity score, so match thresholds
+                tuned on the fp32 model no longer hold
         """
         self.model_name = model_name
-        self.device = device if torch.cuda.is_available() and device == "cuda" else "cpu"
+        self.device = "cuda" if device in ("cuda", "auto") and torch.cuda.is_available() else "cpu"
+        self._cache: "OrderedDict[Tuple[str, bool], np.ndarray]" = OrderedDict()
         
         try:
             self.model = SentenceTransformer(model_name, device=self.device)
@@ -29,8 +38,21 @@ class EmbeddingGenerator:
         except Exception as e:
             logger.error(f"Failed to load embedding model: {e}")
             raise
+        
+        if quantize and self.device == "cpu":
+            self._quantize()
     
-    def encode(self, texts: Union[str, List[str]], normalize: bool = True) -> Union[List[float], List[List[float]]]:
+    def _quantize(self):
+        """Swap the model's Linear layers for dynamically quantized int8 versions."""
+        try:
+            torch.ao.quantization.quantize_dynamic(
+                self.model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+            )
+            logger.info(f"Quantized embedding model {self.model_name} to int8")
+        except Exception as e:
+            logger.warning(f"int8 quantization unavailable, using fp32 weights: {e}")
+    
+    def encode(self, texts: Union[str, List[str]], normalize: bool = True) -> np.ndarray:
         """Generate embeddings for text(s).
         
         Args:
@@ -38,24 +60,93 @@ class EmbeddingGenerator:
             normalize: Whether to normalize embeddings to unit length
             
         Returns:
-            Single embedding vector or list of embedding vectors
+            float32 vector of shape (dim,) for a single text, otherwise an
+            array of shape (len(texts), dim)
         """
         if isinstance(texts, str):
             texts = [texts]
         
+        embeddings = self._encode_batch(texts, normalize=normalize)
+        
+        if len(texts) == 1:
+            return embeddings[0]
+        return embeddings
+    
+    def _encode_batch(self, texts: List[str], normalize: bool = True, batch_size: int = 64) -> np.ndarray:
+        """Embed texts, reusing cached vectors and encoding all misses in one model call.
+        
+        Args:
+            texts: Texts to embed
+            normalize: Whether to normalize embeddings to unit length
+            batch_size: Batch size passed to the model for the cache misses
+            
+        Returns:
+            Array of shape (len(texts), dim)
+        """
+        cache = self._cache
+        keys = [(text, normalize) for text in texts]
+        # Hold references to every vector this call needs before anything is
+        # evicted, so a large batch of misses cannot drop a key read below
+        found = {}
+        for key in keys:
+            if key in cache and key not in found:
+                cache.move_to_end(key)
+                found[key] = cache[key]
+        misses = list(dict.fromkeys(key for key in keys if key not in found))
+        
+        if misses:
+            try:
+                encoded = self.model.encode(
+                    [text for text, _ in misses],
+                    batch_size=batch_size,
+                    convert_to_numpy=True,
+                    normalize_embeddings=normalize
+                )
+            except Exception as e:
+                logger.error(f"Error generating embeddings: {e}")
+                raise
+            
+            for key, embedding in zip(misses, encoded):
+                embedding.setflags(write=False)
+                found[key] = embedding
+                cache[key] = embedding
+        
+        rows = np.stack([found[key] for key in keys])
+        while len(cache) > EMBEDDING_CACHE_SIZE:
+            cache.popitem(last=False)
+        return rows
+    
+    def encode_batched(self, texts: List[str], batch_size: int = 256, return_tensor: bool = False) -> Union[np.ndarray, torch.Tensor]:
+        """Encode a large list of texts in big batches on the model's device.
+        
+        Meant for bulk scoring on GPU, where one call with large batches keeps
+        the device busy; results bypass the per-text cache.
+        
+        Args:
+            texts: Texts to embed
+            batch_size: Number of texts per forward pass
+            return_tensor: Keep the normalized embeddings as a tensor on the
+                model's device instead of copying them back to numpy
+            
+        Returns:
+            Tensor or float32 array of shape (len(texts), dim)
+        """
         try:
             embeddings = self.model.encode(
                 texts,
-                convert_to_numpy=True,
-                normalize_embeddings=normalize
+                batch_size=batch_size,
+                convert_to_tensor=True,
+                device=self.device,
+                normalize_embeddings=True,
+                show_progress_bar=False
             )
-            
-            if len(texts) == 1:
-                return embeddings[0].tolist()
-            return embeddings.tolist()
         except Exception as e:
             logger.error(f"Error generating embeddings: {e}")
             raise
+        
+        if return_tensor:
+            return embeddings
+        return embeddings.cpu().numpy()
     
     def similarity(self, text1: str, text2: str) -> float:
         """Compute cosine similarity between two texts.
@@ -67,11 +158,9 @@ class EmbeddingGenerator:
         Returns:
             Cosine similarity score (0.0 to 1.0)
         """
-        emb1 = self.encode(text1)
-        emb2 = self.encode(text2)
+        emb1, emb2 = self._encode_batch([text1, text2])
         
         # Compute cosine similarity
-        import numpy as np
         dot_product = np.dot(emb1, emb2)
         return float(dot_product)  # Already normalized, so dot product = cosine similarity
     
@@ -86,14 +175,26 @@ class EmbeddingGenerator:
         Returns:
             List of (text, similarity_score) tuples, sorted by similarity
         """
-        query_emb = self.encode(query)
-        candidate_embs = self.encode(candidates)
+        query_emb = self._encode_batch([query])[0]
+        
+        if self.device == "cuda":
+            # Score and select on the GPU; only top_k values come back
+            candidate_embs = self.encode_batched(candidates, return_tensor=True)
+            query_tensor = torch.from_numpy(query_emb).to(candidate_embs.device, candidate_embs.dtype)
+            scores, indices = torch.topk(candidate_embs @ query_tensor, min(top_k, len(candidates)))
+            return [(candidates[i], score) for i, score in zip(indices.tolist(), scores.tolist())]
+        
+        candidate_embs = self._encode_batch(candidates)
         
-        import numpy as np
-        similarities = np.dot(candidate_embs, query_emb)
+        candidate_embs = np.ascontiguousarray(candidate_embs, dtype=np.float32)
+        similarities = candidate_embs @ query_emb.astype(np.float32, copy=False)
         
-        # Get top-k indices
-        top_indices = np.argsort(similarities)[::-1][:top_k]
+        # Get top-k indices: partition in O(N), then sort only the winners
+        if top_k >= similarities.size:
+            top_indices = np.argsort(-similarities, kind="stable")
+        else:
+            top_indices = np.argpartition(-similarities, top_k)[:top_k]
+            top_indices = top_indices[np.argsort(-similarities[top_indices], kind="stable")]
         
         return [(candidates[i], float(similarities[i])) for i in top_indices]
 
@@ -2,8 +2,17 @@
 LangGraph workflow for orchestrating job application agents.
 """
 
+import asyncio
+import functools
 import logging
-from typing import Dict, List, Optional, Any, TypedDict
+import re
+import threading
+from collections import Counter
+from typing import Annotated, Any, AsyncIterator, Dict, List, Optional, TypedDict
+
+import numpy as np
+from langchain_core.runnables import RunnableConfig
+from langgraph.config import get_stream_writer
 from langgraph.graph import StateGraph, END
 
 from agents.scout_agent import ScoutAgent
@@ -20,6 +29,15 @@ from core.user_profile import UserProfile
 logger = logging.getLogger(__name__)
 
 
+def _merge_errors(current: Optional[str], update: Optional[str]) -> Optional[str]:
+    """Combine errors reported by parallel branches instead of dropping one."""
+    if not update or update == current:
+        return current
+    if not current:
+        return update
+    return f"{current}; {update}"
+
+
 class JobApplicationState(TypedDict):
     """State schema for the job application workflow."""
     user_id: str
@@ -28,17 +46,120 @@ class JobApplicationState(TypedDict):
     location: Optional[str]
     employment_type: Optional[str]
     jobs: List[Dict[str, Any]]
+    # IDs of jobs, set once by the scout node
+    job_ids: List[str]
     extracted_data: Dict[str, Dict[str, Any]]
     matches: List[Dict[str, Any]]
+    match_score_by_id: Dict[str, float]
     selected_job_id: Optional[str]
     documents: Dict[str, str]
     application_id: Optional[str]
     application_status: Optional[str]
-    error: Optional[str]
+    # Set by astream() so the writer streams the cover letter as it is generated
+    stream_documents: bool
+    # Extractor and matcher run in parallel and may both report an error
+    error: Annotated[Optional[str], _merge_errors]
+
+
+_TOKEN_RE = re.compile(r"[a-z0-9+#]+")
+
+
+def _collect_job_ids(state: JobApplicationState) -> List[str]:
+    """Return the job IDs for the state's jobs, reusing the scout's list when present."""
+    job_ids = state.get("job_ids")
+    if job_ids is None:
+        job_ids = [job_id for job in state.get("jobs", []) if (job_id := job.get("job_id"))]
+    return job_ids
+
+
+def _rank_jobs_by_keywords(
+    jobs: List[Dict[str, Any]], keywords: str, top_k: Optional[int]
+) -> List[Dict[str, Any]]:
+    """Keep the top_k jobs whose title and description best match the keywords.
+    
+    Jobs are scored by the TF-IDF weight of the query terms, a cheap filter
+    that runs before any LLM work. A falsy top_k disables the cap.
+    
+    Args:
+        jobs: Jobs returned by the scout
+        keywords: Search keywords
+        top_k: Maximum number of jobs to keep
+        
+    Returns:
+        Highest-scoring jobs, best first; ties keep their original order
+    """
+    if not top_k or len(jobs) <= top_k:
+        return jobs
+    
+    terms = sorted(set(_TOKEN_RE.findall(keywords.lower())))
+    if not terms:
+        return jobs[:top_k]
+    
+    tf = np.zeros((len(jobs), len(terms)), dtype=np.float32)
+    for row, job in enumerate(jobs):
+        tokens = _TOKEN_RE.findall(
+            f"{job.get('title', '')} {job.get('description', '')}".lower()
+        )
+        if not tokens:
+            continue
+        counts = Counter(tokens)
+        tf[row] = [counts[term] for term in terms]
+        tf[row] /= len(tokens)
+    
+    df = np.count_nonzero(tf, axis=0)
+    idf = np.log((1 + len(jobs)) / (1 + df)) + 1
+    order = np.argsort(-(tf @ idf), kind="stable")[:top_k]
+    return [jobs[i] for i in order]
+
+
+def _bind_node(method_name: str):
+    """Wrap a JobApplicationGraph method as a node of the shared compiled graph.
+    
+    The compiled graph is cached per class, so nodes look up the workflow
+    instance from the run config rather than closing over one. Agents block
+    on Neo4j and LLM I/O, so each node runs in a worker thread and the event
+    loop can overlap the parallel branches.
+    """
+    async def node(state: JobApplicationState, config: RunnableConfig):
+        method = getattr(config["configurable"]["workflow"], method_name)
+        return await asyncio.to_thread(method, state)
+    
+    node.__name__ = method_name
+    return node
+
+
+class _LazyComponent:
+    """Build a workflow component on first access and keep it on the instance.
+    
+    Like functools.cached_property, but construction is serialized so the
+    parallel graph branches never build the same component twice.
+    """
+    
+    def __init__(self, factory):
+        self.factory = factory
+        self.name = factory.__name__
+        self.__doc__ = factory.__doc__
+    
+    def __set_name__(self, owner, name):
+        self.name = name
+    
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        # Once stored, the instance attribute shadows this descriptor
+        with instance._component_lock:
+            if self.name not in instance.__dict__:
+                instance.__dict__[self.name] = self.factory(instance)
+            return instance.__dict__[self.name]
 
 
 class JobApplicationGraph:
-    """LangGraph workflow for job application automation."""
+    """LangGraph workflow for job application automation.
+    
+    Neo4j, the LLM client, the embedding model and the agents are created on
+    first use, so entry points such as search_jobs() only pay for what they
+    touch.
+    """
     
     def __init__(self, config: Optional[Config] = None):
         """Initialize the job application workflow.
@@ -50,60 +171,116 @@ class JobApplicationGraph:
             config = Config()
         
         self.config = config
+        self._component_lock = threading.RLock()
         
-        # Initialize components
-        neo4j_config = config.get_neo4j_config()
-        self.graph_memory = GraphMemory(
+        # Reuse the compiled topology; this instance is supplied to its nodes
+        # through the run config
+        parallel_branches = bool(self.config.get("workflow.parallel_branches", True))
+        self.graph = JobApplicationGraph._build_compiled_graph(parallel_branches).with_config(
+            configurable={"workflow": self}
+        )
+    
+    @_LazyComponent
+    def graph_memory(self) -> GraphMemory:
+        """Neo4j graph memory."""
+        neo4j_config = self.config.get_neo4j_config()
+        return GraphMemory(
             uri=neo4j_config["uri"],
             user=neo4j_config["user"],
             password=neo4j_config["password"],
-            database=neo4j_config["database"]
+            database=neo4j_config["database"],
+            max_connection_pool_size=neo4j_config.get("max_connection_pool_size", 32),
+            connection_acquisition_timeout=neo4j_config.get("connection_acquisition_timeout", 30.0)
         )
-        
-        llm_config = config.get_llm_config()
-        self.llm_client = create_llm_client(llm_config)
-        
-        embeddings_config = config.get("embeddings", {})
-        self.embedding_generator = EmbeddingGenerator(
+    
+    @_LazyComponent
+    def llm_client(self):
+        """LLM client for the configured provider."""
+        return create_llm_client(self.config.get_llm_config())
+    
+    @_LazyComponent
+    def embedding_generator(self) -> EmbeddingGenerator:
+        """Sentence-transformer embedding generator."""
+        embeddings_config = self.config.get("embeddings", {})
+        return EmbeddingGenerator(
             model_name=embeddings_config.get("model", "sentence-transformers/all-MiniLM-L6-v2"),
-            device=embeddings_config.get("device", "cpu")
+            device=embeddings_config.get("device", "cpu"),
+            quantize=embeddings_config.get("quantize", False)
         )
-        
-        # Initialize agents
-        self.scout_agent = ScoutAgent(self.graph_memory, config)
-        self.extractor_agent = ExtractorAgent(self.graph_memory, self.llm_client)
-        self.matcher_agent = MatcherAgent(self.graph_memory, self.llm_client, self.embedding_generator)
-        self.writer_agent = WriterAgent(self.graph_memory, self.llm_client)
-        self.tracker_agent = TrackerAgent(self.graph_memory)
-        self.user_profile = UserProfile(self.graph_memory)
-        
-        # Build graph
-        self.graph = self._build_graph()
     
-    def _build_graph(self) -> StateGraph:
-        """Build the LangGraph state machine.
+    @_LazyComponent
+    def scout_agent(self) -> ScoutAgent:
+        """Scout agent."""
+        return ScoutAgent(self.graph_memory, self.config)
+    
+    @_LazyComponent
+    def extractor_agent(self) -> ExtractorAgent:
+        """Extractor agent."""
+        return ExtractorAgent(self.graph_memory, self.llm_client)
+    
+    @_LazyComponent
+    def matcher_agent(self) -> MatcherAgent:
+        """Matcher agent."""
+        return MatcherAgent(self.graph_memory, self.config, self.user_profile)
+    
+    @_LazyComponent
+    def writer_agent(self) -> WriterAgent:
+        """Writer agent."""
+        return WriterAgent(self.graph_memory, self.llm_client)
+    
+    @_LazyComponent
+    def tracker_agent(self) -> TrackerAgent:
+        """Tracker agent."""
+        return TrackerAgent(self.graph_memory)
+    
+    @_LazyComponent
+    def user_profile(self) -> UserProfile:
+        """User profile manager."""
+        return UserProfile(self.graph_memory)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _build_compiled_graph(parallel_branches: bool):
+        """Build and compile the LangGraph state machine.
         
+        The topology depends only on the given flags, so the compiled graph
+        is cached and shared by every JobApplicationGraph instance.
+        
+        Args:
+            parallel_branches: Run extractor and matcher side by side
+            
         Returns:
             Compiled StateGraph
         """
         workflow = StateGraph(JobApplicationState)
         
         # Add nodes
-        workflow.add_node("scout", self._scout_node)
-        workflow.add_node("extractor", self._extractor_node)
-        workflow.add_node("matcher", self._matcher_node)
-        workflow.add_node("writer", self._writer_node)
-        workflow.add_node("tracker", self._tracker_node)
+        workflow.add_node("scout", _bind_node("_scout_node"))
+        workflow.add_node("extractor", _bind_node("_extractor_node"))
+        workflow.add_node("matcher", _bind_node("_matcher_node"))
+        workflow.add_node("writer", _bind_node("_writer_node"))
+        workflow.add_node("tracker", _bind_node("_tracker_node"))
         
         # Define edges
         workflow.set_entry_point("scout")
-        workflow.add_edge("scout", "extractor")
-        workflow.add_edge("extractor", "matcher")
         
-        # Conditional edge: matcher -> writer (if job selected) or END
+        if parallel_branches:
+            # Matcher only needs the scouted jobs, so it runs alongside the
+            # extractor; both write disjoint state keys and meet at "join"
+            workflow.add_node("join", lambda state: {})
+            workflow.add_edge("scout", "extractor")
+            workflow.add_edge("scout", "matcher")
+            workflow.add_edge(["extractor", "matcher"], "join")
+            decision_node = "join"
+        else:
+            workflow.add_edge("scout", "extractor")
+            workflow.add_edge("extractor", "matcher")
+            decision_node = "matcher"
+        
+        # Conditional edge: writer (if job selected) or END
         workflow.add_conditional_edges(
-            "matcher",
-            self._should_generate_documents,
+            decision_node,
+            _bind_node("_should_generate_documents"),
             {
                 "generate": "writer",
                 "end": END
@@ -140,9 +317,14 @@ class JobApplicationGraph:
                 employment_type=employment_type,
                 max_results=50
             )
+            logger.info(f"Scout found {len(jobs)} jobs")
             
+            # Only the most relevant jobs go on to LLM extraction and matching
+            jobs = _rank_jobs_by_keywords(
+                jobs, keywords, self.config.get("extractor.top_k", 15)
+            )
             state["jobs"] = jobs
-            logger.info(f"Scout found {len(jobs)} jobs")
+            state["job_ids"] = [job_id for job in jobs if (job_id := job.get("job_id"))]
             
         except Exception as e:
             logger.error(f"Error in scout node: {e}")
@@ -150,76 +332,86 @@ class JobApplicationGraph:
         
         return state
     
-    def _extractor_node(self, state: JobApplicationState) -> JobApplicationState:
+    def _extractor_node(self, state: JobApplicationState) -> Dict[str, Any]:
         """Extractor agent node: Extract structured information from jobs.
         
+        Only the keys this node owns are returned, so it can run in parallel
+        with the matcher node.
+        
         Args:
             state: Current workflow state
             
         Returns:
-            Updated state
+            State update
         """
         try:
             jobs = state.get("jobs", [])
             if not jobs:
-                state["error"] = "No jobs to extract"
-                return state
+                return {"error": "No jobs to extract"}
             
-            extracted_data = {}
+            job_ids = _collect_job_ids(state)
             
-            for job in jobs:
-                job_id = job.get("job_id")
-                if job_id:
-                    extracted = self.extractor_agent.extract_job_info(job_id)
-                    if extracted:
-                        extracted_data[job_id] = extracted
+            # One batched LLM pass for all jobs; concurrency is configurable
+            # to stay within provider rate limits
+            extracted_data = self.extractor_agent.extract_batch(
+                job_ids,
+                max_concurrency=self.config.get("extractor.concurrency", 8)
+            )
             
-            state["extracted_data"] = extracted_data
             logger.info(f"Extracted information from {len(extracted_data)} jobs")
+            return {"extracted_data": extracted_data}
             
         except Exception as e:
             logger.error(f"Error in extractor node: {e}")
-            state["error"] = str(e)
-        
-        return state
+            return {"error": str(e)}
     
-    def _matcher_node(self, state: JobApplicationState) -> JobApplicationState:
+    def _matcher_node(self, state: JobApplicationState) -> Dict[str, Any]:
         """Matcher agent node: Match user to jobs.
         
+        Only the keys this node owns are returned, so it can run in parallel
+        with the extractor node.
+        
         Args:
             state: Current workflow state
             
         Returns:
-            Updated state
+            State update
         """
         try:
             user_id = state.get("user_id")
             if not user_id:
-                state["error"] = "User ID not provided"
-                return state
+                return {"error": "User ID not provided"}
             
-            jobs = state.get("jobs", [])
-            job_ids = [job.get("job_id") for job in jobs if job.get("job_id")]
+            job_ids = _collect_job_ids(state)
             
             if not job_ids:
-                state["error"] = "No jobs to match"
-                return state
-            
-            # Match jobs
-            matches = self.matcher_agent.match_jobs(
-                user_id=user_id,
-                job_ids=job_ids,
-                min_score=0.6
+                return {"error": "No jobs to match"}
+            
+            # Score the jobs (reusing cached scores), then read them back ranked
+            stats = self.matcher_agent.score_all_jobs(user_id, job_ids=job_ids)
+            if "error" in stats:
+                return {"error": stats["error"]}
+            
+            matches = self.matcher_agent.get_ranked_jobs(
+                user_id,
+                limit=len(job_ids),
+                min_score=60,
+                job_ids=job_ids
             )
             
-            state["matches"] = matches
             logger.info(f"Matcher found {len(matches)} matches")
+            return {
+                "matches": matches,
+                "match_score_by_id": {
+                    match["job_id"]: match.get("match_score")
+                    for match in matches
+                    if match.get("job_id")
+                },
+            }
             
         except Exception as e:
             logger.error(f"Error in matcher node: {e}")
-            state["error"] = str(e)
-        
-        return state
+            return {"error": str(e)}
     
     def _writer_node(self, state: JobApplicationState) -> JobApplicationState:
         """Writer agent node: Generate documents.
@@ -238,22 +430,26 @@ class JobApplicationGraph:
                 state["error"] = "User ID or job ID not provided"
                 return state
             
-            documents = {}
-            
-            # Generate cover letter
-            cover_letter = self.writer_agent.generate_cover_letter(user_id, job_id)
-            if cover_letter:
-                documents["cover_letter"] = cover_letter
-            
-            # Generate resume summary
-            resume_summary = self.writer_agent.generate_resume_summary(user_id, job_id)
-            if resume_summary:
-                documents["resume_summary"] = resume_summary
-            
-            # Generate complete resume
-            resume = self.writer_agent.generate_complete_resume(user_id, job_id)
-            if resume:
-                documents["resume"] = resume
+            if state.get("stream_documents"):
+                # Cover letter chunks go out as custom stream events while
+                # they are generated; the summary and resume follow as a
+                # normal update
+                emit = get_stream_writer()
+                chunks = []
+                for chunk in self.writer_agent.stream_cover_letter(user_id, job_id):
+                    chunks.append(chunk)
+                    emit({"documents": {"cover_letter": chunk}})
+                
+                documents = {"cover_letter": "".join(chunks)} if chunks else {}
+                resume_summary = self.writer_agent.generate_resume_summary(user_id, job_id)
+                if resume_summary:
+                    documents["resume_summary"] = resume_summary
+                resume = self.writer_agent.generate_tailored_resume(user_id, job_id)
+                if resume:
+                    documents["resume"] = resume
+            else:
+                # Cover letter, resume summary and resume share one LLM round trip
+                documents = self.writer_agent.generate_all_documents(user_id, job_id)
             
             state["documents"] = documents
             logger.info(f"Generated {len(documents)} documents")
@@ -282,12 +478,7 @@ class JobApplicationGraph:
                 return state
             
             # Get match score if available
-            matches = state.get("matches", [])
-            match_score = None
-            for match in matches:
-                if match.get("job_id") == job_id:
-                    match_score = match.get("match_score")
-                    break
+            match_score = state.get("match_score_by_id", {}).get(job_id)
             
             # Create application
             application_id = self.tracker_agent.create_application(
@@ -333,6 +524,33 @@ class JobApplicationGraph:
     ) -> Dict[str, Any]:
         """Run the complete workflow.
         
+        Synchronous wrapper around arun(); call arun() directly from code
+        that already runs an event loop.
+        
+        Args:
+            user_id: User identifier
+            keywords: Job search keywords
+            location: Optional location filter
+            employment_type: Optional employment type filter
+            selected_job_id: Optional pre-selected job ID (skips search)
+            
+        Returns:
+            Final workflow state
+        """
+        return asyncio.run(
+            self.arun(user_id, keywords, location, employment_type, selected_job_id)
+        )
+    
+    async def arun(
+        self,
+        user_id: str,
+        keywords: str,
+        location: Optional[str] = None,
+        employment_type: Optional[str] = None,
+        selected_job_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Run the complete workflow asynchronously.
+        
         Args:
             user_id: User identifier
             keywords: Job search keywords
@@ -343,29 +561,77 @@ class JobApplicationGraph:
         Returns:
             Final workflow state
         """
-        initial_state: JobApplicationState = {
+        initial_state = self._initial_state(
+            user_id, keywords, location, employment_type, selected_job_id
+        )
+        
+        try:
+            final_state = await self.graph.ainvoke(initial_state)
+            return final_state
+        except Exception as e:
+            logger.error(f"Error running workflow: {e}")
+            initial_state["error"] = str(e)
+            return initial_state
+    
+    async def astream(
+        self,
+        user_id: str,
+        keywords: str,
+        location: Optional[str] = None,
+        employment_type: Optional[str] = None,
+        selected_job_id: Optional[str] = None
+    ) -> AsyncIterator[Any]:
+        """Run the complete workflow, yielding progress as it happens.
+        
+        Args:
+            user_id: User identifier
+            keywords: Job search keywords
+            location: Optional location filter
+            employment_type: Optional employment type filter
+            selected_job_id: Optional pre-selected job ID (skips search)
+            
+        Yields:
+            ("updates", {node: update}) after each node finishes, and
+            ("custom", {"documents": {"cover_letter": chunk}}) for each
+            cover letter chunk; chunks are deltas to be appended in order
+        """
+        initial_state = self._initial_state(
+            user_id, keywords, location, employment_type, selected_job_id
+        )
+        initial_state["stream_documents"] = True
+        
+        async for event in self.graph.astream(
+            initial_state, stream_mode=["updates", "custom"]
+        ):
+            yield event
+    
+    @staticmethod
+    def _initial_state(
+        user_id: str,
+        keywords: str,
+        location: Optional[str],
+        employment_type: Optional[str],
+        selected_job_id: Optional[str]
+    ) -> JobApplicationState:
+        """Build the state a workflow run starts from."""
+        return {
             "user_id": user_id,
             "user_query": keywords,
             "keywords": keywords,
             "location": location,
             "employment_type": employment_type,
             "jobs": [],
+            "job_ids": [],
             "extracted_data": {},
             "matches": [],
+            "match_score_by_id": {},
             "selected_job_id": selected_job_id,
             "documents": {},
             "application_id": None,
             "application_status": None,
+            "stream_documents": False,
             "error": None,
         }
-        
-        try:
-            final_state = self.graph.invoke(initial_state)
-            return final_state
-        except Exception as e:
-            logger.error(f"Error running workflow: {e}")
-            initial_state["error"] = str(e)
-            return initial_state
     
     def search_jobs(
         self,
@@ -403,7 +669,8 @@ class JobApplicationGraph:
         Returns:
             List of matched jobs
         """
-        return self.matcher_agent.match_jobs(user_id, job_ids)
+        self.matcher_agent.score_all_jobs(user_id, job_ids=job_ids)
+        return self.matcher_agent.get_ranked_jobs(user_id, job_ids=job_ids)
     
     def generate_documents(
         self,
@@ -419,19 +686,11 @@ class JobApplicationGraph:
         Returns:
             Dictionary of generated documents
         """
-        documents = {}
-        
-        cover_letter = self.writer_agent.generate_cover_letter(user_id, job_id)
-        if cover_letter:
-            documents["cover_letter"] = cover_letter
-        
-        resume = self.writer_agent.generate_complete_resume(user_id, job_id)
-        if resume:
-            documents.update(resume)
-        
-        return documents
+        return self.writer_agent.generate_all_documents(user_id, job_id)
     
     def close(self):
         """Close database connections."""
-        self.graph_memory.close()
+        # Nothing to close if Neo4j was never used
+        if "graph_memory" in self.__dict__:
+            self.graph_memory.close()
 